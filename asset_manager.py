@@ -0,0 +1,136 @@
+import os
+import pygame
+
+
+# Caches globaux : chaque image n'est décodée qu'une fois par processus
+_images = {}
+_frames = {}
+_frame_sets = {}
+_stats = {"hits": 0, "misses": 0, "frames_built": 0, "frame_lookups": 0}
+
+# Planches utilisées par le jeu : (chemin, largeur frame, hauteur frame, échelle)
+PLAYER_SHEETS = [
+    "player/walk.png", "player/idle.png", "player/attack.png", "player/damage.png",
+    "player/death1.png", "player/death2.png", "player/attack_potion.png",
+]
+ENEMY_ACTIONS = ["Walk", "Attack", "Hurt", "Dead"]
+ZOMBIE_FOLDERS = [f"zombies/Zombie_{i}" for i in range(1, 5)]
+HUMAN_FOLDERS = [f"Humans/Homeless_{i}" for i in range(1, 4)]
+
+
+def load_image(path, size=None, alpha=True):
+    """
+    Renvoie l'image du fichier, décodée une seule fois (et redimensionnée si `size`).
+    La surface est partagée : ne pas la modifier, faire un copy() si besoin.
+    """
+    key = (path, size, alpha)
+    image = _images.get(key)
+    if image is not None:
+        _stats["hits"] += 1
+        return image
+    _stats["misses"] += 1
+    if size:
+        image = pygame.transform.scale(load_image(path, alpha=alpha), size)
+    else:
+        image = pygame.image.load(path)
+        image = image.convert_alpha() if alpha else image.convert()
+    _images[key] = image
+    return image
+
+
+def load_frames(path, frame_width, frame_height, scale=1):
+    """
+    Découpe une planche de sprites en frames, une seule fois par (chemin, taille, échelle).
+    Renvoie un tuple partagé en lecture seule ; tuple vide si le fichier est absent.
+    """
+    key = (path, frame_width, frame_height, scale)
+    frames = _frames.get(key)
+    if frames is not None:
+        _stats["hits"] += 1
+        return frames
+    if not path or not os.path.exists(path):
+        return ()
+    _stats["misses"] += 1
+    sheet = load_image(path)
+    frames = []
+    sheet_width = sheet.get_width()
+    sheet_height = sheet.get_height()
+    for y in range(0, sheet_height, frame_height):
+        for x in range(0, sheet_width, frame_width):
+            frame = sheet.subsurface(pygame.Rect(x, y, frame_width, frame_height))
+            if scale != 1:
+                frame = pygame.transform.scale(frame, (frame_width * scale, frame_height * scale))
+            frames.append(frame)
+    frames = tuple(frames)
+    _frames[key] = frames
+    return frames
+
+
+class FrameSet:
+    """
+    Animation prête à l'emploi : frames orientées à droite et leurs miroirs
+    à gauche, construits une seule fois au chargement. get() ne fait aucune
+    allocation de surface, quel que soit le nombre d'appels par frame.
+    """
+    def __init__(self, frames):
+        # Copies autonomes (et non des subsurfaces) pour que set_alpha reste local à la frame
+        self.right = tuple(frame.copy() for frame in frames)
+        self.left = tuple(pygame.transform.flip(frame, True, False) for frame in self.right)
+        _stats["frames_built"] += len(self.right) + len(self.left)
+
+    def get(self, index, direction="right"):
+        _stats["frame_lookups"] += 1
+        return self.left[index] if direction == "left" else self.right[index]
+
+    def __getitem__(self, index):
+        return self.right[index]
+
+    def __len__(self):
+        return len(self.right)
+
+
+def load_frame_set(path, frame_width, frame_height, scale=1):
+    """Comme load_frames, mais renvoie un FrameSet partagé avec les variantes miroir."""
+    key = (path, frame_width, frame_height, scale)
+    frame_set = _frame_sets.get(key)
+    if frame_set is not None:
+        _stats["hits"] += 1
+        return frame_set
+    frame_set = FrameSet(load_frames(path, frame_width, frame_height, scale))
+    _frame_sets[key] = frame_set
+    return frame_set
+
+
+def preload(progress=None):
+    """
+    Charge à l'avance toutes les planches du jeu (à appeler après set_mode).
+    `progress(fait, total)` est appelé après chaque planche (écran de chargement).
+    """
+    sheets = [(path, 64, 64, 2) for path in PLAYER_SHEETS]
+    for folder in ZOMBIE_FOLDERS + HUMAN_FOLDERS:
+        for action in ENEMY_ACTIONS:
+            sheets.append((os.path.join(folder, f"{action}.png"), 128, 128, 1))
+    sheets.append(("potion/PotionBlue.png", 22, 37, 1))
+    for done, (path, width, height, scale) in enumerate(sheets, 1):
+        load_frame_set(path, width, height, scale=scale)
+        if progress:
+            progress(done, len(sheets))
+    load_image("portail.png", size=(100, 100))
+
+
+def get_stats():
+    """
+    Compteurs du gestionnaire : hits, misses, images et jeux de frames en cache.
+    frames_built ne doit plus augmenter une fois les planches chargées,
+    alors que frame_lookups croît à chaque frame d'animation.
+    """
+    return {**_stats, "images": len(_images), "frame_sets": len(_frames) + len(_frame_sets)}
+
+
+def clear():
+    """Vide les caches (par ex. après un changement de mode vidéo)."""
+    _images.clear()
+    _frames.clear()
+    _frame_sets.clear()
+    for key in _stats:
+        _stats[key] = 0
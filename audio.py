@@ -0,0 +1,188 @@
+"""
+Banque de sons : chaque effet est décodé une seule fois par processus (et,
+si SOUND_CACHE_DIR est défini, son PCM décodé est gardé sur disque pour les
+lancements suivants). Les canaux du mixer sont réservés par catégorie, le
+nombre de voix simultanées d'un même son est limité, et le volume et la
+balance des sons positionnés sont mis à jour en une passe par frame (update).
+"""
+import math
+import os
+
+import pygame
+
+from config import SCREEN_WIDTH, SOUND_CACHE_DIR
+
+# Effets : nom -> (fichier, volume, catégorie, voix simultanées au plus)
+SOUNDS = {
+    "potion_pickup": ("bruitages/sharp-pop-328170.mp3", 0.2, "pickup", 2),
+    "potion_throw": ("bruitages/glass-breaking-386153.mp3", 0.2, "player", 1),
+}
+MUSIC = ("bruitages/medieval-ambient-236809.mp3", 0.5)  # Musique de fond : (fichier, volume)
+# Canaux réservés par catégorie (dans l'ordre, à partir du canal 0)
+CATEGORIES = {"player": 2, "pickup": 3}
+HEARING_DISTANCE = 900  # px : au-delà, un son positionné n'est plus audible
+
+_sounds = {}
+_channels = {}  # catégorie -> [pygame.mixer.Channel]
+_voices = {}  # canal -> [nom du son, position ou None, numéro de lecture]
+_state = {"ready": None, "plays": 0, "listener": None}
+_stats = {"decoded": 0, "cache_hits": 0, "played": 0, "stolen": 0}
+
+
+def init():
+    """Initialise le mixer et réserve les canaux. Renvoie False sans périphérique audio."""
+    if _state["ready"] is not None:
+        return _state["ready"]
+    try:
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+    except pygame.error:
+        _state["ready"] = False
+        return False
+    reserved = sum(CATEGORIES.values())
+    pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), reserved + 2))
+    pygame.mixer.set_reserved(reserved)  # Sound.play() sans canal ne prend pas ces canaux
+    index = 0
+    for category, count in CATEGORIES.items():
+        _channels[category] = [pygame.mixer.Channel(index + i) for i in range(count)]
+        index += count
+    _state["ready"] = True
+    return True
+
+
+def _cache_path(path):
+    frequency, size, channels = pygame.mixer.get_init()
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(SOUND_CACHE_DIR, f"{name}.{frequency}_{size}_{channels}.pcm")
+
+
+def _decode(path):
+    """Son du fichier, depuis le PCM en cache s'il est plus récent que le fichier."""
+    if SOUND_CACHE_DIR:
+        cache_path = _cache_path(path)
+        try:
+            if os.path.getmtime(cache_path) >= os.path.getmtime(path):
+                with open(cache_path, "rb") as f:
+                    sound = pygame.mixer.Sound(buffer=f.read())
+                _stats["cache_hits"] += 1
+                return sound
+        except OSError:
+            pass
+    sound = pygame.mixer.Sound(path)
+    _stats["decoded"] += 1
+    if SOUND_CACHE_DIR:
+        try:
+            os.makedirs(SOUND_CACHE_DIR, exist_ok=True)
+            with open(_cache_path(path), "wb") as f:
+                f.write(sound.get_raw())
+        except OSError:
+            pass  # Le cache n'est qu'une optimisation
+    return sound
+
+
+def get(name):
+    """Son `name` de la banque (décodé au premier appel), ou None sans audio."""
+    sound = _sounds.get(name)
+    if sound is None and init():
+        path, volume = SOUNDS[name][:2]
+        sound = _sounds[name] = _decode(path)
+        sound.set_volume(volume)
+    return sound
+
+
+def preload():
+    """Décode tous les effets à l'avance."""
+    for name in SOUNDS:
+        get(name)
+
+
+def play(name, position=None):
+    """
+    Joue `name` sur un canal de sa catégorie. Au-delà de la limite de voix du
+    son, ou si tous les canaux sont pris, la voix la plus ancienne est reprise.
+    `position` (x, y) : son spatialisé par rapport à l'auditeur (voir update).
+    """
+    sound = get(name)
+    if sound is None:
+        return
+    _, _, category, max_voices = SOUNDS[name]
+    channels = _channels[category]
+    same = [ch for ch in channels if ch.get_busy() and _voices.get(ch, (None,))[0] == name]
+    if len(same) >= max_voices:
+        channel = min(same, key=lambda ch: _voices[ch][2])
+        _stats["stolen"] += 1
+    else:
+        channel = next((ch for ch in channels if not ch.get_busy()), None)
+        if channel is None:
+            channel = min(channels, key=lambda ch: _voices.get(ch, (None, None, 0))[2])
+            _stats["stolen"] += 1
+    _state["plays"] += 1
+    _voices[channel] = [name, position, _state["plays"]]
+    channel.play(sound)
+    _spatialize(channel, position, _state["listener"])
+    _stats["played"] += 1
+
+
+def update(listener):
+    """
+    Volume et balance de tous les sons positionnés en cours, selon la
+    position de l'auditeur (x, y) : une passe par frame sur les voix actives.
+    """
+    _state["listener"] = listener
+    finished = []
+    for channel, (name, position, _) in _voices.items():
+        if not channel.get_busy():
+            finished.append(channel)
+        elif position is not None:
+            _spatialize(channel, position, listener)
+    for channel in finished:
+        del _voices[channel]
+
+
+def _spatialize(channel, position, listener):
+    """Volume selon la distance, balance gauche/droite selon l'écart horizontal."""
+    if position is None or listener is None:
+        channel.set_volume(1.0)
+        return
+    dx = position[0] - listener[0]
+    volume = max(0.0, 1.0 - math.hypot(dx, position[1] - listener[1]) / HEARING_DISTANCE)
+    pan = max(-1.0, min(1.0, dx / (SCREEN_WIDTH / 2)))
+    channel.set_volume(volume * min(1.0, 1.0 - pan), volume * min(1.0, 1.0 + pan))
+
+
+def start_music():
+    """Lance la musique de fond en boucle (lue en continu depuis le fichier). Renvoie False si impossible."""
+    if not init():
+        return False
+    path, volume = MUSIC
+    try:
+        pygame.mixer.music.load(path)
+    except pygame.error as e:
+        print("Musique introuvable :", e)
+        return False
+    pygame.mixer.music.set_volume(volume)
+    pygame.mixer.music.play(loops=-1)
+    return True
+
+
+def set_music(on, volume):
+    """Met en pause ou reprend la musique de fond (sans la relancer depuis le début)."""
+    if not pygame.mixer.get_init():
+        return
+    if on:
+        pygame.mixer.music.set_volume(volume)
+        if pygame.mixer.music.get_busy():
+            return
+        pygame.mixer.music.unpause()
+        if not pygame.mixer.music.get_busy():
+            try:
+                pygame.mixer.music.play(loops=-1)  # Jamais lancée (ou arrêtée) : depuis le début
+            except pygame.error:
+                pass  # Aucune musique chargée
+    else:
+        pygame.mixer.music.pause()
+
+
+def get_stats():
+    """Sons décodés ou lus depuis le cache disque, lectures, voix reprises, voix en cours."""
+    return {**_stats, "sounds": len(_sounds), "voices": len(_voices)}
@@ -0,0 +1,186 @@
+"""
+Simulation sans fenêtre et mesure des temps par phase.
+
+    python benchmark.py --ticks 600 --seed 42
+
+Utilise les pilotes SDL "dummy" (ni écran ni carte son nécessaires), génère un
+donjon avec une graine fixe puis joue N ticks avec des entrées scriptées en
+chronométrant chaque phase (p50 / p95 / p99 en ms).
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import savegame
+import sim
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, COLLECT_MEDECINE, SIMULATION_HZ
+from prefetch import DOOR_OFFSETS
+from replay import ACTION_BITS, InputState
+
+PHASES = [
+    "update_player", "check_player_attack", "update_enemies",
+    "update_medicaments", "try_change_room", "draw",
+]
+
+
+def scripted_input(tick):
+    """Entrées déterministes : le joueur tourne en carré et attaque régulièrement."""
+    moves = ["move_right", "move_down", "move_left", "move_up"]
+    action = moves[(tick // 45) % len(moves)]
+    controls = InputState(ACTION_BITS[action])
+    attack = tick % 30 == 0
+    return controls, attack
+
+
+def percentile(samples, pct):
+    """Percentile par rang le plus proche (samples non vide)."""
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def init_headless():
+    """Initialise pygame sans fenêtre réelle (surface d'affichage factice)."""
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def next_door(game_manager, visits):
+    """Porte de la salle courante menant à la salle voisine la moins visitée : (direction, position)."""
+    r, c = game_manager.current_pos
+    best = None
+    for direction, _ in game_manager.current_room.doors:
+        dr, dc = DOOR_OFFSETS[direction]
+        pos = (r + dr, c + dc)
+        if pos in game_manager.grid and (best is None or visits.get(pos, 0) < visits.get(best[1], 0)):
+            best = (direction, pos)
+    return best
+
+
+def run(ticks=600, seed=0, hop=120, prefetch_stats=None, snapshot_stats=None):
+    """
+    Joue `ticks` ticks et renvoie {phase: [durées en ms]}.
+    Tous les `hop` ticks, le joueur passe une porte vers la voisine la moins
+    visitée (comme en jeu : les salles préchargées sont celles derrière les
+    portes) pour que toutes les salles du donjon soient mesurées.
+    Si `prefetch_stats` est un dict, il reçoit les compteurs du préchargement des salles,
+    si `snapshot_stats` est un dict, les mesures de la sauvegarde (voir measure_snapshot).
+    """
+    from gameSettings import GameSettings
+    from game import GameManager
+
+    settings = GameSettings()
+    game_manager = GameManager(settings)
+    game_manager.init_game(seed=seed)
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    visits = {game_manager.current_pos: 1}
+    timings = {phase: [] for phase in PHASES + ["frame", "enter_room"]}
+    player = game_manager.player
+    clock = time.perf_counter
+
+    for tick in range(ticks):
+        if hop and tick and tick % hop == 0:
+            door = next_door(game_manager, visits)
+            if door is not None:
+                direction, pos = door
+                visits[pos] = visits.get(pos, 0) + 1
+                start = clock()
+                # Même enchaînement que try_change_room : arrivée à la porte opposée, puis entrée
+                game_manager.current_room.update_enemies_state()
+                game_manager.reposition_player(direction)
+                game_manager.enter_room(pos)
+                timings["enter_room"].append((clock() - start) * 1000)
+        if player.health <= 0:
+            # On garde le joueur en vie pour mesurer une session complète
+            player.health = 3
+            player.state = "idle"
+
+        controls, attack = scripted_input(tick)
+        if attack:
+            player.attack(COLLECT_MEDECINE)
+
+        frame_start = clock()
+        for phase in PHASES:
+            start = clock()
+            if phase == "update_player":
+                game_manager.update_player(controls)
+            elif phase == "check_player_attack":
+                game_manager.check_player_attack(COLLECT_MEDECINE)
+            elif phase == "draw":
+                surface.fill((0, 0, 0))
+                game_manager.draw(surface, COLLECT_MEDECINE)
+            else:
+                getattr(game_manager, phase)()
+            timings[phase].append((clock() - start) * 1000)
+        timings["frame"].append((clock() - frame_start) * 1000)
+        sim.advance(1000 / SIMULATION_HZ)
+    if snapshot_stats is not None:
+        snapshot_stats.update(measure_snapshot(game_manager))
+    game_manager.prefetcher.shutdown()
+    if prefetch_stats is not None:
+        prefetch_stats.update(game_manager.prefetcher.get_stats())
+    return timings
+
+
+def measure_snapshot(game_manager, repeat=50):
+    """
+    Taille de la sauvegarde de la partie, temps moyens d'encodage et de décodage,
+    temps de reprise (ms), et si la partie reprise se sauvegarde à l'identique.
+    """
+    clock = time.perf_counter
+    start = clock()
+    for _ in range(repeat):
+        data = savegame.encode(game_manager, COLLECT_MEDECINE)
+    encode_ms = (clock() - start) * 1000 / repeat
+    start = clock()
+    for _ in range(repeat):
+        savegame.Snapshot.decode(data)
+    decode_ms = (clock() - start) * 1000 / repeat
+    start = clock()
+    game_manager.resume(savegame.Snapshot.decode(data))
+    resume_ms = (clock() - start) * 1000
+    return {"bytes": len(data), "rooms": len(game_manager.grid), "encode_ms": encode_ms,
+            "decode_ms": decode_ms, "resume_ms": resume_ms,
+            "identical": savegame.encode(game_manager, COLLECT_MEDECINE) == data}
+
+
+def report(timings, out=sys.stdout):
+    out.write(f"{'phase':<22}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}  (ms)\n")
+    for phase, samples in timings.items():
+        if not samples:
+            continue
+        out.write(f"{phase:<22}{percentile(samples, 50):9.3f}{percentile(samples, 95):9.3f}"
+                  f"{percentile(samples, 99):9.3f}{max(samples):9.3f}\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark sans fenêtre de Contagium")
+    parser.add_argument("--ticks", type=int, default=600, help="nombre de ticks simulés")
+    parser.add_argument("--seed", type=int, default=0, help="graine du donjon et des entrées")
+    parser.add_argument("--hop", type=int, default=120, help="changer de salle tous les N ticks (0 = jamais)")
+    args = parser.parse_args(argv)
+
+    init_headless()
+    prefetch_stats = {}
+    snapshot_stats = {}
+    timings = run(args.ticks, args.seed, args.hop, prefetch_stats, snapshot_stats)
+    report(timings)
+    print(f"préchargement : {prefetch_stats['hit_rate']:.0%} de succès "
+          f"({prefetch_stats['hits']} prêtes, {prefetch_stats['late']} attendues, {prefetch_stats['misses']} ratées), "
+          f"changement de salle {prefetch_stats['swap_ms_avg']:.2f} ms en moyenne, "
+          f"{prefetch_stats['swap_ms_max']:.2f} ms au pire")
+    print(f"sauvegarde : {snapshot_stats['bytes']} octets pour {snapshot_stats['rooms']} salles, "
+          f"encodage {snapshot_stats['encode_ms']:.3f} ms, décodage {snapshot_stats['decode_ms']:.3f} ms, "
+          f"reprise {snapshot_stats['resume_ms']:.1f} ms"
+          f"{'' if snapshot_stats['identical'] else ' (état repris différent !)'}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
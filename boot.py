@@ -0,0 +1,208 @@
+"""
+Démarrage du jeu par phases mesurées.
+
+Aucun module du jeu n'initialise pygame à son import : chaque sous-système
+(affichage, polices, manettes, son) l'est une seule fois, ici. Les modules
+lourds sont importés dans la phase qui s'en sert, derrière un écran de
+chargement, et la durée de chaque phase est notée dans une frise
+(StartupTimeline) : `python main.py --timeline` l'affiche, et
+`python boot.py --budget 1500` la vérifie sans fenêtre (CI).
+"""
+import time
+
+_import_start = time.perf_counter()
+import pygame  # Le plus long du démarrage : mesuré comme première phase
+_pygame_import_ms = (time.perf_counter() - _import_start) * 1000
+
+import argparse
+import os
+import sys
+from contextlib import contextmanager
+
+import asset_manager
+import audio
+import ui
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from presenter import Presenter
+
+LOADING_REDRAW_MS = 33  # Pendant une phase, la barre est redessinée au plus une fois par intervalle
+
+
+class StartupTimeline:
+    """Début et durée (ms) de chaque phase du démarrage, depuis l'import de pygame."""
+    def __init__(self):
+        self.origin = _import_start
+        self.phases = [("import pygame", 0.0, _pygame_import_ms)]  # (nom, début, durée)
+
+    @contextmanager
+    def phase(self, name):
+        """Chronomètre le bloc : `with timeline.phase("menus"): ...`"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.phases.append((name, (start - self.origin) * 1000, (end - start) * 1000))
+
+    def total_ms(self):
+        """Temps écoulé de l'import de pygame à la fin de la dernière phase."""
+        name, start, duration = self.phases[-1]
+        return start + duration
+
+    def report(self):
+        lines = [f"{'phase':<16}{'début':>10}{'durée':>10}"]
+        for name, start, duration in self.phases:
+            lines.append(f"{name:<16}{start:10.1f}{duration:10.1f}")
+        lines.append(f"{'total (ms)':<16}{'':>10}{self.total_ms():10.1f}")
+        return "\n".join(lines)
+
+
+class LoadingScreen:
+    """Barre de progression redessinée pendant le démarrage, entre deux phases et pendant les longues."""
+    def __init__(self, presenter, surface, steps):
+        self.presenter = presenter
+        self.surface = surface
+        self.steps = steps
+        self.done = 0
+        self.label = ""
+        self.font = ui.default_font(32)
+        self.last_draw = 0.0
+
+    def show(self, label, fraction=0.0):
+        """Affiche `label` et l'avancement : phases terminées plus `fraction` de la phase en cours."""
+        self.label = label
+        surface = self.surface
+        surface.fill((0, 0, 0))
+        text = ui.render_text(self.font, label, (255, 255, 255))
+        surface.blit(text, text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40)))
+        bar = pygame.Rect(0, 0, SCREEN_WIDTH // 2, 24)
+        bar.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 10)
+        progress = min(1.0, (self.done + fraction) / self.steps)
+        pygame.draw.rect(surface, (255, 255, 0), (bar.x, bar.y, int(bar.width * progress), bar.height))
+        pygame.draw.rect(surface, (255, 255, 255), bar, 2)
+        self.presenter.present(surface)
+        pygame.event.pump()  # La fenêtre reste réactive pendant le chargement
+        self.last_draw = time.perf_counter()
+
+    def progress(self, fraction):
+        """Avancement dans la phase en cours (redessiné au plus toutes les LOADING_REDRAW_MS)."""
+        if (time.perf_counter() - self.last_draw) * 1000 >= LOADING_REDRAW_MS:
+            self.show(self.label, fraction)
+
+
+def init_joysticks():
+    """Initialise une fois les manettes branchées (sans relancer le sous-système)."""
+    if not pygame.joystick.get_init():
+        pygame.joystick.init()
+    for i in range(pygame.joystick.get_count()):
+        pygame.joystick.Joystick(i).init()
+
+
+class Boot:
+    """
+    Séquence de démarrage : chaque phase est chronométrée dans `timeline`,
+    et celles qui suivent l'ouverture de la fenêtre sont affichées par l'écran
+    de chargement. Après run(), screen, presenter, surface, menus et
+    game_manager sont prêts pour la boucle de jeu.
+    headless : fenêtre à la taille du jeu (pilotes "dummy") au lieu du plein écran.
+    """
+    # Phases affichées par l'écran de chargement : (nom dans la frise, texte, méthode)
+    STEPS = [
+        ("modules", "Chargement du jeu", "load_modules"),
+        ("sprites", "Chargement des personnages", "load_sprites"),
+        ("sons", "Chargement des sons", "load_sounds"),
+        ("menus", "Préparation des menus", "build_menus"),
+        ("partie", "Préparation de la partie", "create_game"),
+    ]
+
+    def __init__(self, settings, headless=False):
+        self.settings = settings
+        self.headless = headless
+        self.timeline = StartupTimeline()
+        self.screen = None
+        self.presenter = None
+        self.surface = None
+        self.loading = None
+        self.modules = None
+        self.menus = None
+        self.game_manager = None
+
+    def run(self):
+        with self.timeline.phase("pygame"):
+            # Uniquement les sous-systèmes utilisés (le son : voir load_sounds)
+            pygame.display.init()
+            pygame.font.init()
+            init_joysticks()
+        with self.timeline.phase("affichage"):
+            self.open_display()
+        self.loading = LoadingScreen(self.presenter, self.surface, len(self.STEPS))
+        for name, label, method in self.STEPS:
+            self.loading.show(label)
+            with self.timeline.phase(name):
+                getattr(self, method)()
+            self.loading.done += 1
+        return self
+
+    def open_display(self):
+        if self.headless:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        else:
+            # --- plein écran natif ---
+            info = pygame.display.Info()
+            self.screen = pygame.display.set_mode((info.current_w, info.current_h))
+        pygame.display.set_caption("Contagium")
+        # surface logique du jeu, centrée sur l'écran (voir Presenter)
+        self.surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.presenter = Presenter(self.screen, (SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    def load_modules(self):
+        # Import différé : cartes (pytmx), donjon, ennemis, menus...
+        import game
+        import menu
+        self.modules = (game, menu)
+
+    def load_sprites(self):
+        # Planches de sprites décodées avant la première partie (pas de saccade au changement de salle)
+        asset_manager.preload(lambda done, total: self.loading.progress(done / total))
+
+    def load_sounds(self):
+        audio.preload()
+        audio.start_music()
+
+    def build_menus(self):
+        game, menu = self.modules
+        self.menus = menu.init_menus(self.settings)
+
+    def create_game(self):
+        game, menu = self.modules
+        self.game_manager = game.GameManager(self.settings)
+
+    def shutdown(self):
+        if self.game_manager is not None:
+            # Le thread de préchargement ne doit plus toucher à pygame après quit()
+            self.game_manager.prefetcher.shutdown()
+        pygame.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Démarrage du jeu sans fenêtre, durée de chaque phase")
+    parser.add_argument("--budget", type=float, metavar="MS",
+                        help="échoue (code 1) si le démarrage dure plus de MS millisecondes")
+    args = parser.parse_args(argv)
+
+    from gameSettings import GameSettings
+
+    boot = Boot(GameSettings(), headless=True).run()
+    boot.shutdown()
+    print(boot.timeline.report())
+    if args.budget is not None and boot.timeline.total_ms() > args.budget:
+        print(f"démarrage trop long : {boot.timeline.total_ms():.0f} ms > {args.budget:.0f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    # Pilotes SDL "dummy" (ni écran ni carte son) : avant l'initialisation de pygame
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    sys.exit(main())
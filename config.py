@@ -9,6 +9,23 @@ HEAD_BAR_HEIGHT = 100
 WALL_THICKNESS = 10
 DOOR_SIZE = 20
 
+# Boucle de jeu : simulation à pas fixe, rendu découplé
+SIMULATION_HZ = 60  # Pas de simulation par seconde (vitesses et animations sont calibrées dessus)
+MAX_SIMULATION_STEPS = 5  # Pas rattrapés au maximum par frame (évite la spirale de la mort)
+RENDER_FPS = 60  # Limite d'images par seconde en jeu (0 = non limité, ex. 144 possible)
+MENU_FPS = 60
+IDLE_WAIT_MS = 1000  # Attente max des événements sur un écran statique (menus sans animation)
+
+# Donjon sans fin : salles ajoutées par morceaux quand il reste peu de salles inexplorées
+STREAM_CHUNK_ROOMS = 0  # Salles par morceau (0 = donjon de taille fixe)
+STREAM_ZOMBIES_PER_ROOM = 2  # Zombies (et potions) en moyenne par salle ajoutée
+
+# Sons : PCM décodé gardé sur disque pour les lancements suivants (None : pas de cache)
+SOUND_CACHE_DIR = None
+
+# Autosauvegarde de la partie en cours (python main.py --resume pour la reprendre)
+SAVE_FILE = "sauvegarde.ctgs"
+
 # Minimap
 MINIMAP_SCALE = 20  # Taille des carrés
 MINIMAP_MARGIN = 10  # Marge autour
@@ -34,10 +51,8 @@ BLACK = (0, 0, 0)
 RED = (255, 0, 0)
 GREEN = (0, 255, 0)
 
-# Police
-pygame.init()
-
-FONT = pygame.font.SysFont("Arial", 36)
+# Police des messages : celle livrée avec pygame (voir ui.default_font), créée au premier texte
+FONT_SIZE = 36
 
 # Configuration des touches par défaut
 DEFAULT_CONTROLS = {
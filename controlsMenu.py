@@ -1,9 +1,8 @@
-import pygame
 from pygame.locals import *
+import ui
 from config import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, STATE_BACK,
-    STATE_MENU, STATE_PLAY, STATE_PAUSE, STATE_GAME_OVER, STATE_OPTIONS,
-    FONT
+    SCREEN_WIDTH, STATE_BACK,
+    STATE_MENU, STATE_PLAY, STATE_PAUSE, STATE_GAME_OVER, STATE_OPTIONS
 )
 
 class ControlsMenu:
@@ -16,13 +15,15 @@ class ControlsMenu:
         self.key_to_change = None
         self.device_to_change = None
         
-        # Charger l'image de fond
-        try:
-            self.background = pygame.image.load("right.png").convert()
-            self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        except:
-            self.background = None
-        
+        # Fond, police et titre chargés une seule fois
+        self.background = ui.menu_background()
+        self.font = ui.obra_font(25)
+        title = ui.title_image("wordsGame/controle.png")
+        if title is None:
+            title = self.font.render("Contrôles", True, (255, 255, 0))
+        self.title = title
+        self.title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 130))
+
         self.update_buttons()
     
     def update_buttons(self):
@@ -85,6 +86,17 @@ class ControlsMenu:
         # Boutons spéciaux
         self.buttons.append({"text": "Réinitialiser", "action": "RESET", "device": None})
         self.buttons.append({"text": "Retour", "action": STATE_BACK, "device": None})
+
+        # Séparer clavier et manette ; liste ordonnée pour la sélection et la modification
+        self.keyboard_buttons = [b for b in self.buttons if b.get("device") == "keyboard"]
+        self.gamepad_buttons = [b for b in self.buttons if b.get("device") == "gamepad"]
+        self.reset_btn = next((b for b in self.buttons if b.get("action") == "RESET"), None)
+        self.back_btn = next((b for b in self.buttons if b.get("action") == STATE_BACK), None)
+        self.displayed_buttons = self.keyboard_buttons + self.gamepad_buttons
+        if self.reset_btn:
+            self.displayed_buttons.append(self.reset_btn)
+        if self.back_btn:
+            self.displayed_buttons.append(self.back_btn)
     
     def draw(self, surface):
         # Dessiner le fond
@@ -94,44 +106,18 @@ class ControlsMenu:
             surface.fill((30, 30, 30))
 
         # Titre
-        try:
-            obra_font = pygame.font.Font("assets/ObraLetra.ttf", 25)
-        except:
-            obra_font = pygame.font.SysFont("Arial", 25)
-        try:
-            title = pygame.image.load("wordsGame/controle.png").convert_alpha()
-            title = pygame.transform.scale(title, (int(title.get_width() * 0.4), int(title.get_height() * 0.4)))
-            title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 130))
-            surface.blit(title, title_rect)
-        except:
-            title_surface = obra_font.render("Contrôles", True, (255, 255, 0))
-            title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 130))
-            surface.blit(title_surface, title_rect)
+        surface.blit(self.title, self.title_rect)
 
         # Message d'attente
         if self.waiting_for_key:
-            wait_text = obra_font.render("Appuyez sur une touche clavier...", True, (255, 100, 100))
-            wait_rect = wait_text.get_rect(center=(SCREEN_WIDTH // 2, 80))
-            surface.blit(wait_text, wait_rect)
+            wait_text = ui.render_text(self.font, "Appuyez sur une touche clavier...", (255, 100, 100))
+            surface.blit(wait_text, wait_text.get_rect(center=(SCREEN_WIDTH // 2, 80)))
         elif self.waiting_for_gamepad:
-            wait_text = obra_font.render("Appuyez sur un bouton de manette...", True, (255, 100, 100))
-            wait_rect = wait_text.get_rect(center=(SCREEN_WIDTH // 2, 80))
-            surface.blit(wait_text, wait_rect)
+            wait_text = ui.render_text(self.font, "Appuyez sur un bouton de manette...", (255, 100, 100))
+            surface.blit(wait_text, wait_text.get_rect(center=(SCREEN_WIDTH // 2, 80)))
 
-        # Séparer clavier et manette
-        keyboard_buttons = [b for b in self.buttons if b.get("device") == "keyboard"]
-        gamepad_buttons = [b for b in self.buttons if b.get("device") == "gamepad"]
-        # On suppose l'ordre : Réinitialiser puis Retour
-        reset_btn = next((b for b in self.buttons if b.get("action") == "RESET"), None)
-        back_btn = next((b for b in self.buttons if b.get("action") == STATE_BACK), None)
-
-        # Liste ordonnée pour la sélection et la modification
-        self.displayed_buttons = keyboard_buttons + gamepad_buttons
-        if reset_btn:
-            self.displayed_buttons.append(reset_btn)
-        if back_btn:
-            self.displayed_buttons.append(back_btn)
-        selection_idx = self.current_selection
+        keyboard_buttons = self.keyboard_buttons
+        gamepad_buttons = self.gamepad_buttons
 
         # Affichage grille
         col_x = [SCREEN_WIDTH//2 - 220, SCREEN_WIDTH//2 + 220]
@@ -141,55 +127,26 @@ class ControlsMenu:
 
         # Clavier à gauche
         for i, button in enumerate(keyboard_buttons):
-            color = (0, 150, 0) if selection_idx == i else (44, 68, 132)
-            if (self.waiting_for_key or self.waiting_for_gamepad) and selection_idx == i:
-                color = (255, 100, 100)
-            text_surface = obra_font.render(button["text"], True, color)
-            y_pos = start_y + i * row_height
-            button_rect = text_surface.get_rect(center=(col_x[0], y_pos))
-            button_bg = pygame.Surface((text_surface.get_width() + 24, text_surface.get_height() + 14), pygame.SRCALPHA)
-            pygame.draw.rect(button_bg, (220, 220, 220, 200), button_bg.get_rect(), border_radius=18)
-            surface.blit(button_bg, (button_rect.x - 12, button_rect.y - 7))
-            surface.blit(text_surface, button_rect)
+            ui.draw_button(surface, self.font, button["text"], self.button_color(i), (col_x[0], start_y + i * row_height))
 
         # Manette à droite
         for i, button in enumerate(gamepad_buttons):
             idx = len(keyboard_buttons) + i
-            color = (0, 150, 0) if selection_idx == idx else (44, 68, 132)
-            if (self.waiting_for_key or self.waiting_for_gamepad) and selection_idx == idx:
-                color = (255, 100, 100)
-            text_surface = obra_font.render(button["text"], True, color)
-            y_pos = start_y + i * row_height
-            button_rect = text_surface.get_rect(center=(col_x[1], y_pos))
-            button_bg = pygame.Surface((text_surface.get_width() + 24, text_surface.get_height() + 14), pygame.SRCALPHA)
-            pygame.draw.rect(button_bg, (220, 220, 220, 200), button_bg.get_rect(), border_radius=18)
-            surface.blit(button_bg, (button_rect.x - 12, button_rect.y - 7))
-            surface.blit(text_surface, button_rect)
+            ui.draw_button(surface, self.font, button["text"], self.button_color(idx), (col_x[1], start_y + i * row_height))
 
         # Boutons spéciaux : Réinitialiser sous clavier, Retour sous manette
         special_y = start_y + max_rows * row_height + 40
-        if reset_btn:
+        if self.reset_btn:
             idx = len(keyboard_buttons) + len(gamepad_buttons)
-            color = (0, 150, 0) if selection_idx == idx else (44, 68, 132)
-            if (self.waiting_for_key or self.waiting_for_gamepad) and selection_idx == idx:
-                color = (255, 100, 100)
-            text_surface = obra_font.render(reset_btn["text"], True, color)
-            button_rect = text_surface.get_rect(center=(col_x[0], special_y))
-            button_bg = pygame.Surface((text_surface.get_width() + 24, text_surface.get_height() + 14), pygame.SRCALPHA)
-            pygame.draw.rect(button_bg, (220, 220, 220, 200), button_bg.get_rect(), border_radius=18)
-            surface.blit(button_bg, (button_rect.x - 12, button_rect.y - 7))
-            surface.blit(text_surface, button_rect)
-        if back_btn:
-            idx = len(keyboard_buttons) + len(gamepad_buttons) + (1 if reset_btn else 0)
-            color = (0, 150, 0) if selection_idx == idx else (44, 68, 132)
-            if (self.waiting_for_key or self.waiting_for_gamepad) and selection_idx == idx:
-                color = (255, 100, 100)
-            text_surface = obra_font.render(back_btn["text"], True, color)
-            button_rect = text_surface.get_rect(center=(col_x[1], special_y))
-            button_bg = pygame.Surface((text_surface.get_width() + 24, text_surface.get_height() + 14), pygame.SRCALPHA)
-            pygame.draw.rect(button_bg, (220, 220, 220, 200), button_bg.get_rect(), border_radius=18)
-            surface.blit(button_bg, (button_rect.x - 12, button_rect.y - 7))
-            surface.blit(text_surface, button_rect)
+            ui.draw_button(surface, self.font, self.reset_btn["text"], self.button_color(idx), (col_x[0], special_y))
+        if self.back_btn:
+            idx = len(keyboard_buttons) + len(gamepad_buttons) + (1 if self.reset_btn else 0)
+            ui.draw_button(surface, self.font, self.back_btn["text"], self.button_color(idx), (col_x[1], special_y))
+
+    def button_color(self, index):
+        if (self.waiting_for_key or self.waiting_for_gamepad) and self.current_selection == index:
+            return (255, 100, 100)
+        return (0, 150, 0) if self.current_selection == index else (44, 68, 132)
     
     def handle_event(self, event):
         if self.waiting_for_key:
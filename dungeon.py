@@ -0,0 +1,215 @@
+import math
+import random
+from collections import deque
+
+from room import Room
+
+START = (0, 0)
+FIRST_ROOM = (0, 1)  # Salle à droite du départ, seule entrée du donjon
+FINAL_ROOM_ZOMBIES = 8
+MAX_ZOMBIES_PER_ROOM = 5
+DOOR_OFFSETS = {'up': (-1, 0), 'down': (1, 0), 'left': (0, -1), 'right': (0, 1)}
+
+
+def binomial(rng, n, p):
+    """Tirage binomial B(n, p) par sauts géométriques entre deux succès : O(n·p) en moyenne."""
+    if n <= 0 or p <= 0:
+        return 0
+    if p >= 1:
+        return n
+    log_q = math.log(1.0 - p)
+    count = 0
+    trials = 0
+    while True:
+        trials += int(math.log(1.0 - rng.random()) / log_q) + 1
+        if trials > n:
+            return count
+        count += 1
+
+
+def distribute(rng, total, slots, cap=None):
+    """
+    Répartit `total` éléments uniformément au hasard sur `slots` cases (au plus
+    `cap` par case) : une loi multinomiale tirée case par case en binomiales
+    conditionnelles, O(slots + total). Ce qui ne tient pas dans les cases pleines
+    est abandonné.
+    """
+    counts = []
+    left = total
+    for i in range(slots):
+        remaining = slots - i
+        n = binomial(rng, left, 1.0 / remaining)
+        if cap is not None:
+            # Ce que les cases suivantes ne pourront pas absorber reste ici
+            n = min(cap, max(n, left - cap * (remaining - 1)))
+        counts.append(n)
+        left -= n
+    return counts
+
+
+class DungeonGenerator:
+    """
+    Donjon (dict position -> Room) généré à partir d'une graine, et qui peut
+    être agrandi par morceaux (mode sans fin). Les cases libres voisines des
+    salles forment la frontière : une liste et un index des positions, pour
+    tirer et retirer une case en O(1).
+    Chaque agrandissement tire dans son propre flux (graine et numéro de
+    l'agrandissement) et dans une frontière triée : après une reprise, il
+    suffit de connaître le nombre d'agrandissements faits pour continuer à
+    l'identique.
+    """
+    def __init__(self, seed=None):
+        self.seed = random.getrandbits(32) if seed is None else seed
+        self.rng = random.Random(self.seed)
+        self.grid = {}
+        self.frontier = []
+        self.frontier_index = {}  # position -> indice dans frontier
+        self.final_room = None
+        self.extensions = 0  # Agrandissements faits (voir extend)
+
+    @classmethod
+    def restore(cls, seed, rooms, final_room=None, extensions=0):
+        """
+        Donjon refait à partir de salles déjà générées (reprise d'une sauvegarde) :
+        seule la frontière est recalculée, en O(salles). `extensions` : nombre
+        d'agrandissements déjà faits, pour que les suivants ne retirent pas les
+        mêmes salles.
+        """
+        dungeon = cls(seed)
+        dungeon.extensions = extensions
+        for room in rooms:
+            dungeon.grid[room.position] = room
+        for (r, c) in dungeon.grid:
+            if (r, c) != START:
+                for dr, dc in DOOR_OFFSETS.values():
+                    dungeon._push_frontier((r + dr, c + dc))
+        dungeon.final_room = final_room
+        return dungeon
+
+    def generate(self, num_rooms=2, total_zombies=10):
+        rng = self.rng
+        # Salle de départ : on n'agrandit pas le donjon à partir d'elle
+        self.grid[START] = Room(position=START, nb_medicaments=1, nb_ennemis=0, seed=rng.getrandbits(32))
+        self._add_room(FIRST_ROOM, nb_medicaments=0, nb_ennemis=2)
+        self._grow(num_rooms - 2)
+        self._update_doors(self.grid.values())
+
+        # Salle finale : la plus éloignée du départ en nombre de portes
+        final_room = self.farthest_room()
+        final_room.nb_enemies_in_room = FINAL_ROOM_ZOMBIES
+        final_room.is_final = True
+        final_room.generate_walls_and_doors(self.grid, forced_doors=['left'])
+        self.final_room = final_room
+
+        # --- Répartition des zombies (8 réservés à la salle finale, 5 max par salle) ---
+        normal_rooms = [room for pos, room in self.grid.items() if pos != START and room is not final_room]
+        counts = distribute(rng, total_zombies - FINAL_ROOM_ZOMBIES, len(normal_rooms), MAX_ZOMBIES_PER_ROOM)
+        for room, count in zip(normal_rooms, counts):
+            room.nb_enemies_in_room = count
+
+        # Répartition des médicaments (autant que de zombies, salle finale comprise)
+        rooms = [room for pos, room in self.grid.items() if pos != START]
+        for room, count in zip(rooms, distribute(rng, total_zombies, len(rooms))):
+            room.nb_medicaments += count
+        return self.grid
+
+    def extend(self, count, zombies=0, potions=0, protected=()):
+        """
+        Ajoute jusqu'à `count` salles en bordure du donjon et y répartit
+        `zombies` et `potions`. Aucune salle n'est collée aux positions
+        `protected` (salles chargées, dont les portes ne doivent pas changer).
+        Renvoie les nouvelles salles.
+        """
+        self.extensions += 1
+        self.rng = random.Random(f"{self.seed}:{self.extensions}")
+        # Ordre de la frontière indépendant de l'historique (identique après une reprise)
+        self.frontier.sort()
+        self.frontier_index = {pos: i for i, pos in enumerate(self.frontier)}
+        new_rooms = self._grow(count, protected)
+        touched = set(new_rooms)
+        for room in new_rooms:
+            touched.update(self._neighbours(room.position))
+        self._update_doors(touched)
+        counts = distribute(self.rng, zombies, len(new_rooms), MAX_ZOMBIES_PER_ROOM)
+        for room, n in zip(new_rooms, counts):
+            room.nb_enemies_in_room = n
+        for room, n in zip(new_rooms, distribute(self.rng, potions, len(new_rooms))):
+            room.nb_medicaments += n
+        return new_rooms
+
+    def farthest_room(self):
+        """Salle la plus éloignée du départ en suivant les portes (parcours en largeur)."""
+        start = self.grid[START]
+        distances = {START: 0}
+        queue = deque([start])
+        farthest = start
+        while queue:
+            room = queue.popleft()
+            r, c = room.position
+            for direction, _ in room.doors:
+                dr, dc = DOOR_OFFSETS[direction]
+                pos = (r + dr, c + dc)
+                neighbour = self.grid.get(pos)
+                if neighbour is None or pos in distances:
+                    continue
+                distances[pos] = distances[room.position] + 1
+                if distances[pos] > distances[farthest.position]:
+                    farthest = neighbour
+                queue.append(neighbour)
+        return farthest
+
+    def _add_room(self, pos, **kwargs):
+        room = Room(position=pos, seed=self.rng.getrandbits(32), **kwargs)
+        self.grid[pos] = room
+        r, c = pos
+        for dr, dc in DOOR_OFFSETS.values():
+            self._push_frontier((r + dr, c + dc))
+        return room
+
+    def _grow(self, count, protected=()):
+        """Ajoute `count` salles tirées au hasard dans la frontière."""
+        new_rooms = []
+        skipped = []
+        while len(new_rooms) < count and self.frontier:
+            pos = self._pop_frontier(self.rng.randrange(len(self.frontier)))
+            if protected and any(room.position in protected for room in self._neighbours(pos)):
+                skipped.append(pos)
+                continue
+            new_rooms.append(self._add_room(pos, nb_medicaments=0, nb_ennemis=0))
+        for pos in skipped:
+            self._push_frontier(pos)
+        return new_rooms
+
+    def _push_frontier(self, pos):
+        if pos in self.grid or pos in self.frontier_index or pos == START:
+            return
+        self.frontier_index[pos] = len(self.frontier)
+        self.frontier.append(pos)
+
+    def _pop_frontier(self, i):
+        """Retire la case d'indice i (remplacée par la dernière de la liste)."""
+        pos = self.frontier[i]
+        last = self.frontier.pop()
+        del self.frontier_index[pos]
+        if last != pos:
+            self.frontier[i] = last
+            self.frontier_index[last] = i
+        return pos
+
+    def _neighbours(self, pos):
+        r, c = pos
+        return [self.grid[p] for p in ((r + dr, c + dc) for dr, dc in DOOR_OFFSETS.values()) if p in self.grid]
+
+    def _update_doors(self, rooms):
+        for room in rooms:
+            if room.position == START:
+                room.generate_walls_and_doors(self.grid, forced_doors=['right'])
+            elif room is self.final_room:
+                room.generate_walls_and_doors(self.grid, forced_doors=['left'])
+            else:
+                room.generate_walls_and_doors(self.grid)
+
+
+def generate_random_grid(num_rooms=2, total_zombies=10, seed=None):
+    """Donjon de `num_rooms` salles (voir DungeonGenerator)."""
+    return DungeonGenerator(seed).generate(num_rooms, total_zombies)
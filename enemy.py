@@ -1,7 +1,26 @@
 import pygame
 import math
-import random
 import os
+import asset_manager
+import sim
+from render_queue import LAYER_ACTORS
+
+CORNER_SLIP = 8  # px : un coin accroché de si peu est contourné (voir resolve_obstacles)
+
+
+def _push(direction, low, high, obs_low, obs_high):
+    """
+    Décalage qui sort le segment [low, high) de [obs_low, obs_high) sur un axe :
+    à reculons si l'on avance (direction non nulle), sinon par le côté le plus proche.
+    """
+    back = obs_low - high
+    forward = obs_high - low
+    if direction > 0:
+        return back
+    if direction < 0:
+        return forward
+    return back if -back < forward else forward
+
 
 class Enemy(pygame.sprite.Sprite):
     def __init__(self, x, y, player, screen_width, screen_height,
@@ -45,11 +64,12 @@ class Enemy(pygame.sprite.Sprite):
 
         # Image initiale
         if self.health < 0:
-            self.image = self.resurrected_frames[0].copy() if self.resurrected_frames else pygame.Surface((frame_width, frame_height))
+            self.image = self.resurrected_frames[0] if self.resurrected_frames else pygame.Surface((frame_width, frame_height))
         elif self.health > 0:
-            self.image = self.walk_frames[0].copy() if self.walk_frames else pygame.Surface((frame_width, frame_height))
+            self.image = self.walk_frames[0] if self.walk_frames else pygame.Surface((frame_width, frame_height))
         else:
-            self.image = self.death_frames[0].copy() if self.death_frames else pygame.Surface((frame_width, frame_height))
+            self.image = self.death_frames[0] if self.death_frames else pygame.Surface((frame_width, frame_height))
+        self.visible = True
 
         self.rect = self.image.get_rect(center=(x, y))
         hitbox_width = int(self.rect.width * 0.3)
@@ -64,21 +84,17 @@ class Enemy(pygame.sprite.Sprite):
         self.random_dy = 0
         self.direction_timer = 0
         self.is_final_scene = is_final_scene
+        # Mise à jour groupée (voir enemy_horde.py) : l'ennemi n'est alors qu'une vue
+        self.horde = None
+        self.horde_index = None
+        self.room_index = None  # Indice dans Room.enemies_data (None : ennemi ajouté hors de la salle)
 
     def load_frames_from_folder(self, folder, action_name):
         if not folder:
             return []
         path = os.path.join(folder, f"{action_name}.png")
-        if not os.path.exists(path):
-            return []
-        sheet = pygame.image.load(path).convert_alpha()
-        frames = []
-        sheet_width = sheet.get_width()
-        sheet_height = sheet.get_height()
-        for y in range(0, sheet_height, self.frame_height):
-            for x in range(0, sheet_width, self.frame_width):
-                frames.append(sheet.subsurface(pygame.Rect(x, y, self.frame_width, self.frame_height)))
-        return frames
+        # Frames (et miroirs) partagées entre tous les ennemis utilisant la même planche
+        return asset_manager.load_frame_set(path, self.frame_width, self.frame_height)
 
     def take_damage(self, damage=1):
         if self.health == 0:
@@ -89,6 +105,8 @@ class Enemy(pygame.sprite.Sprite):
         self.attacking = False
         self.attack_in_progress = False
         self.damage_applied = False
+        if self.horde is not None:
+            self.horde.pull(self.horde_index)
 
     def animate(self, frames, anim_speed, flip=False, attack_hitbox_check=False):
         """Animation générique pour l'ennemi."""
@@ -105,28 +123,28 @@ class Enemy(pygame.sprite.Sprite):
             if self.taking_damage:
                 self.taking_damage = False
 
-        frame = frames[int(self.current_frame)].copy()
-
-        # Flip si nécessaire
-        if flip and self.direction == "left":
-            frame = pygame.transform.flip(frame, True, False)
-
-        self.image = frame
+        # Frame déjà retournée si nécessaire (aucune allocation ici)
+        direction = self.direction if flip else "right"
+        self.image = frames.get(int(self.current_frame), direction)
 
         # Vérification d'attaque
         if attack_hitbox_check and self.attack_in_progress and not self.damage_applied:
             if int(self.current_frame) == 3:  # frame clé de l'attaque
-                attack_hitbox = self.hitbox.copy()
-                attack_hitbox.width = self.hitbox.width
-                attack_hitbox.height = self.hitbox.height // 2
-                if self.direction == "right":
-                    attack_hitbox.x += self.hitbox.width // 2
-                else:
-                    attack_hitbox.x -= self.hitbox.width // 2
-                attack_hitbox.y += self.hitbox.height // 4
-                if attack_hitbox.colliderect(self.player.hitbox):
-                    self.player.take_damage(self.attack_damage)
-                    self.damage_applied = True
+                self.apply_attack_hit()
+
+    def apply_attack_hit(self):
+        """Inflige les dégâts au joueur s'il est dans la zone d'attaque."""
+        attack_hitbox = self.hitbox.copy()
+        attack_hitbox.width = self.hitbox.width
+        attack_hitbox.height = self.hitbox.height // 2
+        if self.direction == "right":
+            attack_hitbox.x += self.hitbox.width // 2
+        else:
+            attack_hitbox.x -= self.hitbox.width // 2
+        attack_hitbox.y += self.hitbox.height // 4
+        if attack_hitbox.colliderect(self.player.hitbox):
+            self.player.take_damage(self.attack_damage)
+            self.damage_applied = True
 
     def final_scene(self):
         """Scène finale : uniquement marche."""
@@ -144,13 +162,39 @@ class Enemy(pygame.sprite.Sprite):
             self.direction = "right" if norm_dx >= 0 else "left"
         else:
             # Une fois arrivé au centre -> disparition
-            self.image.set_alpha(0)
+            # (les frames sont partagées : on masque l'ennemi au lieu de toucher à l'image)
+            self.visible = False
             return
 
         self.rect.center = self.hitbox.center
         self.animate(self.walk_frames, self.animation_speed, flip=True)
 
 
+    def resolve_obstacles(self, current_room, dx_norm, dy_norm):
+        """
+        Repousse la hitbox hors des obstacles, à l'opposé du déplacement sur son
+        axe principal. Si elle n'accroche l'obstacle que de CORNER_SLIP pixels
+        sur l'autre axe, elle est poussée sur cet axe : l'ennemi glisse autour
+        du coin au lieu de rester collé au mur.
+        """
+        hitbox = self.hitbox
+        along_x = abs(dx_norm) >= abs(dy_norm)
+        for obs in current_room.obstacle_grid.sweep(hitbox):
+            if not hitbox.colliderect(obs):
+                continue
+            if along_x:
+                slip = _push(0, hitbox.top, hitbox.bottom, obs.top, obs.bottom)
+                if abs(slip) <= CORNER_SLIP:
+                    hitbox.y += slip
+                else:
+                    hitbox.x += _push(dx_norm, hitbox.left, hitbox.right, obs.left, obs.right)
+            else:
+                slip = _push(0, hitbox.left, hitbox.right, obs.left, obs.right)
+                if abs(slip) <= CORNER_SLIP:
+                    hitbox.x += slip
+                else:
+                    hitbox.y += _push(dy_norm, hitbox.top, hitbox.bottom, obs.top, obs.bottom)
+
     def update(self, current_room):
         if self.health == 0:
             return
@@ -170,10 +214,11 @@ class Enemy(pygame.sprite.Sprite):
             self.attack_in_progress = False
             self.direction_timer -= 1
             if self.direction_timer <= 0:
-                angle = random.uniform(0, math.pi * 2)
+                rng = sim.rng("enemies")
+                angle = rng.uniform(0, math.pi * 2)
                 self.random_dx = math.cos(angle)
                 self.random_dy = math.sin(angle)
-                self.direction_timer = random.randint(30, 90)
+                self.direction_timer = rng.randint(30, 90)
             dx_norm, dy_norm = self.random_dx, self.random_dy
             speed = self.speed_close
         else:
@@ -186,15 +231,21 @@ class Enemy(pygame.sprite.Sprite):
             if not self.attack_in_progress:
                 if distance < self.activation_distance:
                     speed = self.speed_close
-                    dx_norm, dy_norm = (dx / distance, dy / distance) if distance != 0 else (0, 0)
+                    # Contourne les obstacles en suivant le champ de la salle (voir navigation.py)
+                    flow = current_room.flow_field.direction(*self.hitbox.center) if current_room.flow_field else None
+                    if flow is not None:
+                        dx_norm, dy_norm = flow
+                    else:
+                        dx_norm, dy_norm = (dx / distance, dy / distance) if distance != 0 else (0, 0)
                 else:
                     speed = self.speed_far
                     self.direction_timer -= 1
                     if self.direction_timer <= 0:
-                        angle = random.uniform(0, math.pi * 2)
+                        rng = sim.rng("enemies")
+                        angle = rng.uniform(0, math.pi * 2)
                         self.random_dx = math.cos(angle)
                         self.random_dy = math.sin(angle)
-                        self.direction_timer = random.randint(30, 90)
+                        self.direction_timer = rng.randint(30, 90)
                     dx_norm, dy_norm = self.random_dx, self.random_dy
             else:
                 dx_norm, dy_norm = 0, 0
@@ -203,16 +254,7 @@ class Enemy(pygame.sprite.Sprite):
         # Déplacement et collisions
         self.hitbox.x += dx_norm * speed
         self.hitbox.y += dy_norm * speed
-        for obs in current_room.obstacles:
-            if self.hitbox.colliderect(obs):
-                if dx_norm > 0:
-                    self.hitbox.right = obs.left
-                elif dx_norm < 0:
-                    self.hitbox.left = obs.right
-                if dy_norm > 0:
-                    self.hitbox.bottom = obs.top
-                elif dy_norm < 0:
-                    self.hitbox.top = obs.bottom
+        self.resolve_obstacles(current_room, dx_norm, dy_norm)
 
         self.rect.center = self.hitbox.center
         self.direction = "right" if dx >= 0 else "left"
@@ -245,7 +287,8 @@ class Enemy(pygame.sprite.Sprite):
         self.rect.clamp_ip(pygame.Rect(0, 0, self.screen_width, self.screen_height))
         self.hitbox.center = self.rect.center
 
-    def draw(self, surface):
-        if self.health != 0:
-            surface.blit(self.image, self.rect)
+    def submit(self, queue):
+        """Ajoute l'ennemi à la file de rendu (trié avec le joueur selon le bas de la hitbox)."""
+        if self.health != 0 and self.visible:
+            queue.blit(LAYER_ACTORS, self.image, self.rect, z=self.hitbox.bottom)
 
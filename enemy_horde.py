@@ -0,0 +1,245 @@
+import math
+
+import sim
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : sans lui, les ennemis sont mis à jour un par un
+    np = None
+
+# En dessous de ce nombre d'ennemis, la boucle classique reste plus rapide
+BATCH_MIN_ENEMIES = 32
+
+# Codes d'animation (index dans EnemyHorde.frame_sets)
+ANIM_WALK, ANIM_ATTACK, ANIM_HIT, ANIM_RESURRECTED = range(4)
+
+
+def batch_available():
+    """True si la mise à jour groupée est utilisable (NumPy installé)."""
+    return np is not None
+
+
+def _round(values):
+    """Arrondi identique à l'affectation d'un float dans un pygame.Rect."""
+    return np.where(values >= 0, np.floor(values + 0.5), np.ceil(values - 0.5)).astype(np.int64)
+
+
+class EnemyHorde:
+    """
+    Simulation groupée des ennemis d'une salle (structure de tableaux NumPy).
+    Reproduit Enemy.update : poursuite (par le champ de la salle), errance,
+    déclenchement d'attaque et avancement des animations sont calculés pour
+    tous les ennemis en quelques passes vectorisées. Les objets Enemy restent des vues : ils reçoivent
+    position, image et état à la fin de chaque update pour l'affichage et
+    pour GameManager.check_player_attack.
+    """
+    def __init__(self, enemies, screen_width, screen_height):
+        self.enemies = list(enemies)
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.rng = np.random.default_rng(sim.rng("enemies").getrandbits(32))
+        self._obstacle_grid = None
+        self._obstacle_arrays = None
+
+        def array(attr, dtype=np.float64):
+            return np.array([attr(e) for e in self.enemies], dtype=dtype)
+
+        # Géométrie
+        self.hx = array(lambda e: e.hitbox.x, np.int64)
+        self.hy = array(lambda e: e.hitbox.y, np.int64)
+        self.hw = array(lambda e: e.hitbox.width, np.int64)
+        self.hh = array(lambda e: e.hitbox.height, np.int64)
+        self.rw = array(lambda e: e.rect.width, np.int64)
+        self.rh = array(lambda e: e.rect.height, np.int64)
+        # Paramètres
+        self.speed_close = array(lambda e: e.speed_close)
+        self.speed_far = array(lambda e: e.speed_far)
+        self.activation_distance = array(lambda e: e.activation_distance)
+        self.attack_range = array(lambda e: e.attack_range)
+        self.anim_speeds = np.stack([
+            array(lambda e: e.animation_speed),
+            array(lambda e: e.attack_animation_speed),
+            array(lambda e: e.hit_animation_speed),
+            array(lambda e: e.animation_speed),
+        ])
+        self.frame_sets = [
+            (e.walk_frames, e.attack_frames, e.hit_frames, e.resurrected_frames) for e in self.enemies
+        ]
+        self.frame_counts = np.array([[len(s) for s in sets] for sets in self.frame_sets], dtype=np.int64).T
+        # État
+        self.health = array(lambda e: e.health, np.int64)
+        self.taking_damage = array(lambda e: e.taking_damage, bool)
+        self.attacking = array(lambda e: e.attacking, bool)
+        self.attack_in_progress = array(lambda e: e.attack_in_progress, bool)
+        self.damage_applied = array(lambda e: e.damage_applied, bool)
+        self.current_frame = array(lambda e: e.current_frame)
+        self.random_dx = array(lambda e: e.random_dx)
+        self.random_dy = array(lambda e: e.random_dy)
+        self.direction_timer = array(lambda e: e.direction_timer, np.int64)
+
+        for i, enemy in enumerate(self.enemies):
+            enemy.horde = self
+            enemy.horde_index = i
+
+    def matches(self, enemies):
+        """True si la horde correspond exactement à cette liste d'ennemis."""
+        return len(enemies) == len(self.enemies) and all(a is b for a, b in zip(enemies, self.enemies))
+
+    def pull(self, i):
+        """Recopie l'état d'un ennemi modifié hors de la horde (ex. take_damage)."""
+        enemy = self.enemies[i]
+        self.health[i] = enemy.health
+        self.current_frame[i] = enemy.current_frame
+        self.taking_damage[i] = enemy.taking_damage
+        self.attacking[i] = enemy.attacking
+        self.attack_in_progress[i] = enemy.attack_in_progress
+        self.damage_applied[i] = enemy.damage_applied
+
+    def _obstacles(self, room):
+        """Obstacles de la salle sous forme de tableaux (x, y, droite, bas), mis en cache."""
+        grid = room.obstacle_grid
+        if grid is not self._obstacle_grid:
+            rects = [r for r in grid.rects if r.width > 0 and r.height > 0]
+            self._obstacle_arrays = tuple(
+                np.array(values, dtype=np.int64).reshape(-1, 1)
+                for values in ([r.x for r in rects], [r.y for r in rects],
+                               [r.right for r in rects], [r.bottom for r in rects])
+            )
+            self._obstacle_grid = grid
+        return self._obstacle_arrays
+
+    def update(self, room, player):
+        alive = self.health != 0
+        if not alive.any():
+            return
+
+        # --- Décisions : poursuite, errance, attaque ---
+        pcx, pcy = player.hitbox.center
+        dx = pcx - (self.hx + self.hw // 2)
+        dy = pcy - (self.hy + self.hh // 2)
+        distance = np.hypot(dx, dy)
+
+        resurrected = alive & (self.health < 0)
+        normal = alive & (self.health > 0)
+        self.attacking[resurrected] = False
+        self.attack_in_progress[resurrected] = False
+
+        start_attack = normal & ~self.attack_in_progress & (distance <= self.attack_range)
+        self.attacking[start_attack] = True
+        self.attack_in_progress[start_attack] = True
+        self.current_frame[start_attack] = 0
+        self.damage_applied[start_attack] = False
+
+        moving = normal & ~self.attack_in_progress
+        close = moving & (distance < self.activation_distance)
+        far = moving & ~close
+        wander = resurrected | far
+
+        self.direction_timer[wander] -= 1
+        renew = wander & (self.direction_timer <= 0)
+        count = int(renew.sum())
+        if count:
+            angles = self.rng.uniform(0, math.pi * 2, count)
+            self.random_dx[renew] = np.cos(angles)
+            self.random_dy[renew] = np.sin(angles)
+            self.direction_timer[renew] = self.rng.integers(30, 91, count)
+
+        safe_distance = np.where(distance != 0, distance, 1)
+        dx_norm = np.where(close & (distance != 0), dx / safe_distance, 0.0)
+        dy_norm = np.where(close & (distance != 0), dy / safe_distance, 0.0)
+        field = room.flow_field
+        if field is not None and close.any():
+            flow_x, flow_y, follow = field.directions(self.hx + self.hw // 2, self.hy + self.hh // 2)
+            follow &= close
+            dx_norm = np.where(follow, flow_x, dx_norm)
+            dy_norm = np.where(follow, flow_y, dy_norm)
+        dx_norm = np.where(wander, self.random_dx, dx_norm)
+        dy_norm = np.where(wander, self.random_dy, dy_norm)
+        speed = np.where(resurrected | close, self.speed_close, np.where(far, self.speed_far, 0.0))
+
+        # --- Déplacement ---
+        self.hx = np.where(alive, _round(self.hx + dx_norm * speed), self.hx)
+        self.hy = np.where(alive, _round(self.hy + dy_norm * speed), self.hy)
+
+        # Phase large vectorisée : seuls les ennemis qui touchent un obstacle
+        # passent par la résolution détaillée (ordre des obstacles respecté)
+        ox, oy, oright, obottom = self._obstacles(room)
+        if ox.size:
+            overlap = ((self.hx < oright) & (ox < self.hx + self.hw) &
+                       (self.hy < obottom) & (oy < self.hy + self.hh))
+            for i in np.flatnonzero(overlap.any(axis=0) & alive):
+                enemy = self.enemies[i]
+                enemy.hitbox.topleft = (int(self.hx[i]), int(self.hy[i]))
+                enemy.resolve_obstacles(room, dx_norm[i], dy_norm[i])
+                self.hx[i], self.hy[i] = enemy.hitbox.topleft
+
+        left = dx < 0
+
+        # --- Animation ---
+        anim = np.full(len(self.enemies), ANIM_WALK)
+        anim[self.attack_in_progress] = ANIM_ATTACK
+        anim[self.taking_damage] = ANIM_HIT
+        anim[resurrected] = ANIM_RESURRECTED
+        check_attack = anim == ANIM_ATTACK
+
+        index = np.arange(len(self.enemies))
+        frame_count = self.frame_counts[anim, index]
+        animated = alive & (frame_count > 0)
+        self.current_frame = np.where(animated, self.current_frame + self.anim_speeds[anim, index], self.current_frame)
+        wrap = animated & (self.current_frame >= frame_count)
+        self.current_frame[wrap] = 0
+        self.attack_in_progress[wrap] = False
+        self.attacking[wrap] = False
+        self.taking_damage[wrap] = False
+
+        frame_index = self.current_frame.astype(np.int64)
+        hits = animated & check_attack & self.attack_in_progress & ~self.damage_applied & (frame_index == 3)
+
+        # Frame clé de l'attaque : test avant le clamp, comme Enemy.update
+        for i in np.flatnonzero(hits):
+            enemy = self.enemies[i]
+            enemy.direction = "left" if left[i] else "right"
+            enemy.hitbox.topleft = (int(self.hx[i]), int(self.hy[i]))
+            enemy.apply_attack_hit()
+            self.damage_applied[i] = enemy.damage_applied
+
+        # --- Clamp dans l'écran (rect d'affichage centré sur la hitbox) ---
+        rx = np.clip(self.hx + self.hw // 2 - self.rw // 2, 0, np.maximum(self.screen_width - self.rw, 0))
+        ry = np.clip(self.hy + self.hh // 2 - self.rh // 2, 0, np.maximum(self.screen_height - self.rh, 0))
+        self.hx = np.where(alive, rx + self.rw // 2 - self.hw // 2, self.hx)
+        self.hy = np.where(alive, ry + self.rh // 2 - self.hh // 2, self.hy)
+
+        # --- Recopie vers les objets Enemy (vues) ---
+        # Seul ce qui sert à l'affichage et aux collisions est recopié à chaque
+        # update ; le reste de l'état est recopié par sync_objects().
+        # (conversion en listes Python d'abord : l'accès élément par élément à NumPy est lent)
+        left = left.tolist()
+        animated = animated.tolist()
+        anim = anim.tolist()
+        frame_index = frame_index.tolist()
+        rx, ry = rx.tolist(), ry.tolist()
+        hx, hy = self.hx.tolist(), self.hy.tolist()
+        enemies = self.enemies
+        frame_sets = self.frame_sets
+        for i in np.flatnonzero(alive).tolist():
+            enemy = enemies[i]
+            direction = "left" if left[i] else "right"
+            enemy.direction = direction
+            if animated[i]:
+                enemy.image = frame_sets[i][anim[i]].get(frame_index[i], direction)
+            enemy.rect.topleft = (rx[i], ry[i])
+            enemy.hitbox.topleft = (hx[i], hy[i])
+
+    def sync_objects(self):
+        """Recopie tout l'état de la horde dans les objets Enemy (avant de l'abandonner)."""
+        for i, enemy in enumerate(self.enemies):
+            enemy.current_frame = float(self.current_frame[i])
+            enemy.attacking = bool(self.attacking[i])
+            enemy.attack_in_progress = bool(self.attack_in_progress[i])
+            enemy.taking_damage = bool(self.taking_damage[i])
+            enemy.damage_applied = bool(self.damage_applied[i])
+            enemy.random_dx = float(self.random_dx[i])
+            enemy.random_dy = float(self.random_dy[i])
+            enemy.direction_timer = int(self.direction_timer[i])
+            enemy.horde = None
+            enemy.horde_index = None
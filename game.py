@@ -1,33 +1,73 @@
-import pygame
-
-from config import COLLECT_MEDECINE, FONT, SCREEN_HEIGHT, SCREEN_WIDTH
+from config import (
+    COLLECT_MEDECINE, HEAL_INFECTED, FONT_SIZE, SCREEN_HEIGHT, SCREEN_WIDTH, SIMULATION_HZ,
+    STREAM_CHUNK_ROOMS, STREAM_ZOMBIES_PER_ROOM
+)
 import draw_minimap
 from infos_hud import InfoHUD
 from player import Player
-from room import draw_portal_if_boss_room, generate_random_grid, clear_all_medicaments_in_rooms, generate_boss_room_for
-import random
+from room import draw_portal_if_boss_room, player_on_portal, clear_all_medicaments_in_rooms, generate_boss_room_for
+from dungeon import DungeonGenerator
+from vision_mask import VisionMaskCache
+from profiler import FrameProfiler
+from transitions import EndSequence
+from prefetch import RoomPrefetcher
+from render_queue import RenderQueue, LAYER_PORTAL, LAYER_FOG, LAYER_HUD
+import enemy_horde
+import sim
+import ui
+
+SIM_STEP_MS = 1000.0 / SIMULATION_HZ
 
 
 class GameManager:
     def __init__(self, settings):
         self.settings = settings
         self.grid = None
+        self.dungeon = None  # Générateur du donjon courant (graine, frontière, salle finale)
         self.current_pos = None
         self.current_room = None
         self.player = None
         self.hud = None
         self.visited_rooms = set()
         self.has_taken_first_med = False
-        self.shadow_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.vision_masks = VisionMaskCache()
+        self.settings.add_vision_listener(self.vision_masks.invalidate)
         self.VISION_RADIUS = self.settings.vision_radius
-        self.total_zombies = random.randint(20, 40)
+        self.seed = None  # Graine maîtresse de la partie (voir sim.py)
+        self.total_zombies = 0  # Tiré à chaque partie
         self.is_portal_active = True
-
-    def init_game(self):
-        self.grid = generate_random_grid(num_rooms=random.randint(8, 12), total_zombies = self.total_zombies)
+        self.horde = None  # Simulation groupée des ennemis (grandes hordes, NumPy)
+        self.previous_room = None
+        self.previous_positions = {}  # Positions avant le dernier pas (interpolation du rendu)
+        self.end_sequence = EndSequence()  # Fondu et bilan après le portail en mode soin
+        self.render_queue = RenderQueue()  # Chaque élément est dessiné une seule fois par frame
+        self.profiler = FrameProfiler()  # Temps par phase de STATE_PLAY (F3 : affichage, F4 : export CSV)
+        self.prefetcher = RoomPrefetcher()  # Salles voisines préparées dans un thread
+        self.live_rooms = set()  # Salles matérialisées : la courante et ses voisines
+        # Les potions préparées gardent le rayon de vision du moment
+        self.settings.add_vision_listener(self.prefetcher.invalidate)
+
+    def init_game(self, seed=None):
+        """Nouvelle partie ; même graine (et mêmes entrées) = même partie."""
+        self.prefetcher.invalidate()
+        self.live_rooms = set()
+        self.seed = sim.seed_all(seed)
+        rng = sim.rng("dungeon")
+        self.total_zombies = rng.randint(20, 40)
+        self.dungeon = DungeonGenerator(rng.getrandbits(32))
+        self.grid = self.dungeon.generate(num_rooms=rng.randint(8, 12), total_zombies=self.total_zombies)
         self.current_pos = (0, 0)
         self.resurrected_count = 0 #Compteur de ressuscités
+        self.end_sequence.reset()
         self.current_room = self.grid[self.current_pos]
+        self.create_player()
+        self.visited_rooms = set()
+        self.enter_room(self.current_pos)
+        self.prefetcher.warm_templates(room.tmx_file for room in self.grid.values())
+        self.has_taken_first_med = False
+
+    def create_player(self):
+        """Joueur et HUD neufs, au centre de l'écran."""
         self.hud = InfoHUD(max_lives=3, current_lives=3)
         self.hud.set_poisoned(True)
         self.player = Player(
@@ -42,12 +82,95 @@ class GameManager:
             throw_spritesheet_path="player/attack_potion.png",
             hud=self.hud
         )
-        self.current_room.generate_contents(self.player, SCREEN_WIDTH, SCREEN_HEIGHT)
-        self.visited_rooms = {self.current_pos}
-        self.has_taken_first_med = False
 
-    def update_player(self, keys):
-        self.player.update(keys, self.current_room)
+    def resume(self, snapshot):
+        """
+        Reprend une partie sauvegardée (savegame.Snapshot) sans regénérer le
+        donjon : les salles relues sont installées telles quelles. Renvoie la quête.
+        """
+        self.prefetcher.invalidate()
+        self.live_rooms = set()
+        self.seed = sim.seed_all(snapshot.seed)
+        sim.advance(snapshot.ticks)
+        self.total_zombies = snapshot.total_zombies
+        self.dungeon = DungeonGenerator.restore(snapshot.dungeon_seed, snapshot.rooms, snapshot.final_room,
+                                                snapshot.dungeon_extensions)
+        self.grid = self.dungeon.grid
+        self.resurrected_count = snapshot.resurrected_count
+        self.is_portal_active = snapshot.is_portal_active
+        self.has_taken_first_med = snapshot.has_taken_first_med
+        self.end_sequence.reset()
+        self.create_player()
+        self.player.health = snapshot.player_health
+        self.hud.meds_collected = snapshot.meds_collected
+        self.player.rect.center = snapshot.player_center
+        self.player.hitbox.center = self.player.rect.center
+        self.visited_rooms = set(snapshot.visited_rooms)
+        self.enter_room(snapshot.current_pos)
+        self.prefetcher.warm_templates(room.tmx_file for room in self.grid.values())
+        return snapshot.quest
+
+    def can_save(self):
+        """Pas de sauvegarde pendant la séquence de fin ni une fois le joueur mort."""
+        return self.grid is not None and not self.end_sequence.active and self.player.health > 0
+
+    def enter_room(self, pos):
+        """
+        Active la salle `pos` (contenu préparé si possible) et prépare ses voisines.
+        Les autres salles sont libérées : elles seront reconstruites depuis leur graine.
+        """
+        self.current_pos = pos
+        self.current_room = self.grid[pos]
+        self.visited_rooms.add(pos)
+        self.prefetcher.activate(self.current_room, self.player)
+        neighbours = self.prefetcher.prefetch_neighbours(self.grid, self.current_room, self.player)
+        keep = {self.current_room, *neighbours}
+        # Les portes des salles libérées peuvent changer en mode sans fin : elles
+        # doivent toutes l'être (en attendant leur préparation) pour rester déterministe
+        stream = STREAM_CHUNK_ROOMS and len(self.grid) - len(self.visited_rooms) < STREAM_CHUNK_ROOMS
+        for room in self.live_rooms - keep:
+            if self.prefetcher.discard(room, wait=stream):
+                room.release()
+            else:
+                keep.add(room)  # encore en préparation, libérée à la prochaine entrée
+        self.live_rooms = keep
+        if stream:
+            self.stream_rooms(STREAM_CHUNK_ROOMS)
+
+    def stream_rooms(self, count):
+        """Agrandit le donjon de `count` salles, loin des salles chargées."""
+        new_rooms = self.dungeon.extend(
+            count, zombies=count * STREAM_ZOMBIES_PER_ROOM, potions=count * STREAM_ZOMBIES_PER_ROOM,
+            protected={room.position for room in self.live_rooms})
+        self.total_zombies += sum(room.nb_enemies_in_room for room in new_rooms)
+
+    def step(self, controls, quest):
+        """
+        Un pas de simulation avec les entrées `controls` (replay.InputState).
+        Renvoie la quête, qui change quand le joueur passe le portail.
+        """
+        profiler = self.profiler
+        if controls.pressed("attack"):
+            self.player.attack(quest)
+        with profiler.phase("update_player"):
+            self.update_player(controls)
+        with profiler.phase("check_player_attack"):
+            self.check_player_attack(quest)
+        with profiler.phase("update_enemies"):
+            self.update_enemies()
+        with profiler.phase("update_medicaments"):
+            self.update_medicaments()
+        with profiler.phase("try_change_room"):
+            self.try_change_room()
+        with profiler.phase("player_on_portal_interact"):
+            if self.player_on_portal_interact(quest, controls):
+                quest = HEAL_INFECTED
+        self.update_end_sequence()
+        sim.advance(SIM_STEP_MS)
+        return quest
+
+    def update_player(self, controls):
+        self.player.update(controls, self.current_room)
 
     def check_player_attack(self, quest=COLLECT_MEDECINE):
         """
@@ -75,8 +198,23 @@ class GameManager:
 
 
     def update_enemies(self):
-        for enemy in self.current_room.enemies:
-            enemy.update(self.current_room)
+        enemies = self.current_room.enemies
+        # Un seul champ de directions par salle, refait quand le joueur change de case
+        if self.current_room.flow_field is not None:
+            self.current_room.flow_field.update(*self.player.hitbox.center)
+        if (enemy_horde.batch_available() and len(enemies) >= enemy_horde.BATCH_MIN_ENEMIES
+                and not any(enemy.is_final_scene for enemy in enemies)):
+            if self.horde is None or not self.horde.matches(enemies):
+                if self.horde is not None:
+                    self.horde.sync_objects()
+                self.horde = enemy_horde.EnemyHorde(enemies, SCREEN_WIDTH, SCREEN_HEIGHT)
+            self.horde.update(self.current_room, self.player)
+        else:
+            if self.horde is not None:
+                self.horde.sync_objects()
+                self.horde = None
+            for enemy in enemies:
+                enemy.update(self.current_room)
         # Mettre à jour l'état dans la salle pour sauvegarder les morts
         if hasattr(self.current_room, "update_enemies_state"):
             self.current_room.update_enemies_state()
@@ -123,11 +261,9 @@ class GameManager:
                     if hasattr(self.current_room, "update_enemies_state"):
                         self.current_room.update_enemies_state()
                     
-                    self.current_pos = new_pos
-                    self.current_room = self.grid[new_pos]
-                    self.visited_rooms.add(new_pos)
-                    self.current_room.generate_contents(self.player, SCREEN_WIDTH, SCREEN_HEIGHT)
+                    # Repositionner d'abord : le préchargement ordonne les voisines depuis le point d'arrivée
                     self.reposition_player(direction)
+                    self.enter_room(new_pos)
                     return True
         return False
 
@@ -148,33 +284,26 @@ class GameManager:
         if hasattr(self.current_room, "update_enemies_state"):
             self.current_room.update_enemies_state()
         
-        self.current_pos = (0, 0)
-        self.current_room = self.grid[self.current_pos]
-        self.current_room.generate_contents(self.player, SCREEN_WIDTH, SCREEN_HEIGHT)
-
-        # Repositionner le joueur au centre
+        # Repositionner le joueur au centre (avant d'ordonner le préchargement des voisines)
         self.player.rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
         self.player.hitbox.center = self.player.rect.center
 
-        # Marquer la salle comme visitée
-        self.visited_rooms.add(self.current_pos)
+        # Activer la salle et la marquer comme visitée
+        self.enter_room((0, 0))
       
-    def player_on_portal_interact(self, quest):
-        keys = pygame.key.get_pressed()
-        interact_pressed = any(keys[key] for key in self.settings.get_control("interact", "keyboard"))
-        if self.player.joystick and not interact_pressed:
-            interact_pressed = any(self.player.joystick.get_button(btn) for btn in self.settings.get_control("interact", "gamepad"))
-
-        if self.is_portal_active:
-            on_portal = draw_portal_if_boss_room(pygame.display.get_surface(), self.current_room, self.player, self.settings)
-        else:
-            on_portal = draw_portal_if_boss_room(pygame.display.get_surface(), self.current_room, self.player, self.settings, is_active = False)
+    def player_on_portal_interact(self, quest, controls):
+        interact_pressed = controls.pressed("interact")
+
+        # Test seul : le portail est dessiné par draw(), pas directement sur l'écran
+        on_portal = player_on_portal(self.current_room, self.player, self.is_portal_active)
 
         if on_portal and interact_pressed:
             if quest == COLLECT_MEDECINE:
-                # Mode normal : téléportation au départ
-                self.teleport_to_start()
+                # Mode normal : téléportation au départ, potions retirées de toutes les salles
+                # (avant la téléportation, pour que rien de périmé ne soit préparé)
+                self.prefetcher.invalidate()
                 clear_all_medicaments_in_rooms(self.grid)
+                self.teleport_to_start()
                 return True
             else:  
                 self.is_portal_active = False
@@ -183,17 +312,19 @@ class GameManager:
                 from enemy import Enemy
 
                 # Trouver la salle finale
-                final_room = next((room for room in self.grid.values() if getattr(room, "is_final", False)), None)
+                final_room = self.dungeon.final_room
                 if final_room:
+                    self.prefetcher.invalidate()
                     # Régénérer la salle du boss
                     generate_boss_room_for(final_room, self.grid)
 
                     self.player.make_invisible_and_immobile()  # 3 sec d'invisibilité et immobilité
 
                     # Générer les ressuscités
+                    rng = sim.rng("game")
                     for _ in range(self.resurrected_count):
-                        x = random.randint(50, SCREEN_WIDTH - 50)
-                        y = random.randint(50, SCREEN_HEIGHT - 50)
+                        x = rng.randint(50, SCREEN_WIDTH - 50)
+                        y = rng.randint(50, SCREEN_HEIGHT - 50)
                         human = Enemy(
                             x, y, self.player,
                             SCREEN_WIDTH, SCREEN_HEIGHT,
@@ -206,104 +337,74 @@ class GameManager:
                         final_room.enemies.append(human)
 
                     # ⏱️ Lancer le compte à rebours (10 sec)
-                    self.end_timer = pygame.time.get_ticks()
-                    self.show_end_message = False
+                    self.end_sequence.start(sim.ticks())
 
                 return True
 
         return False
 
-    def draw_end_sequence(self, surface):
-        """Affiche le fondu noir et le message de fin après 10s, puis retourne True après 5s de message."""
-        if hasattr(self, "end_timer"):
-            elapsed = pygame.time.get_ticks() - self.end_timer
-
-            # Étape 1 : après 5 sec → afficher fondu + texte
-            if elapsed > 5000:
-                fade = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-                fade.fill((0, 0, 0))
-                fade.set_alpha(220)
-                surface.blit(fade, (0, 0))
-
-                # Texte du message final
-                font = pygame.font.SysFont("Arial", 32, bold=True)
-                saved = self.resurrected_count
-                perished = max(0,  - self.resurrected_count)
-                win = False
-                
-                if saved == self.total_zombies:
-                    lines = [
-                        "Félicitations !",
-                        "Vous avez sauvés toutes les personnes infectées.",
-                        f"Vous êtes un grand médecin !"
-                    ]
-                    win = True
-                elif saved < self.total_zombies :
-                    lines = [
-                        f"{self.total_zombies-saved} personnes ont péri par votre faute.",
-                        "Réessayez pour sauver plus de personnes."
-                    ]
-                else:
-                    lines = [
-                        "Réessayez pour sauver plus de personnes."
-                    ]
-
-                y = SCREEN_HEIGHT // 2 - len(lines) * 20
-                for line in lines:
-                    text_surf = font.render(line, True, (255, 255, 255))
-                    rect = text_surf.get_rect(center=(SCREEN_WIDTH // 2, y))
-                    surface.blit(text_surf, rect)
-                    y += 50
-
-                # Étape 2 : attendre 5 sec supplémentaires avant retour
-                if elapsed > 10000:  
-                    return win  # ✅ Signale à main() que la séquence de fin est terminée
-
-        return None
-
+    def update_end_sequence(self):
+        """Fait avancer la séquence de fin (une fois par pas) ; True/False une fois terminée, sinon None."""
+        return self.end_sequence.update(sim.ticks(), self.resurrected_count, self.total_zombies)
 
+    def save_previous_positions(self):
+        """Mémorise la position affichée des entités avant un pas de simulation."""
+        self.previous_room = self.current_room
+        self.previous_positions = {
+            entity: entity.rect.topleft for entity in [self.player, *self.current_room.enemies]
+        }
 
-        
-    def draw(self, surface, quest):
-        self.current_room.draw(surface)
-        self.current_room.draw_contents(surface)
-        if self.is_portal_active:
-            draw_portal_if_boss_room(surface, self.current_room, self.player, self.settings)
-        else:
-            draw_portal_if_boss_room(surface, self.current_room, self.player, self.settings, is_active = False)
-
-        self.player.draw(surface)
-
-        for enemy in self.current_room.enemies:
-            enemy.draw(surface)
-
-        for med in self.current_room.medicaments:
-            med.draw(surface)
-
-        vision_radius = self.settings.vision_radius
-        if quest == COLLECT_MEDECINE:
-            self.shadow_surface.fill((0, 0, 0, 255))
-            for r in range(vision_radius, 0, -2):
-                t = r / vision_radius
-                alpha = int(255 * (1 - (1 - t) ** 3))
-                pygame.draw.circle(self.shadow_surface, (0, 0, 0, alpha), self.player.rect.center, r)
-        else:
-            self.shadow_surface.fill((0, 82, 0, 255))
-            for r in range(vision_radius, 0, -2):
-                t = r / vision_radius
-                alpha = int(255 * (1 - (1 - t) ** 3))
-                pygame.draw.circle(self.shadow_surface, (0, 82, 0, alpha), self.player.rect.center, r)
-
-        surface.blit(self.shadow_surface, (0, 0))
-        draw_minimap.draw_minimap(surface, self.grid, self.current_pos, self.visited_rooms)
+    def apply_interpolation(self, alpha):
+        """
+        Place les rects d'affichage entre la position précédente et la position
+        courante (alpha entre 0 et 1). Renvoie de quoi restaurer les positions.
+        Pas d'interpolation après un changement de salle ou un déplacement brusque.
+        """
+        restore = []
+        if alpha >= 1 or self.previous_room is not self.current_room:
+            return restore
+        for entity, (px, py) in self.previous_positions.items():
+            cx, cy = entity.rect.topleft
+            if (px, py) == (cx, cy) or abs(cx - px) > 64 or abs(cy - py) > 64:
+                continue
+            restore.append((entity.rect, (cx, cy)))
+            entity.rect.topleft = (round(px + (cx - px) * alpha), round(py + (cy - py) * alpha))
+        return restore
+
+    def submit_world(self, queue):
+        """Salle (tuiles, ennemis, potions) et joueur."""
+        self.current_room.submit(queue)
+        self.player.submit(queue)
+
+    def submit_hud(self, queue):
+        """Minimap et vies."""
         self.hud.set_lives(self.player.health)
-        self.hud.draw(surface)
+        queue.call(LAYER_HUD, lambda surface: draw_minimap.draw_minimap(surface, self.grid, self.current_pos, self.visited_rooms))
+        queue.call(LAYER_HUD, self.hud.draw)
+
+    def draw(self, surface, quest, alpha=1.0):
+        restore = self.apply_interpolation(alpha)
+        queue = self.render_queue
+        self.submit_world(queue)
+        queue.call(LAYER_PORTAL, lambda surface: draw_portal_if_boss_room(
+            surface, self.current_room, self.player, self.settings, is_active=self.is_portal_active))
+
+        # Masque de vision pré-calculé (noir en collecte, vert en soin)
+        tint = (0, 0, 0) if quest == COLLECT_MEDECINE else (0, 82, 0)
+        queue.call(LAYER_FOG, lambda surface: self.vision_masks.draw(
+            surface, self.player.rect.center, self.settings.vision_radius, tint))
+        self.submit_hud(queue)
 
         if self.current_pos == (0, 0) and not self.has_taken_first_med:
-            message = FONT.render("Récupérez la potion pour continuer !", True, (255, 0, 0))
-            surface.blit(message, (SCREEN_WIDTH // 2 - message.get_width() // 2, 20))
+            message = ui.render_text(ui.default_font(FONT_SIZE), "Récupérez la potion pour continuer !", (255, 0, 0))
+            queue.blit(LAYER_HUD, message, (SCREEN_WIDTH // 2 - message.get_width() // 2, 20))
 
         # 🔹 Dessiner la séquence de fin si timer actif
-        self.draw_end_sequence(surface)
+        queue.call(LAYER_HUD, self.end_sequence.draw)
+        queue.call(LAYER_HUD, self.profiler.draw)
+        queue.flush(surface)
+
+        for rect, position in restore:
+            rect.topleft = position
 
 
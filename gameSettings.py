@@ -1,4 +1,5 @@
 import pygame
+import audio
 from config import DEFAULT_CONTROLS
 
 class GameSettings:
@@ -13,8 +14,18 @@ class GameSettings:
         self.music_on = True
         self.music_volume = 0.5
         self.vision_radius = 300  # Valeur par défaut
+        self.vision_listeners = []  # Appelés quand le rayon de vision change
+
     def set_vision_radius(self, radius):
-        self.vision_radius = max(100, min(600, int(radius)))
+        new_radius = max(100, min(600, int(radius)))
+        if new_radius != self.vision_radius:
+            self.vision_radius = new_radius
+            for callback in self.vision_listeners:
+                callback()
+
+    def add_vision_listener(self, callback):
+        """Enregistre une fonction appelée à chaque changement du rayon de vision."""
+        self.vision_listeners.append(callback)
 
     def get_vision_radius(self):
         return self.vision_radius
@@ -41,11 +52,7 @@ class GameSettings:
     def toggle_music(self):
         """Active/désactive la musique."""
         self.music_on = not self.music_on
-        if self.music_on:
-            pygame.mixer.music.play(loops=-1)
-            pygame.mixer.music.set_volume(self.music_volume)
-        else:
-            pygame.mixer.music.stop()
+        audio.set_music(self.music_on, self.music_volume)
     
     def set_volume(self, volume):
         """Modifie le volume de la musique."""
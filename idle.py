@@ -0,0 +1,43 @@
+import pygame
+from config import IDLE_WAIT_MS
+
+
+class IdleScheduler:
+    """
+    Rythme des écrans statiques (menus, pause, crédits, didacticiel).
+    Tant qu'une animation tourne, la boucle reste à pleine cadence ; ensuite
+    elle attend les événements (pygame.event.wait avec délai) et ne redessine
+    qu'après une entrée ou un changement d'écran.
+    """
+    def __init__(self, timeout=IDLE_WAIT_MS):
+        self.timeout = timeout
+        self.state = None
+        self.dirty = True
+
+    def request_redraw(self):
+        self.dirty = True
+
+    def should_draw(self, state, animating=False):
+        """True si l'écran `state` doit être redessiné à cette itération."""
+        if state != self.state:
+            self.state = state
+            self.dirty = True
+        draw = self.dirty or animating
+        self.dirty = False
+        return draw
+
+    def poll(self, clock, animating=False):
+        """
+        Événements en attente. Sans animation, bloque jusqu'au prochain
+        événement (ou au délai) au lieu de tourner à vide.
+        """
+        if animating:
+            events = pygame.event.get()
+        else:
+            event = pygame.event.wait(self.timeout)
+            # Le temps passé à attendre ne doit pas compter comme une frame (pas de rattrapage en jeu)
+            clock.tick()
+            events = [] if event.type == pygame.NOEVENT else [event] + pygame.event.get()
+        if any(event.type != pygame.MOUSEMOTION for event in events):
+            self.dirty = True
+        return events
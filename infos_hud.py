@@ -1,28 +1,10 @@
 import pygame
-import random
-
-class PoisonParticle:
-    """Particule animée de poison autour d'un cœur vide."""
-    def __init__(self, x, y):
-        self.x = x + random.randint(-5, 5)
-        self.y = y + random.randint(-5, 5)
-        self.radius = random.randint(2, 5)
-        self.color = (100, 255, 120)  # Vert toxique
-        self.dx = random.uniform(-0.5, 0.5)
-        self.dy = random.uniform(-0.8, -0.3)
-        self.life = random.randint(18, 35)
-
-    def update(self):
-        self.x += self.dx
-        self.y += self.dy
-        self.radius *= 0.96
-        self.life -= 1
-
-    def is_alive(self):
-        return self.life > 0 and self.radius > 0.8
-
-    def draw(self, surface):
-        pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), int(self.radius))
+import ui
+from particles import ParticlePool
+
+# Poison autour des cœurs vides : ~2 particules par frame vivant au plus 35 frames
+POISON_COLOR = (100, 255, 120)  # Vert toxique
+POISON_POOL_SIZE = 80
 
 class InfoHUD:
     """
@@ -33,10 +15,10 @@ class InfoHUD:
         self.lives_left = current_lives if current_lives is not None else max_lives
         self.meds_collected = 0
         self.poisoned = False  # Active l'effet sur les cœurs vides
-        self.font = pygame.font.SysFont(None, 32)
+        self.font = ui.default_font(22)  # Taille rendue de l'ancien SysFont(None, 32)
         self.heart_full_color = (220, 20, 60)
         self.heart_empty_color = (50, 205, 50)
-        self.poison_particles = [[] for _ in range(self.max_lives)]
+        self.poison_particles = ParticlePool(POISON_POOL_SIZE * self.max_lives, POISON_COLOR)
 
     def set_lives(self, lives):
         self.lives_left = max(0, min(lives, self.max_lives))
@@ -69,17 +51,15 @@ class InfoHUD:
 
             # Effet poison UNIQUEMENT sur les coeurs manquants (vides)
             if self.poisoned and i >= self.lives_left:
-                # Nettoyage des particules mortes
-                self.poison_particles[i] = [p for p in self.poison_particles[i] if p.is_alive()]
                 # Génération de nouvelles particules chaque frame (densité effet poison)
-                for _ in range(2):
-                    self.poison_particles[i].append(PoisonParticle(x, y + 15))
-                # Animation et affichage des particules
-                for p in self.poison_particles[i]:
-                    p.update()
-                    p.draw(screen)
-
-        txt = self.font.render(f"Potions : {self.meds_collected}", True, (255,255,255))
+                self.poison_particles.emit(x, y + 15, 2)
+
+        # Animation et affichage groupés de toutes les particules (réserve fixe, sans allocation)
+        if self.poisoned:
+            self.poison_particles.update()
+            self.poison_particles.draw(screen)
+
+        txt = ui.render_text(self.font, f"Potions : {self.meds_collected}", (255,255,255))
         screen.blit(txt, (30, 70))
 
     def draw_heart(self, surface, x, y, size, color):
@@ -95,5 +75,5 @@ class InfoHUD:
         self.lives_left = self.max_lives
         self.meds_collected = 0
         self.poisoned = False
-        self.poison_particles = [[] for _ in range(self.max_lives)]
+        self.poison_particles.clear()
 
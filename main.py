@@ -1,47 +1,20 @@
+import boot  # En premier : mesure l'import de pygame (voir StartupTimeline)
 import pygame
-from draw_minimap import draw_minimap
-from game import GameManager
-from infos_hud import InfoHUD
-from portail import Portail
-from room import generate_random_grid, draw_portal_if_boss_room
-from player import Player
-from menu import Menu, init_menus
+import audio
+from idle import IdleScheduler
+from transitions import FadeTransition
+from replay import InputState, Recording, state_hash
+import time
+import argparse
 import sys
 from pygame.locals import *
 from config import (
-    SCREEN_WIDTH, SCREEN_HEIGHT,
-    MINIMAP_SCALE, MINIMAP_MARGIN,
     STATE_MENU, STATE_PLAY, STATE_PAUSE, STATE_GAME_OVER, STATE_BACK, STATE_VICTORY, STATE_OPTIONS,
-    FONT,
-    COLLECT_MEDECINE, HEAL_INFECTED
+    COLLECT_MEDECINE,
+    SIMULATION_HZ, MAX_SIMULATION_STEPS, RENDER_FPS, MENU_FPS, SAVE_FILE
 )
 from gameSettings import GameSettings
 
-pygame.init()
-
-pygame.joystick.init()
-for i in range(pygame.joystick.get_count()):
-    pygame.joystick.Joystick(i).init()
-
-# --- plein écran natif ---
-info = pygame.display.Info()
-screen = pygame.display.set_mode((info.current_w, info.current_h))
-pygame.display.set_caption("Contagium")
-
-# surface logique du jeu
-game_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-
-# coordonnées pour centrer la surface logique sur l’écran
-center_x = (info.current_w - SCREEN_WIDTH) // 2
-center_y = (info.current_h - SCREEN_HEIGHT) // 2
-
-clock = pygame.time.Clock()
-
-# Musique
-pygame.mixer.music.load("bruitages/medieval-ambient-236809.mp3")
-pygame.mixer.music.set_volume(0.5)
-pygame.mixer.music.play(loops=-1)
-
         
         
     # --- fonctions utilitaires pile ---
@@ -55,71 +28,111 @@ def pop_state(stack, fallback=STATE_MENU):
     return stack[-1] if stack else fallback
 
 # --- boucle principale ---
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Contagium")
+    parser.add_argument("--record", metavar="FICHIER",
+                        help="enregistre graine et entrées de chaque partie (rejeu : python replay.py FICHIER)")
+    parser.add_argument("--save", metavar="FICHIER", default=SAVE_FILE,
+                        help=f"fichier d'autosauvegarde (défaut : {SAVE_FILE})")
+    parser.add_argument("--resume", action="store_true", help="reprendre la partie sauvegardée")
+    parser.add_argument("--timeline", action="store_true", help="affiche la durée de chaque phase du démarrage")
+    args = parser.parse_args(argv)
+    recording = None  # Partie en cours d'enregistrement
+
+    def save_recording():
+        nonlocal recording
+        if recording is not None:
+            print("Partie enregistrée dans", recording.save(args.record), f"({len(recording)} pas)")
+            recording = None
+
+    # Démarrage par phases derrière l'écran de chargement (voir boot.py)
     settings = GameSettings()
+    startup = boot.Boot(settings).run()
+    if args.timeline:
+        print(startup.timeline.report())
+    presenter = startup.presenter
+    game_surface = startup.surface
+    menus = startup.menus
+    game_manager = startup.game_manager
+    clock = pygame.time.Clock()
+    from savegame import Snapshot, SnapshotWriter  # Importé avec les salles (phase "modules")
+
     quest = COLLECT_MEDECINE
-    menus = init_menus(settings)
-    game_manager = GameManager(settings)
     running = True
 
     # pile contenant toujours l’état courant en dernière position
     state_stack = [STATE_MENU]
 
-    fade_start_time = None
-    fade_duration = 5000
+    # Autosauvegarde à chaque changement de salle, à la pause et en quittant (écriture dans un thread)
+    saver = SnapshotWriter()
+
+    def autosave():
+        if state_stack[-1] in (STATE_PLAY, STATE_PAUSE) and game_manager.can_save():
+            saver.save(args.save, game_manager, quest)
+
+    if args.resume:
+        try:
+            snapshot = Snapshot.load(args.save)
+        except (OSError, ValueError) as e:
+            print("Reprise impossible :", e)
+        else:
+            start = time.perf_counter()
+            quest = game_manager.resume(snapshot)
+            print(f"Partie reprise depuis {args.save} ({snapshot.size} octets, {len(snapshot.rooms)} salles) : "
+                  f"lecture {snapshot.load_ms:.2f} ms, reprise {(time.perf_counter() - start) * 1000:.1f} ms")
+            state_stack = [STATE_PLAY]
+
+    # Fondu vers le game over : scène capturée une fois puis assombrie
+    fade = FadeTransition(duration=5000)
+
+    # Simulation à pas fixe : le temps réel s'accumule et est consommé par pas constants
+    sim_step = 1000.0 / SIMULATION_HZ
+    accumulator = 0.0
+
+    # Écrans statiques : attente des événements une fois les animations finies
+    idle = IdleScheduler()
+
+    # Attaque demandée par un événement, appliquée au prochain pas de simulation
+    attack_requested = False
 
     while running:
-        dt = clock.tick(60)
         state = state_stack[-1]     # état actif
+        dt = clock.tick(RENDER_FPS if state == STATE_PLAY else MENU_FPS)
+        if state != STATE_PLAY:
+            accumulator = 0.0
 
         # ----------- Transition de fade -----------
         if state == "FADE_TO_GAME_OVER":
-            if fade_start_time is None:
-                fade_start_time = pygame.time.get_ticks()
-            elapsed = pygame.time.get_ticks() - fade_start_time
-
-            game_surface.fill((0, 0, 0))
-            game_manager.current_room.draw(game_surface)
-            game_manager.current_room.draw_contents(game_surface)
-            game_surface.blit(game_manager.player.image, game_manager.player.rect)
-            for enemy in game_manager.current_room.enemies:
-                enemy.draw(game_surface)
-            for med in game_manager.current_room.medicaments:
-                med.draw(game_surface)
-
-            draw_minimap(game_surface, game_manager.grid, game_manager.current_pos, game_manager.visited_rooms)
-            game_manager.hud.set_lives(game_manager.player.health)
-            game_manager.hud.draw(game_surface)
-
-            alpha = min(255, int(255 * (elapsed / fade_duration)))
-            fade_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            fade_surface.set_alpha(alpha)
-            fade_surface.fill((0, 0, 0))
-            game_surface.blit(fade_surface, (0, 0))
-
-            screen.fill((0, 0, 0))
-            screen.blit(game_surface, (center_x, center_y))
-            pygame.display.flip()
-
-            if elapsed >= fade_duration:
+            if not fade.active:
+                def draw_scene(surface):
+                    game_manager.submit_world(game_manager.render_queue)
+                    game_manager.submit_hud(game_manager.render_queue)
+                    game_manager.render_queue.flush(surface)
+                fade.start(pygame.time.get_ticks(), draw_scene)
+
+            finished = fade.draw(game_surface, pygame.time.get_ticks())
+            presenter.present(game_surface)
+
+            if finished:
                 state_stack[-1] = STATE_GAME_OVER
-                fade_start_time = None
+                fade.reset()
             continue
 
 
         # ----------- Menus & sous-menus -----------
         if state in [STATE_MENU, STATE_PAUSE, STATE_OPTIONS, STATE_GAME_OVER, STATE_VICTORY, "CONTROLS"]:
-            game_surface.fill((0, 0, 0))
-            if state in menus and hasattr(menus[state], "update"):
-                menus[state].update(dt)
-            if state in menus:
-                menus[state].draw(game_surface)
-
-            screen.fill((0, 0, 0))
-            screen.blit(game_surface, (center_x, center_y))
-            pygame.display.flip()
-
-            for event in pygame.event.get():
+            animating = state in menus and hasattr(menus[state], "is_animating") and menus[state].is_animating()
+            if idle.should_draw(state, animating):
+                game_surface.fill((0, 0, 0))
+                if state in menus and hasattr(menus[state], "update"):
+                    menus[state].update(dt)
+                if state in menus:
+                    menus[state].draw(game_surface)
+
+                presenter.present(game_surface)
+
+            for event in idle.poll(clock, animating):
+                presenter.handle_event(event)
                 if event.type == QUIT:
                     running = False
 
@@ -131,9 +144,12 @@ def main():
                 elif action == STATE_PLAY:
                     # Si on lance une partie depuis le menu principal ou le game over
                     if state in [STATE_MENU, STATE_GAME_OVER]:
+                        save_recording()
                         game_manager.init_game()
-                        if hasattr(game_manager, "end_timer"):
-                            del game_manager.end_timer
+                        quest = COLLECT_MEDECINE
+                        attack_requested = False
+                        if args.record:
+                            recording = Recording(game_manager.seed, settings.vision_radius)
                         state_stack = [STATE_PLAY]   # on remplace la pile par PLAY
                     else:
                         state_stack[-1] = STATE_PLAY
@@ -153,14 +169,14 @@ def main():
 
         # ----------- Menu crédits séparé -----------
         elif state == "CREDITS":
-            game_surface.fill((0, 0, 0))
             from menu import draw_credits_menu, handle_credits_event
-            draw_credits_menu(game_surface)
-            screen.fill((0, 0, 0))
-            screen.blit(game_surface, (center_x, center_y))
-            pygame.display.flip()
+            if idle.should_draw(state):
+                game_surface.fill((0, 0, 0))
+                draw_credits_menu(game_surface)
+                presenter.present(game_surface)
 
-            for event in pygame.event.get():
+            for event in idle.poll(clock):
+                presenter.handle_event(event)
                 if event.type == QUIT:
                     running = False
                 action = handle_credits_event(event)
@@ -169,14 +185,14 @@ def main():
 
         # ----------- Menu didacticiel séparé -----------
         elif state == "TUTORIAL":
-            game_surface.fill((0, 0, 0))
             from menu import draw_tutorial_menu, handle_tutorial_event
-            draw_tutorial_menu(game_surface)
-            screen.fill((0, 0, 0))
-            screen.blit(game_surface, (center_x, center_y))
-            pygame.display.flip()
+            if idle.should_draw(state):
+                game_surface.fill((0, 0, 0))
+                draw_tutorial_menu(game_surface)
+                presenter.present(game_surface)
 
-            for event in pygame.event.get():
+            for event in idle.poll(clock):
+                presenter.handle_event(event)
                 if event.type == QUIT:
                     running = False
                 action = handle_tutorial_event(event)
@@ -185,53 +201,81 @@ def main():
 
         # ----------- Jeu en cours -----------
         elif state == STATE_PLAY:
-            for event in pygame.event.get():
+            profiler = game_manager.profiler
+            profiler.begin_frame()
+            with profiler.phase("input"):
+                events = pygame.event.get()
+            for event in events:
+                presenter.handle_event(event)
                 if event.type == QUIT:
                     running = False
                 elif event.type == KEYDOWN and event.key == K_ESCAPE:
+                    autosave()
                     push_state(state_stack, STATE_PAUSE)
+                elif event.type == KEYDOWN and event.key == K_F3:
+                    profiler.toggle()
+                elif event.type == KEYDOWN and event.key == K_F4:
+                    print("Mesures exportées dans", profiler.dump_csv())
                 elif event.type == KEYDOWN and event.key in settings.get_control("attack", "keyboard"):
-                    if quest == COLLECT_MEDECINE:
-                        game_manager.player.attack(COLLECT_MEDECINE)
-                    else:
-                        game_manager.player.attack(HEAL_INFECTED)
+                    attack_requested = True
                 elif event.type == JOYBUTTONDOWN and event.button in settings.get_control("attack", "gamepad"):
-                    if quest == COLLECT_MEDECINE:
-                        game_manager.player.attack(COLLECT_MEDECINE)
-                    else:
-                        game_manager.player.attack(HEAL_INFECTED)
-
-            keys = pygame.key.get_pressed()
-            game_manager.update_player(keys)
-            game_manager.check_player_attack(quest)
-            game_manager.update_enemies()
-            game_manager.update_medicaments()
-            game_manager.try_change_room()
-
-            if game_manager.player_on_portal_interact(quest):
-                quest = HEAL_INFECTED
-
-            if game_manager.draw_end_sequence(screen) == True:
+                    attack_requested = True
+
+            # Pas de simulation fixes, avec un plafond de rattrapage après un pic
+            accumulator += dt
+            steps = 0
+            room_before = game_manager.current_room
+            while accumulator >= sim_step and steps < MAX_SIMULATION_STEPS:
+                game_manager.save_previous_positions()
+                # Toute la simulation passe par les entrées du pas (enregistrables, voir replay.py)
+                with profiler.phase("input"):
+                    controls = InputState.capture(settings, game_manager.player.joystick, attack_requested)
+                attack_requested = False
+                quest = game_manager.step(controls, quest)
+                if recording is not None:
+                    recording.record(controls, state_hash(game_manager))
+
+                accumulator -= sim_step
+                steps += 1
+            if steps == MAX_SIMULATION_STEPS:
+                accumulator = min(accumulator, sim_step)
+            if game_manager.current_room is not room_before:
+                autosave()
+            # Volume et balance des sons en cours selon la position du joueur
+            audio.update(game_manager.player.hitbox.center)
+
+            end_result = game_manager.end_sequence.result
+            if end_result is True:
                 state_stack[-1] = STATE_VICTORY
                 quest = COLLECT_MEDECINE
-            
-            if game_manager.draw_end_sequence(screen) == False:
+                save_recording()
+                saver.discard(args.save)
+            elif end_result is False:
                 state_stack[-1] = "FADE_TO_GAME_OVER"
                 quest = COLLECT_MEDECINE
+                save_recording()
+                saver.discard(args.save)
 
             if game_manager.player.health <= 0:
                 state_stack[-1] = "FADE_TO_GAME_OVER"
                 quest = COLLECT_MEDECINE
-                fade_start_time = None
-
-            game_surface.fill((0, 0, 0))
-            game_manager.draw(game_surface, quest)
-
-            screen.fill((0, 0, 0))
-            screen.blit(game_surface, (center_x, center_y))
-            pygame.display.flip()
-
-    pygame.quit()
+                fade.reset()
+                save_recording()
+                saver.discard(args.save)
+
+            # Rendu interpolé entre les deux derniers pas de simulation
+            with profiler.phase("draw"):
+                game_surface.fill((0, 0, 0))
+                game_manager.draw(game_surface, quest, alpha=accumulator / sim_step)
+
+            with profiler.phase("display_flip"):
+                presenter.present(game_surface)
+            profiler.end_frame()
+
+    save_recording()
+    autosave()
+    saver.shutdown()
+    startup.shutdown()
     sys.exit()
 
 
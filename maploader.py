@@ -1,40 +1,218 @@
 import os
+import threading
+
 import pygame
 import pytmx
 
 from config import SCREEN_HEIGHT, SCREEN_WIDTH
+from navigation import NavGrid
+from spatial_index import SpatialGrid
+
+
+# Cache global des templates TMX : chemin absolu -> MapTemplate
+_template_cache = {}
+_template_cache_stats = {"hits": 0, "misses": 0}
+# Les salles peuvent être chargées depuis le thread de préchargement : un verrou
+# pour le cache, un par fichier pour ne pas parser deux fois le même TMX
+_template_lock = threading.Lock()
+_file_locks = {}
+
+
+class MapTemplate:
+    """
+    Données d'un fichier TMX partagées entre toutes les salles qui l'utilisent.
+    À considérer en lecture seule : tmx_data, obstacles, grille de navigation
+    et calques pré-rendus sont communs à toutes les salles construites sur le même fichier.
+    """
+    def __init__(self, tmx_file, mtime):
+        self.tmx_file = tmx_file
+        self.mtime = mtime
+        self.tmx_data = pytmx.load_pygame(tmx_file)
+        self.width = self.tmx_data.width * self.tmx_data.tilewidth
+        self.height = self.tmx_data.height * self.tmx_data.tileheight
+        self.obstacles = tuple(self._load_obstacles())
+        self.obstacle_grid = SpatialGrid(self.obstacles)
+        # Les entités restent dans l'écran, parfois un peu plus grand que la map
+        self.nav_grid = (NavGrid(self.obstacles, max(self.width, SCREEN_WIDTH), max(self.height, SCREEN_HEIGHT))
+                         if self.obstacles else None)
+        self._baked_layers = None  # Cache de rendu des calques de tuiles
+        self._baked_visibility = None
+        self._bake_lock = threading.Lock()  # Le pré-rendu peut aussi se faire dans le thread de préchargement
+
+    def _load_obstacles(self):
+        obstacles = []
+        for layer in self.tmx_data.layers:
+            if isinstance(layer, pytmx.TiledObjectGroup):
+                for obj in layer:
+                    rect = pygame.Rect(obj.x, obj.y, obj.width, obj.height)
+                    obstacles.append(rect)
+        return obstacles
+
+    def invalidate_cache(self):
+        """Oublie les calques pré-rendus."""
+        self._baked_layers = None
+        self._baked_visibility = None
+
+    def _visibility_key(self):
+        return tuple(bool(layer.visible) for layer in self.tmx_data.layers)
+
+    def _new_bake_surface(self, opaque):
+        """Crée une surface de la taille de la map pour y composer des tuiles."""
+        if opaque:
+            surf = pygame.Surface((self.width, self.height))
+            surf.fill((0, 0, 0))
+            return surf.convert() if pygame.display.get_surface() else surf
+        surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        return surf.convert_alpha() if pygame.display.get_surface() else surf
+
+    def _bake_layers(self):
+        """
+        Compose les calques de tuiles visibles en un minimum de surfaces.
+        Les tuiles animées ne sont pas cuites : elles coupent la pile en
+        plusieurs surfaces pour conserver l'ordre d'affichage des calques.
+        Renvoie une liste d'éléments ("static", surface) ou ("animated", tuiles).
+        """
+        tmx_data = self.tmx_data
+        tw, th = tmx_data.tilewidth, tmx_data.tileheight
+        baked = []
+        current = None
+        for layer in tmx_data.visible_layers:
+            if not isinstance(layer, pytmx.TiledTileLayer):
+                continue
+            animated = []
+            for x, y, gid in layer.iter_data():
+                if not gid:
+                    continue
+                props = tmx_data.get_tile_properties_by_gid(gid)
+                frames = props.get("frames") if props else None
+                if frames:
+                    images = [tmx_data.get_tile_image_by_gid(f.gid) for f in frames]
+                    durations = [max(1, f.duration) for f in frames]
+                    animated.append(((x * tw, y * th), images, durations, sum(durations)))
+                    continue
+                tile = tmx_data.get_tile_image_by_gid(gid)
+                if tile:
+                    if current is None:
+                        current = self._new_bake_surface(opaque=not baked)
+                    current.blit(tile, (x * tw, y * th))
+            if animated:
+                if current is not None:
+                    baked.append(("static", current))
+                    current = None
+                baked.append(("animated", animated))
+        if current is not None:
+            baked.append(("static", current))
+        return baked
+
+    def bake(self):
+        """Pré-rend les calques si besoin et renvoie le cache (sûr depuis un autre thread)."""
+        visibility = self._visibility_key()
+        with self._bake_lock:
+            if self._baked_layers is None or visibility != self._baked_visibility:
+                self._baked_layers = self._bake_layers()
+                self._baked_visibility = visibility
+            return self._baked_layers
+
+    def draw(self, surface):
+        """Dessine les calques de tuiles à partir du cache (pré-rendu au premier appel)."""
+        now = None
+        for kind, content in self.bake():
+            if kind == "static":
+                surface.blit(content, (0, 0))
+                continue
+            if now is None:
+                now = pygame.time.get_ticks()
+            for pos, images, durations, total in content:
+                t = now % total
+                for image, duration in zip(images, durations):
+                    if t < duration:
+                        if image:
+                            surface.blit(image, pos)
+                        break
+                    t -= duration
+
+
+def load_template(tmx_file):
+    """
+    Renvoie le MapTemplate du fichier, en ne le parsant qu'une fois par processus.
+    Le fichier est rechargé si sa date de modification a changé.
+    """
+    path = os.path.abspath(tmx_file)
+    mtime = os.path.getmtime(path)
+    with _template_lock:
+        template = _template_cache.get(path)
+        if template is not None and template.mtime == mtime:
+            _template_cache_stats["hits"] += 1
+            return template
+        file_lock = _file_locks.setdefault(path, threading.Lock())
+    with file_lock:
+        with _template_lock:
+            template = _template_cache.get(path)
+            if template is not None and template.mtime == mtime:
+                _template_cache_stats["hits"] += 1
+                return template
+        template = MapTemplate(path, mtime)
+        with _template_lock:
+            _template_cache_stats["misses"] += 1
+            _template_cache[path] = template
+        return template
+
+
+def get_template_cache_stats():
+    """Compteurs du cache de templates : hits, misses et nombre de fichiers chargés."""
+    return {**_template_cache_stats, "templates": len(_template_cache)}
+
+
+def clear_template_cache():
+    """Vide le cache de templates et remet les compteurs à zéro."""
+    _template_cache.clear()
+    _template_cache_stats["hits"] = 0
+    _template_cache_stats["misses"] = 0
 
 
 class MapLoader:
-    """Charge un fichier TMX et extrait les obstacles."""
+    """Charge un fichier TMX (via le cache de templates) et extrait les obstacles."""
     def __init__(self):
+        self.template = None
         self.tmx_data = None
         self.width = 0
         self.height = 0
         self.obstacles = []
+        self.obstacle_grid = SpatialGrid([])
+        self.nav_grid = None  # Cases praticables (None : pas d'obstacles)
 
     def load(self, tmx_file):
         """Charge le TMX uniquement si le fichier existe."""
         if not tmx_file or not os.path.exists(tmx_file):
+            self.template = None
             self.tmx_data = None
             self.obstacles = []
+            self.obstacle_grid = SpatialGrid([])
+            self.nav_grid = None
             self.width = SCREEN_WIDTH
             self.height = SCREEN_HEIGHT
             return
 
-        self.tmx_data = pytmx.load_pygame(tmx_file)
-        self.width = self.tmx_data.width * self.tmx_data.tilewidth
-        self.height = self.tmx_data.height * self.tmx_data.tileheight
-        self.obstacles = self._load_obstacles()
+        self.template = load_template(tmx_file)
+        self.tmx_data = self.template.tmx_data
+        self.width = self.template.width
+        self.height = self.template.height
+        # Liste propre à la salle, les Rect restent ceux du template
+        self.obstacles = list(self.template.obstacles)
+        self.obstacle_grid = self.template.obstacle_grid
+        self.nav_grid = self.template.nav_grid
 
-    def _load_obstacles(self):
-        obstacles = []
-        if not self.tmx_data:
-            return obstacles
-        for layer in self.tmx_data.layers:
-            if isinstance(layer, pytmx.TiledObjectGroup):
-                for obj in layer:
-                    rect = pygame.Rect(obj.x, obj.y, obj.width, obj.height)
-                    obstacles.append(rect)
-        return obstacles
+    def invalidate_cache(self):
+        """Oublie les calques pré-rendus de la map courante."""
+        if self.template:
+            self.template.invalidate_cache()
+
+    def bake(self):
+        """Pré-rend les calques de la map courante sans les dessiner."""
+        if self.template:
+            self.template.bake()
 
+    def draw(self, surface):
+        """Dessine les calques de tuiles de la map courante."""
+        if self.template:
+            self.template.draw(surface)
@@ -1,10 +1,12 @@
 import pygame
 import math
+import asset_manager
+import audio
+from render_queue import LAYER_PICKUPS
 
 class Medicament(pygame.sprite.Sprite):
     def __init__(self, x, y, player, screen_width, screen_height, spritesheet_path="potion/PotionBlue.png", frame_width=22, frame_height=37, activation_distance=300):
         super().__init__()
-        pygame.mixer.init()  # Initialiser le mixer pour le son
         # Surface avec canal alpha pour gérer la transparence
         self.surf = pygame.Surface((30, 30), pygame.SRCALPHA)
 
@@ -16,28 +18,19 @@ class Medicament(pygame.sprite.Sprite):
         self.activation_distance = activation_distance
         self.collected = False  # état du médicament
         
-        # Charger le son de collecte
-        self.collect_sound = pygame.mixer.Sound('bruitages/sharp-pop-328170.mp3')
-        self.collect_sound.set_volume(0.2)  # <-- Ajoute cette ligne pour régler le volume
         self.animation = self.load_frames(spritesheet_path)
+        self.alpha = 255
 
         # Animation
         self.current_frame = 0
         self.animation_speed = 0.2
 
         # Image initiale
-        self.image = self.animation[0].copy()
+        self.image = self.animation[0]
         self.rect = self.image.get_rect(center=(x, y))
 
     def load_frames(self, path):
-        sheet = pygame.image.load(path).convert_alpha()
-        frames = []
-        sheet_width = sheet.get_width()
-        sheet_height = sheet.get_height()
-        for y in range(0, sheet_height, self.frame_height):
-            for x in range(0, sheet_width, self.frame_width):
-                frames.append(sheet.subsurface(pygame.Rect(x, y, self.frame_width, self.frame_height)))
-        return frames
+        return asset_manager.load_frame_set(path, self.frame_width, self.frame_height)
 
         
     def update(self):
@@ -58,17 +51,18 @@ class Medicament(pygame.sprite.Sprite):
             self.current_frame += self.animation_speed
             if self.current_frame >= len(frames):
                 self.current_frame = 0
-            frame = frames[int(self.current_frame)].copy()
-            self.image = frame
-            self.image.set_alpha(alpha)
+            # Frame partagée : l'opacité est appliquée juste avant le blit
+            self.image = frames.get(int(self.current_frame))
+            self.alpha = alpha
 
 
-    def draw(self, surface):
-        if not self.collected and self.surf.get_alpha() != 0:  # Ne pas dessiner si ramassé ou invisible
-            surface.blit(self.image, self.rect)
-            
+    def submit(self, queue):
+        """Ajoute la potion à la file de rendu (opacité appliquée au moment du blit)."""
+        if not self.collected and self.surf.get_alpha() != 0:
+            queue.blit(LAYER_PICKUPS, self.image, self.rect, alpha=self.alpha)
+
     def collect(self):
         if not self.collected:
             self.collected = True
-            self.collect_sound.play()  # Jouer le son de collecte
+            audio.play("potion_pickup", self.rect.center)  # Son décodé une fois (voir audio.py)
 
@@ -1,44 +1,34 @@
 import pygame
 from pygame.locals import *
 import controlsMenu
+import ui
 from config import (
     SCREEN_WIDTH, SCREEN_HEIGHT,
     STATE_MENU, STATE_PLAY, STATE_PAUSE, STATE_GAME_OVER, STATE_BACK ,STATE_OPTIONS,
-    FONT
+    FONT_SIZE
 )
 
 
 
-pygame.init()
-
-def scan_joysticks():
-    pygame.joystick.quit()
-    pygame.joystick.init()
-    joystick_count = pygame.joystick.get_count()
-    for i in range(joystick_count):
-        pygame.joystick.Joystick(i).init()
-
-
-
 class Menu:
     def __init__(self, settings, title_image_path=None):
-        scan_joysticks()
         self.settings = settings
         self.buttons = []
         self.current_selection = 0
 
-        try:
-            self.background = pygame.image.load("right.png").convert()
-            self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        except (pygame.error, FileNotFoundError):
-            self.background = None
+        self.background = ui.menu_background()
 
-        self.title_image = None
-        if title_image_path:
-            try:
-                self.title_image = pygame.image.load(title_image_path).convert_alpha()
-            except (pygame.error, FileNotFoundError):
-                self.title_image = None
+        # Titre prêt à l'affichage (image réduite ou texte sur fond), construit une fois
+        self.title_image = ui.title_image(title_image_path) if title_image_path else None
+        if self.title_image:
+            self.title_blits = [(self.title_image, self.title_image.get_rect(center=(SCREEN_WIDTH // 2, 120)))]
+        else:
+            title = ui.default_font(FONT_SIZE).render("Contagium", True, (255, 255, 0))
+            title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 120))
+            title_bg = pygame.Surface((title.get_width() + 20, title.get_height() + 10))
+            title_bg.set_alpha(128)
+            title_bg.fill((0, 0, 0))
+            self.title_blits = [(title_bg, (title_rect.x - 10, title_rect.y - 5)), (title, title_rect)]
 
         # --- Animation du rat ---
         try:
@@ -51,6 +41,7 @@ class Menu:
                 frame.blit(self.rat_spritesheet, (0, 0),
                            (i * self.rat_frame_width, 0, self.rat_frame_width, self.rat_frame_height))
                 self.rat_frames.append(frame)
+            self.rat_frames_left = [pygame.transform.flip(frame, True, False) for frame in self.rat_frames]
 
             self.rat_current_frame = 0
             self.rat_animation_timer = 0
@@ -64,7 +55,7 @@ class Menu:
             self.rat_spritesheet = None
 
     def add_button(self, text, action):
-        button_surface = FONT.render(text, True, (255, 255, 255))
+        button_surface = ui.default_font(FONT_SIZE).render(text, True, (255, 255, 255))
         self.buttons.append({"text": text, "surface": button_surface, "action": action})
 
     def update(self, dt):
@@ -79,6 +70,10 @@ class Menu:
             else:
                 self.rat_visible = False
 
+    def is_animating(self):
+        """True tant que le rat traverse l'écran (le menu doit être redessiné à chaque frame)."""
+        return bool(self.rat_spritesheet and self.rat_frames and self.rat_visible)
+
     def draw(self, surface):
         # --- maj textes dynamiques ---
         for button in self.buttons:
@@ -93,6 +88,7 @@ class Menu:
             elif button["action"] == "VISION_HIGH":
                 button["text"] = f"Élevée (150){' (x)' if self.settings.vision_radius == 150 else ''}"
 
+        # Fond, titre et boutons sont rendus une seule fois (voir ui.py) : ici on ne fait que les poser
         if self.background:
             surface.blit(self.background, (0, 0))
         else:
@@ -101,31 +97,12 @@ class Menu:
         if self.rat_spritesheet and self.rat_frames and self.rat_visible:
             current_rat_frame = self.rat_frames[self.rat_current_frame]
             if self.rat_direction == -1:
-                current_rat_frame = pygame.transform.flip(current_rat_frame, True, False)
+                current_rat_frame = self.rat_frames_left[self.rat_current_frame]
             surface.blit(current_rat_frame, (int(self.rat_x), int(self.rat_y)))
 
-        if self.title_image:
-            original_width = self.title_image.get_width()
-            original_height = self.title_image.get_height()
-            new_width = int(original_width * 0.4)
-            new_height = int(original_height * 0.4)
-            scaled_title_image = pygame.transform.scale(self.title_image, (new_width, new_height))
-            title_rect = scaled_title_image.get_rect(center=(SCREEN_WIDTH // 2, 120))
-            surface.blit(scaled_title_image, title_rect)
-        else:
-            title = FONT.render("Contagium", True, (255, 255, 0))
-            title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 120))
-            title_bg = pygame.Surface((title.get_width() + 20, title.get_height() + 10))
-            title_bg.set_alpha(128)
-            title_bg.fill((0, 0, 0))
-            surface.blit(title_bg, (title_rect.x - 10, title_rect.y - 5))
-            surface.blit(title, title_rect)
-
-        try:
-            obra_font = pygame.font.Font("assets/ObraLetra.ttf", 36)
-        except:
-            obra_font = pygame.font.SysFont("Arial", 36)
+        surface.blits(self.title_blits, doreturn=False)
 
+        font = ui.obra_font(36)
         if self.buttons[0]["text"] == "Jouer":
             grid = [
                 (SCREEN_WIDTH // 2 - 110, 300),
@@ -135,192 +112,77 @@ class Menu:
                 (SCREEN_WIDTH // 2, 500)
             ]
             for i, button in enumerate(self.buttons):
-                color = (0, 150, 0) if i == self.current_selection else (44, 68, 132)
-                text_surface = obra_font.render(button["text"], True, color)
-                x, y = grid[i]
-                button_rect = text_surface.get_rect(center=(x, y))
-                button_bg = pygame.Surface((text_surface.get_width() + 24, text_surface.get_height() + 14), pygame.SRCALPHA)
-                pygame.draw.rect(button_bg, (220, 220, 220, 200), button_bg.get_rect(), border_radius=18)
-                surface.blit(button_bg, (button_rect.x - 12, button_rect.y - 7))
-                surface.blit(text_surface, button_rect)
-        else:
+                ui.draw_button(surface, font, button["text"], self.button_color(i), grid[i])
+        elif self.buttons[0]["action"] == "TOGGLE_MUSIC":
             # Organisation spécifique pour le menu options
-            if self.buttons[0]["action"] == "TOGGLE_MUSIC":
-                # Récupération des boutons
-                music_btn = self.buttons[0]
-                volume_btn = self.buttons[1]
-                vision_btns = self.buttons[2:5]
-                controls_btn = self.buttons[5]
-                back_btn = self.buttons[6]
-
-                # Musique
-                idx = 0
-                color = (0, 150, 0) if idx == self.current_selection else (44, 68, 132)
-                text_surface = obra_font.render(music_btn["text"], True, color)
-                y_pos = 280
-                button_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
-                button_bg = pygame.Surface((text_surface.get_width() + 24, text_surface.get_height() + 14), pygame.SRCALPHA)
-                pygame.draw.rect(button_bg, (220, 220, 220, 200), button_bg.get_rect(), border_radius=18)
-                surface.blit(button_bg, (button_rect.x - 12, button_rect.y - 7))
-                surface.blit(text_surface, button_rect)
-
-                # Volume
-                idx = 1
-                color = (0, 150, 0) if idx == self.current_selection else (44, 68, 132)
-                text_surface = obra_font.render(volume_btn["text"], True, color)
-                y_pos = 280 + 85
-                button_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
-                button_bg = pygame.Surface((text_surface.get_width() + 24, text_surface.get_height() + 14), pygame.SRCALPHA)
-                pygame.draw.rect(button_bg, (220, 220, 220, 200), button_bg.get_rect(), border_radius=18)
-                surface.blit(button_bg, (button_rect.x - 12, button_rect.y - 7))
-                surface.blit(text_surface, button_rect)
-
-                # Barre de volume
-                if volume_btn["action"] == "VOLUME_SLIDER":
-                    bar_width = 200
-                    bar_height = 8
-                    bar_x = SCREEN_WIDTH // 2 - bar_width // 2
-                    bar_y = button_rect.centery + 40
-                    pygame.draw.rect(surface, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height), border_radius=4)
-                    fill_width = int(bar_width * self.settings.music_volume)
-                    pygame.draw.rect(surface, (0, 200, 0), (bar_x, bar_y, fill_width, bar_height), border_radius=4)
-                    knob_x = bar_x + fill_width - 5
-                    knob_y = bar_y - 6
-                    pygame.draw.rect(surface, (255, 255, 255), (knob_x, knob_y, 10, 20), border_radius=5)
-
-                # Ligne des boutons vision (espacement augmenté)
-                vision_y = 280 + 85 * 2
-                # Ajout du texte 'Difficultés' centré avec espace avant et après
-                try:
-                    diff_font = pygame.font.Font("assets/ObraLetra.ttf", 32)
-                except:
-                    diff_font = pygame.font.SysFont("Arial", 25, bold=True)
-                diff_text = diff_font.render("Difficultés", True, (255, 255, 255))
-                # Espace avant
-                diff_rect = diff_text.get_rect(center=(SCREEN_WIDTH // 2, vision_y - 10))
-                surface.blit(diff_text, diff_rect)
-                # Espace après (on décale la ligne de boutons de vision)
-                vision_y_btns = vision_y + 30
-
-                vision_spacing = 250
-                vision_total_width = vision_spacing * (len(vision_btns) - 1)
+            music_btn = self.buttons[0]
+            volume_btn = self.buttons[1]
+            vision_btns = self.buttons[2:5]
+            controls_btn = self.buttons[5]
+            back_btn = self.buttons[6]
+
+            # Musique
+            ui.draw_button(surface, font, music_btn["text"], self.button_color(0), (SCREEN_WIDTH // 2, 280))
+
+            # Volume
+            button_rect = ui.draw_button(surface, font, volume_btn["text"], self.button_color(1), (SCREEN_WIDTH // 2, 280 + 85))
+            if volume_btn["action"] == "VOLUME_SLIDER":
+                self.draw_volume_bar(surface, button_rect.centery + 40)
+
+            # Ligne des boutons vision, sous le texte 'Difficultés'
+            vision_y = 280 + 85 * 2
+            diff_text = ui.render_text(ui.obra_font(32, fallback_size=25), "Difficultés", (255, 255, 255))
+            surface.blit(diff_text, diff_text.get_rect(center=(SCREEN_WIDTH // 2, vision_y - 10)))
+            vision_y_btns = vision_y + 30
+
+            vision_spacing = 250
+            vision_total_width = vision_spacing * (len(vision_btns) - 1)
+            vision_start_x = SCREEN_WIDTH // 2 - vision_total_width // 2
+            for i, button in enumerate(vision_btns):
+                x_pos = vision_start_x + i * vision_spacing
+                ui.draw_button(surface, font, button["text"], self.button_color(2 + i), (x_pos, vision_y_btns))
+
+            # Contrôles
+            ui.draw_button(surface, font, controls_btn["text"], self.button_color(5), (SCREEN_WIDTH // 2, vision_y + 85))
+
+            # Retour
+            ui.draw_button(surface, font, back_btn["text"], self.button_color(6), (SCREEN_WIDTH // 2, vision_y + 85 * 2))
+        else:
+            # Les autres menus étaient dessinés deux fois par frame : fond de bouton
+            # à l'opacité équivalente pour garder le même rendu en un seul passage
+            bg_color = (220, 220, 220, 243)
+            vision_actions = ("VISION_EASY", "VISION_NORMAL", "VISION_HIGH")
+            vision_buttons = [b for b in self.buttons if b["action"] in vision_actions]
+            other_buttons = [b for b in self.buttons if b["action"] not in vision_actions]
+            if vision_buttons:
+                vision_y = 280
+                vision_spacing = 260
+                vision_total_width = vision_spacing * (len(vision_buttons) - 1)
                 vision_start_x = SCREEN_WIDTH // 2 - vision_total_width // 2
-                for i, button in enumerate(vision_btns):
-                    idx = 2 + i
-                    color = (0, 150, 0) if idx == self.current_selection else (44, 68, 132)
-                    text_surface = obra_font.render(button["text"], True, color)
+                for i, button in enumerate(vision_buttons):
                     x_pos = vision_start_x + i * vision_spacing
-                    button_rect = text_surface.get_rect(center=(x_pos, vision_y_btns))
-                    button_bg = pygame.Surface((text_surface.get_width() + 24, text_surface.get_height() + 14), pygame.SRCALPHA)
-                    pygame.draw.rect(button_bg, (220, 220, 220, 200), button_bg.get_rect(), border_radius=18)
-                    surface.blit(button_bg, (button_rect.x - 12, button_rect.y - 7))
-                    surface.blit(text_surface, button_rect)
-
-                # Contrôles
-                idx = 5
-                color = (0, 150, 0) if idx == self.current_selection else (44, 68, 132)
-                text_surface = obra_font.render(controls_btn["text"], True, color)
-                y_pos = vision_y + 85
-                button_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
-                button_bg = pygame.Surface((text_surface.get_width() + 24, text_surface.get_height() + 14), pygame.SRCALPHA)
-                pygame.draw.rect(button_bg, (220, 220, 220, 200), button_bg.get_rect(), border_radius=18)
-                surface.blit(button_bg, (button_rect.x - 12, button_rect.y - 7))
-                surface.blit(text_surface, button_rect)
-
-                # Retour
-                idx = 6
-                color = (0, 150, 0) if idx == self.current_selection else (44, 68, 132)
-                text_surface = obra_font.render(back_btn["text"], True, color)
-                y_pos = vision_y + 85 * 2
-                button_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
-                button_bg = pygame.Surface((text_surface.get_width() + 24, text_surface.get_height() + 14), pygame.SRCALPHA)
-                pygame.draw.rect(button_bg, (220, 220, 220, 200), button_bg.get_rect(), border_radius=18)
-                surface.blit(button_bg, (button_rect.x - 12, button_rect.y - 7))
-                surface.blit(text_surface, button_rect)
-            else:
-                # ...ancien affichage pour les autres menus...
-                vision_actions = ("VISION_EASY", "VISION_NORMAL", "VISION_HIGH")
-                vision_buttons = [b for b in self.buttons if b["action"] in vision_actions]
-                other_buttons = [b for b in self.buttons if b["action"] not in vision_actions]
-                if vision_buttons:
-                    vision_y = 280
-                    vision_spacing = 260
-                    vision_total_width = vision_spacing * (len(vision_buttons) - 1)
-                    vision_start_x = SCREEN_WIDTH // 2 - vision_total_width // 2
-                    for i, button in enumerate(vision_buttons):
-                        idx = self.buttons.index(button)
-                        color = (0, 150, 0) if idx == self.current_selection else (44, 68, 132)
-                        text_surface = obra_font.render(button["text"], True, color)
-                        x_pos = vision_start_x + i * vision_spacing
-                        button_rect = text_surface.get_rect(center=(x_pos, vision_y))
-                        button_bg = pygame.Surface((text_surface.get_width() + 24, text_surface.get_height() + 14), pygame.SRCALPHA)
-                        pygame.draw.rect(button_bg, (220, 220, 220, 200), button_bg.get_rect(), border_radius=18)
-                        surface.blit(button_bg, (button_rect.x - 12, button_rect.y - 7))
-                        surface.blit(text_surface, button_rect)
-                start_y = 280 + 85 if vision_buttons else 280
-                for i, button in enumerate(other_buttons):
-                    idx = self.buttons.index(button)
-                    color = (0, 150, 0) if idx == self.current_selection else (44, 68, 132)
-                    text_surface = obra_font.render(button["text"], True, color)
-                    y_pos = start_y + i * 85
-                    button_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
-                    button_bg = pygame.Surface((text_surface.get_width() + 24, text_surface.get_height() + 14), pygame.SRCALPHA)
-                    pygame.draw.rect(button_bg, (220, 220, 220, 200), button_bg.get_rect(), border_radius=18)
-                    surface.blit(button_bg, (button_rect.x - 12, button_rect.y - 7))
-                    surface.blit(text_surface, button_rect)
-                    if button["action"] == "VOLUME_SLIDER":
-                        bar_width = 200
-                        bar_height = 8
-                        bar_x = SCREEN_WIDTH // 2 - bar_width // 2
-                        bar_y = button_rect.centery + 40
-                        pygame.draw.rect(surface, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height), border_radius=4)
-                        fill_width = int(bar_width * self.settings.music_volume)
-                        pygame.draw.rect(surface, (0, 200, 0), (bar_x, bar_y, fill_width, bar_height), border_radius=4)
-                        knob_x = bar_x + fill_width - 5
-                        knob_y = bar_y - 6
-                        pygame.draw.rect(surface, (255, 255, 255), (knob_x, knob_y, 10, 20), border_radius=5)
-                else:
-                    # ...ancien affichage pour les autres menus...
-                    vision_actions = ("VISION_EASY", "VISION_NORMAL", "VISION_HIGH")
-                    vision_buttons = [b for b in self.buttons if b["action"] in vision_actions]
-                    other_buttons = [b for b in self.buttons if b["action"] not in vision_actions]
-                    if vision_buttons:
-                        vision_y = 280
-                        vision_spacing = 260
-                        vision_total_width = vision_spacing * (len(vision_buttons) - 1)
-                        vision_start_x = SCREEN_WIDTH // 2 - vision_total_width // 2
-                        for i, button in enumerate(vision_buttons):
-                            idx = self.buttons.index(button)
-                            color = (0, 150, 0) if idx == self.current_selection else (44, 68, 132)
-                            text_surface = obra_font.render(button["text"], True, color)
-                            x_pos = vision_start_x + i * vision_spacing
-                            button_rect = text_surface.get_rect(center=(x_pos, vision_y))
-                            button_bg = pygame.Surface((text_surface.get_width() + 24, text_surface.get_height() + 14), pygame.SRCALPHA)
-                            pygame.draw.rect(button_bg, (220, 220, 220, 200), button_bg.get_rect(), border_radius=18)
-                            surface.blit(button_bg, (button_rect.x - 12, button_rect.y - 7))
-                            surface.blit(text_surface, button_rect)
-                    start_y = 280 + 85 if vision_buttons else 280
-                    for i, button in enumerate(other_buttons):
-                        idx = self.buttons.index(button)
-                        color = (0, 150, 0) if idx == self.current_selection else (44, 68, 132)
-                        text_surface = obra_font.render(button["text"], True, color)
-                        y_pos = start_y + i * 85
-                        button_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
-                        button_bg = pygame.Surface((text_surface.get_width() + 24, text_surface.get_height() + 14), pygame.SRCALPHA)
-                        pygame.draw.rect(button_bg, (220, 220, 220, 200), button_bg.get_rect(), border_radius=18)
-                        surface.blit(button_bg, (button_rect.x - 12, button_rect.y - 7))
-                        surface.blit(text_surface, button_rect)
-                        if button["action"] == "VOLUME_SLIDER":
-                            bar_width = 200
-                            bar_height = 8
-                            bar_x = SCREEN_WIDTH // 2 - bar_width // 2
-                            bar_y = button_rect.centery + 40
-                            pygame.draw.rect(surface, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height), border_radius=4)
-                            fill_width = int(bar_width * self.settings.music_volume)
-                            pygame.draw.rect(surface, (0, 200, 0), (bar_x, bar_y, fill_width, bar_height), border_radius=4)
-                            knob_x = bar_x + fill_width - 5
-                            knob_y = bar_y - 6
-                            pygame.draw.rect(surface, (255, 255, 255), (knob_x, knob_y, 10, 20), border_radius=5)
+                    ui.draw_button(surface, font, button["text"], self.button_color(self.buttons.index(button)),
+                                   (x_pos, vision_y), bg_color)
+            start_y = 280 + 85 if vision_buttons else 280
+            for i, button in enumerate(other_buttons):
+                button_rect = ui.draw_button(surface, font, button["text"], self.button_color(self.buttons.index(button)),
+                                             (SCREEN_WIDTH // 2, start_y + i * 85), bg_color)
+                if button["action"] == "VOLUME_SLIDER":
+                    self.draw_volume_bar(surface, button_rect.centery + 40)
+
+    def button_color(self, index):
+        return (0, 150, 0) if index == self.current_selection else (44, 68, 132)
+
+    def draw_volume_bar(self, surface, bar_y):
+        bar_width = 200
+        bar_height = 8
+        bar_x = SCREEN_WIDTH // 2 - bar_width // 2
+        pygame.draw.rect(surface, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height), border_radius=4)
+        fill_width = int(bar_width * self.settings.music_volume)
+        pygame.draw.rect(surface, (0, 200, 0), (bar_x, bar_y, fill_width, bar_height), border_radius=4)
+        knob_x = bar_x + fill_width - 5
+        knob_y = bar_y - 6
+        pygame.draw.rect(surface, (255, 255, 255), (knob_x, knob_y, 10, 20), border_radius=5)
 
     def handle_event(self, event):
         if event.type == KEYDOWN:
@@ -482,20 +344,44 @@ class Menu:
         return None
 
 
-def init_menus(settings):
+class LazyMenus(dict):
+    """
+    Menus par état, construits à leur premier affichage : au démarrage, seul le
+    menu principal est prêt (chaque image de titre coûte plusieurs dizaines de ms).
+    """
+    def __init__(self, builders):
+        super().__init__()
+        self.builders = builders  # état -> fonction qui construit le menu (None : écran sans objet menu)
+
+    def __contains__(self, state):
+        return state in self.builders
+
+    def __missing__(self, state):
+        builder = self.builders[state]
+        menu = self[state] = builder() if builder else None
+        return menu
+
+
+def build_main_menu(settings):
     main_menu = Menu(settings, "wordsGame/contagium.png")
     main_menu.add_button("Jouer", STATE_PLAY)
     main_menu.add_button("Didacticiel", "TUTORIAL")
     main_menu.add_button("Options", STATE_OPTIONS)
     main_menu.add_button("Crédits", "CREDITS")
     main_menu.add_button("Quitter", "QUIT")
+    return main_menu
+
 
+def build_pause_menu(settings):
     pause_menu = Menu(settings, "wordsGame/playPause.png")
     pause_menu.add_button("Reprendre", STATE_PLAY)
     pause_menu.add_button("Options", STATE_OPTIONS)
     pause_menu.add_button("Menu Principal", STATE_MENU)
     pause_menu.add_button("Quitter", "QUIT")
+    return pause_menu
 
+
+def build_options_menu(settings):
     options_menu = Menu(settings, "wordsGame/options.png")
     options_menu.add_button("Music: ON", "TOGGLE_MUSIC")
     options_menu.add_button("Volume", "VOLUME_SLIDER")
@@ -504,46 +390,56 @@ def init_menus(settings):
     options_menu.add_button("Vision : Élevé (150)", "VISION_HIGH")
     options_menu.add_button("Contrôles", "CONTROLS")
     options_menu.add_button("Retour", STATE_BACK)
+    return options_menu
+
 
+def build_game_over_menu(settings):
     game_over_menu = Menu(settings, "wordsGame/gameOver.png")
     game_over_menu.add_button("Rejouer", STATE_PLAY)
     game_over_menu.add_button("Menu Principal", STATE_MENU)
     game_over_menu.add_button("Quitter", "QUIT")
+    return game_over_menu
 
-    controls_menu = controlsMenu.ControlsMenu(settings)
-    return {
-        STATE_MENU: main_menu,
-        STATE_PAUSE: pause_menu,
-        STATE_OPTIONS: options_menu,
-        STATE_GAME_OVER: game_over_menu,
-        "CONTROLS": controls_menu,
+
+def init_menus(settings):
+    """Menus du jeu (voir LazyMenus) ; le menu principal est construit tout de suite."""
+    menus = LazyMenus({
+        STATE_MENU: lambda: build_main_menu(settings),
+        STATE_PAUSE: lambda: build_pause_menu(settings),
+        STATE_OPTIONS: lambda: build_options_menu(settings),
+        STATE_GAME_OVER: lambda: build_game_over_menu(settings),
+        "CONTROLS": lambda: controlsMenu.ControlsMenu(settings),
         "CREDITS": None,
         "TUTORIAL": None
-    }
+    })
+    menus[STATE_MENU]
+    return menus
 
 # --- Fonction d'affichage et gestion du menu didacticiel ---
+# Écrans entièrement statiques : construits au premier affichage puis simplement recopiés
+_static_screens = {}
+
 def draw_tutorial_menu(surface):
-    try:
-        background = pygame.image.load("right.png").convert()
-        background = pygame.transform.scale(background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-    except:
-        background = None
+    screen = _static_screens.get("TUTORIAL")
+    if screen is None:
+        screen = _static_screens["TUTORIAL"] = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        build_tutorial_menu(screen)
+    surface.blit(screen, (0, 0))
+
+def build_tutorial_menu(surface):
+    background = ui.menu_background()
     if background:
         surface.blit(background, (0, 0))
     else:
         surface.fill((20, 20, 20))
 
     # Titre
-    try:
-        obra_font = pygame.font.Font("assets/ObraLetra.ttf", 48)
-    except:
-        obra_font = pygame.font.SysFont("Arial", 48, bold=True)
-    try:
-        title = pygame.image.load("wordsGame/tutorial.png").convert_alpha()
-        title = pygame.transform.scale(title, (int(title.get_width() * 0.4), int(title.get_height() * 0.4)))
+    obra_font = ui.obra_font(48)
+    title = ui.title_image("wordsGame/tutorial.png")
+    if title:
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 130))
         surface.blit(title, title_rect)
-    except:
+    else:
         title_surface = obra_font.render("Didacticiel", True, (255, 255, 0))
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 130))
         surface.blit(title_surface, title_rect)
@@ -558,7 +454,7 @@ def draw_tutorial_menu(surface):
         "Vous aurez le nombre de potions ramassées affiché en haut à gauche de l’écran. Attention à ne pas les gaspiller !\n"
         "Souvenez-vous : votre but n’est pas de tuer les pestiférés… mais de les sauver en leur lançant les potions récupérées."
     )
-    small_font = pygame.font.SysFont("Arial", 16)
+    small_font = ui.default_font(16)
     box_width = SCREEN_WIDTH - 200
     start_x = (SCREEN_WIDTH - box_width) // 2
     start_y = 220
@@ -598,10 +494,7 @@ def draw_tutorial_menu(surface):
 
     # Bouton Retour
     button_text = "Retour"
-    try:
-        button_font = pygame.font.Font("assets/ObraLetra.ttf", 32)
-    except:
-        button_font = pygame.font.SysFont("Arial", 32, bold=True)
+    button_font = ui.obra_font(32)
     button_surface = button_font.render(button_text, True, (0, 150, 0))
     button_rect = button_surface.get_rect(center=(SCREEN_WIDTH // 2, start_y + box_height + 60))
 
@@ -622,23 +515,21 @@ def handle_tutorial_event(event):
     return None
 # --- Fonction d'affichage et gestion du menu crédits ---
 def draw_credits_menu(surface):
-    try:
-        background = pygame.image.load("right.png").convert()
-        background = pygame.transform.scale(background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-    except:
-        background = None
+    screen = _static_screens.get("CREDITS")
+    if screen is None:
+        screen = _static_screens["CREDITS"] = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        build_credits_menu(screen)
+    surface.blit(screen, (0, 0))
+
+def build_credits_menu(surface):
+    background = ui.menu_background()
     if background:
         surface.blit(background, (0, 0))
     else:
         surface.fill((20, 20, 20))
 
     # Main title
-    try:
-        obra_font = pygame.font.Font("assets/ObraLetra.ttf", 48)
-    except:
-        obra_font = pygame.font.SysFont("Arial", 48, bold=True)
-    title = pygame.image.load("wordsGame/credits.png").convert_alpha()
-    title = pygame.transform.scale(title, (int(title.get_width() * 0.4), int(title.get_height() * 0.4)))
+    title = ui.title_image("wordsGame/credits.png")
     title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 130))
     surface.blit(title, title_rect)
 
@@ -661,8 +552,8 @@ def draw_credits_menu(surface):
         "Pygame et VS Code"
     ]
 
-    small_font = pygame.font.SysFont("Arial", 26)
-    header_font = pygame.font.SysFont("Arial", 28, bold=True)
+    small_font = ui.default_font(26)
+    header_font = ui.default_font(28)
     padding = 20
     column_spacing = 100
     line_height = 36
@@ -720,10 +611,7 @@ def draw_credits_menu(surface):
 
     # Return button below the box
     button_text = "Retour"
-    try:
-        button_font = pygame.font.Font("assets/ObraLetra.ttf", 32)
-    except:
-        button_font = pygame.font.SysFont("Arial", 32, bold=True)
+    button_font = ui.obra_font(32)
     button_surface = button_font.render(button_text, True, (0, 150, 0))
     button_rect = button_surface.get_rect(center=(SCREEN_WIDTH // 2, start_y + box_height + 60))
 
@@ -0,0 +1,170 @@
+"""
+Navigation des ennemis autour des obstacles.
+
+NavGrid : les obstacles d'une map rastérisés une fois en cases praticables
+(partagé entre les salles qui utilisent la même map, voir MapTemplate).
+FlowField : pour une salle, un seul parcours en largeur depuis la case du
+joueur, refait seulement quand le joueur change de case ; chaque ennemi y lit
+sa direction en O(1), au lieu d'une recherche de chemin par ennemi.
+"""
+import math
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : seule la lecture groupée (EnemyHorde) en a besoin
+    np = None
+
+NAV_CELL = 16  # Taille d'une case (px)
+NAV_CLEARANCE = (20, 26)  # Marge (x, y) autour des obstacles : demi-hitbox d'un zombie (38 x 51)
+
+# Orthogonales d'abord : à distance égale, on préfère ne pas couper en diagonale
+_STEPS = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+
+class NavGrid:
+    """
+    Cases praticables d'une map (lecture seule). Une case est bloquée si une
+    hitbox centrée sur elle (demi-taille `clearance`) touche un obstacle.
+    links[i] liste les cases praticables voisines de i (8 directions, sans
+    couper le coin d'un obstacle).
+    """
+    def __init__(self, obstacles, width, height, cell=NAV_CELL, clearance=NAV_CLEARANCE):
+        self.cell = cell
+        self.cols = cols = -(-width // cell)
+        self.rows = rows = -(-height // cell)
+        walkable = bytearray(b"\x01") * (cols * rows)
+        half = cell // 2
+        for obs in obstacles:
+            if obs.width <= 0 or obs.height <= 0:
+                continue
+            area = obs.inflate(clearance[0] * 2, clearance[1] * 2)
+            # Cases dont le centre tombe dans la zone élargie
+            for cy in range(max(0, -(-(area.top - half) // cell)), min(rows, (area.bottom - 1 - half) // cell + 1)):
+                row = cy * cols
+                for cx in range(max(0, -(-(area.left - half) // cell)), min(cols, (area.right - 1 - half) // cell + 1)):
+                    walkable[row + cx] = 0
+        self.walkable = walkable
+
+        self.links = links = []
+        for cy in range(rows):
+            for cx in range(cols):
+                cell_links = []
+                for dx, dy in _STEPS:
+                    nx, ny = cx + dx, cy + dy
+                    if not (0 <= nx < cols and 0 <= ny < rows) or not walkable[ny * cols + nx]:
+                        continue
+                    if dx and dy and not (walkable[cy * cols + nx] and walkable[ny * cols + cx]):
+                        continue
+                    cell_links.append(ny * cols + nx)
+                links.append(tuple(cell_links))
+        # Cases bloquées au bord d'une zone praticable (un ennemi collé à un mur peut s'y trouver)
+        self.edges = tuple(i for i, cell_links in enumerate(links) if cell_links and not walkable[i])
+
+    def cell_at(self, x, y):
+        """Indice de la case contenant (x, y), ou None hors de la map."""
+        cx = int(x) // self.cell
+        cy = int(y) // self.cell
+        if 0 <= cx < self.cols and 0 <= cy < self.rows:
+            return cy * self.cols + cx
+        return None
+
+    def center(self, i):
+        cell = self.cell
+        return (i % self.cols) * cell + cell // 2, (i // self.cols) * cell + cell // 2
+
+
+class FlowField:
+    """
+    Distances (en cases) jusqu'au joueur et case suivante vers lui, pour une
+    salle. Un ennemi suit le centre de la case suivante ; à une case du joueur
+    ou coupé de lui, il le vise tout droit (direction() renvoie None).
+    """
+    def __init__(self, nav):
+        self.nav = nav
+        self.target = None  # Case du joueur au dernier calcul
+        self.distance = []
+        self.next = []  # Case suivante vers le joueur (-1 : aucune)
+        self.rebuilds = 0
+        self._arrays = None  # Copie NumPy pour EnemyHorde, refaite après chaque calcul
+
+    def update(self, x, y):
+        """Recalcule le champ si le joueur (x, y) a changé de case. Renvoie True si recalculé."""
+        nav = self.nav
+        target = nav.cell_at(x, y)
+        if target == self.target or target is None:
+            return False
+        self.target = target
+        self.rebuilds += 1
+        self._arrays = None
+
+        # Parcours en largeur : la case qui en découvre une autre est sa case suivante
+        links = nav.links
+        distance = [-1] * len(links)
+        following = [-1] * len(links)
+        distance[target] = 0
+        queue = deque([target])
+        while queue:
+            i = queue.popleft()
+            d = distance[i] + 1
+            for j in links[i]:
+                if distance[j] < 0:
+                    distance[j] = d
+                    following[j] = i
+                    queue.append(j)
+
+        # Cases bloquées : vers la voisine praticable la plus proche du joueur
+        for i in nav.edges:
+            if i == target:
+                continue
+            best = -1
+            best_distance = len(links)
+            for j in links[i]:
+                if 0 <= distance[j] < best_distance:
+                    best, best_distance = j, distance[j]
+            if best >= 0:
+                following[i] = best
+                distance[i] = best_distance + 1
+        self.distance = distance
+        self.next = following
+        return True
+
+    def direction(self, x, y):
+        """Direction unitaire à suivre depuis (x, y), ou None pour viser le joueur tout droit."""
+        if self.target is None:
+            return None
+        nav = self.nav
+        i = nav.cell_at(x, y)
+        if i is None or self.distance[i] <= 1 or self.next[i] < 0:
+            return None
+        next_x, next_y = nav.center(self.next[i])
+        dx = next_x - x
+        dy = next_y - y
+        length = math.hypot(dx, dy)
+        if length == 0:
+            return None
+        return dx / length, dy / length
+
+    def directions(self, xs, ys):
+        """
+        Version groupée de direction() pour des tableaux NumPy de positions.
+        Renvoie (dx, dy, suit) : `suit` est faux là où direction() renverrait None.
+        """
+        nav = self.nav
+        if self.target is None:
+            return np.zeros(len(xs)), np.zeros(len(ys)), np.zeros(len(xs), dtype=bool)
+        if self._arrays is None:
+            self._arrays = (np.array(self.distance, dtype=np.int64), np.array(self.next, dtype=np.int64))
+        distance, following = self._arrays
+        cx = xs // nav.cell
+        cy = ys // nav.cell
+        inside = (cx >= 0) & (cx < nav.cols) & (cy >= 0) & (cy < nav.rows)
+        index = np.where(inside, cy * nav.cols + cx, 0)
+        nxt = following[index]
+        half = nav.cell // 2
+        dx = (nxt % nav.cols) * nav.cell + half - xs
+        dy = (nxt // nav.cols) * nav.cell + half - ys
+        length = np.hypot(dx, dy)
+        follow = inside & (distance[index] > 1) & (nxt >= 0) & (length > 0)
+        safe = np.where(follow, length, 1.0)
+        return dx / safe, dy / safe, follow
@@ -0,0 +1,131 @@
+import pygame
+
+import sim
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : sans lui, les particules sont mises à jour une par une
+    np = None
+
+_circle_sprites = {}
+
+
+def circle_sprite(color, radius):
+    """Disque pré-rendu, identique à pygame.draw.circle(centre, rayon) posé en (x - rayon, y - rayon)."""
+    key = (color, radius)
+    sprite = _circle_sprites.get(key)
+    if sprite is None:
+        # Transparence par couleur clé (RLE) : bien plus rapide à blitter qu'un canal alpha
+        key_color = (255, 0, 255) if tuple(color[:3]) != (255, 0, 255) else (0, 0, 0)
+        sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1))
+        sprite.fill(key_color)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        sprite.set_colorkey(key_color, pygame.RLEACCEL)
+        _circle_sprites[key] = sprite
+    return sprite
+
+
+class ParticlePool:
+    """
+    Réserve de particules de capacité fixe (position, vitesse, rayon, durée de vie).
+    Aucune allocation par particule : emit() remplit des cases libres, update()
+    déplace, rétrécit, vieillit et compacte les particules mortes en une passe
+    (vectorisée avec NumPy), draw() envoie tous les disques en un seul blits().
+    """
+    def __init__(self, capacity, color, shrink=0.96, min_radius=0.8):
+        self.capacity = capacity
+        self.color = color
+        self.shrink = shrink
+        self.min_radius = min_radius
+        self.count = 0
+        if np is not None:
+            self.rng = np.random.default_rng(sim.rng("effects").getrandbits(32))
+            self.data = np.zeros((6, capacity))  # x, y, dx, dy, rayon, vie
+        else:
+            self.data = [[0.0] * capacity for _ in range(6)]
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def emit(self, x, y, count, spread=5, radius=(2, 5), dx=(-0.5, 0.5), dy=(-0.8, -0.3), life=(18, 35)):
+        """Ajoute jusqu'à `count` particules autour de (x, y) (bornes incluses pour les entiers)."""
+        start = self.count
+        count = min(count, self.capacity - start)
+        if count <= 0:
+            return
+        end = start + count
+        if np is not None:
+            # Un seul tirage pour toutes les colonnes : bornes basses + u * étendue
+            low, span = self._ranges(x, y, spread, radius, dx, dy, life)
+            block = self.data[:, start:end]
+            np.multiply(self.rng.random((6, count)), span, out=block)
+            block += low
+            block[[0, 1, 4, 5]] = np.floor(block[[0, 1, 4, 5]])
+        else:
+            px, py, vx, vy, pr, pl = self.data
+            rng = sim.rng("effects")  # Flux à part : les effets ne décalent pas la simulation
+            for i in range(start, end):
+                px[i] = x + rng.randint(-spread, spread)
+                py[i] = y + rng.randint(-spread, spread)
+                vx[i] = rng.uniform(*dx)
+                vy[i] = rng.uniform(*dy)
+                pr[i] = rng.randint(*radius)
+                pl[i] = rng.randint(*life)
+        self.count = end
+
+    def _ranges(self, x, y, spread, radius, dx, dy, life):
+        key = (x, y, spread, radius, dx, dy, life)
+        if key != getattr(self, "_ranges_key", None):
+            # Entiers : étendue + 1 puis partie entière (bornes incluses comme random.randint)
+            self._ranges_low = np.array([[x - spread], [y - spread], [dx[0]], [dy[0]], [radius[0]], [life[0]]])
+            self._ranges_span = np.array([[2 * spread + 1], [2 * spread + 1], [dx[1] - dx[0]], [dy[1] - dy[0]],
+                                          [radius[1] - radius[0] + 1], [life[1] - life[0] + 1]])
+            self._ranges_key = key
+        return self._ranges_low, self._ranges_span
+
+    def update(self):
+        """Retire les particules mortes puis fait avancer les autres d'un pas."""
+        n = self.count
+        if np is not None:
+            data = self.data
+            alive = (data[5, :n] > 0) & (data[4, :n] > self.min_radius)
+            n = int(alive.sum())
+            data[:, :n] = data[:, :self.count][:, alive]
+            data[0, :n] += data[2, :n]
+            data[1, :n] += data[3, :n]
+            data[4, :n] *= self.shrink
+            data[5, :n] -= 1
+        else:
+            px, py, vx, vy, pr, pl = self.data
+            k = 0
+            for i in range(n):
+                if pl[i] > 0 and pr[i] > self.min_radius:
+                    px[k] = px[i] + vx[i]
+                    py[k] = py[i] + vy[i]
+                    vx[k], vy[k] = vx[i], vy[i]
+                    pr[k] = pr[i] * self.shrink
+                    pl[k] = pl[i] - 1
+                    k += 1
+            n = k
+        self.count = n
+
+    def draw(self, surface):
+        n = self.count
+        if not n:
+            return
+        if np is not None:
+            xs = self.data[0, :n].astype(np.int64).tolist()
+            ys = self.data[1, :n].astype(np.int64).tolist()
+            rs = self.data[4, :n].astype(np.int64).tolist()
+        else:
+            xs = [int(v) for v in self.data[0][:n]]
+            ys = [int(v) for v in self.data[1][:n]]
+            rs = [int(v) for v in self.data[4][:n]]
+        color = self.color
+        surface.blits([
+            (circle_sprite(color, r), (x - r, y - r))
+            for x, y, r in zip(xs, ys, rs) if r > 0
+        ], doreturn=False)
@@ -2,6 +2,10 @@ import pygame
 from config import COLLECT_MEDECINE, HEAL_INFECTED
 from pygame.locals import *
 from infos_hud import InfoHUD
+import asset_manager
+import audio
+import sim
+from render_queue import LAYER_ACTORS
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, x, y, settings, screen_width=1024, screen_height=700,
@@ -38,13 +42,9 @@ class Player(pygame.sprite.Sprite):
         self.current_frame = 0
         self.animation_speed = 0.15
 
-        # Charger le son de throw
-        self.throw_sound = pygame.mixer.Sound('bruitages/glass-breaking-386153.mp3')
-        self.throw_sound.set_volume(0.2)
-
         # Image par défaut
         if self.idle_frames:
-            self.image = self.idle_frames[0].copy()
+            self.image = self.idle_frames[0]
         else:
             self.image = pygame.Surface((50, 50))
             self.image.fill((0, 128, 255))
@@ -54,10 +54,11 @@ class Player(pygame.sprite.Sprite):
         self.hitbox.inflate_ip(-90, -75)
 
         # Cooldowns
+        # Temps de simulation (sim.ticks) : la première attaque est possible dès le début
         self.attack_cooldown = 500  
-        self.last_attack_time = 0
+        self.last_attack_time = -self.attack_cooldown
         self.throw_cooldown = 800  
-        self.last_throw_time = 0
+        self.last_throw_time = -self.throw_cooldown
         self.hurt_timer = 0
 
         # Joystick
@@ -68,16 +69,8 @@ class Player(pygame.sprite.Sprite):
 
     def load_frames(self, path, frame_width, frame_height, scale=2):
         try:
-            sheet = pygame.image.load(path).convert_alpha()
-            frames = []
-            sheet_width = sheet.get_width()
-            sheet_height = sheet.get_height()
-            for y in range(0, sheet_height, frame_height):
-                for x in range(0, sheet_width, frame_width):
-                    frame = sheet.subsurface(pygame.Rect(x, y, frame_width, frame_height))
-                    frame = pygame.transform.scale(frame, (frame_width * scale, frame_height * scale))
-                    frames.append(frame)
-            return frames
+            # FrameSet partagé : frames droite et miroirs gauche pré-calculés
+            return asset_manager.load_frame_set(path, frame_width, frame_height, scale)
         except (pygame.error, FileNotFoundError):
             return []
 
@@ -90,10 +83,10 @@ class Player(pygame.sprite.Sprite):
             else:
                 self.state = "hurt"
                 self.current_frame = 0
-                self.hurt_timer = pygame.time.get_ticks()
+                self.hurt_timer = sim.ticks()
 
     def attack(self, attack_type):
-        now = pygame.time.get_ticks()
+        now = sim.ticks()
         if attack_type == COLLECT_MEDECINE:
             if now - self.last_attack_time >= self.attack_cooldown and self.state not in ["attack", "hurt", "dead", "throw"]:
                 self.state = "attack"
@@ -117,14 +110,15 @@ class Player(pygame.sprite.Sprite):
                 attack_rect = self.rect.copy()
                 attack_rect.width += 40
                 attack_rect.height += 30
-                self.throw_sound.play() 
+                audio.play("potion_throw", self.rect.center)
                 if self.direction == "right":
                     attack_rect.x += 20
                 else:
                     attack_rect.x -= 20
                 self.attack_rect = attack_rect
 
-    def update(self, keys, current_room):
+    def update(self, controls, current_room):
+        """Un pas de simulation ; `controls` : entrées du pas (replay.InputState)."""
         if self.is_invisible:
             return  # Bloque tout mouvement et animation si invisible
 
@@ -136,25 +130,24 @@ class Player(pygame.sprite.Sprite):
             return
 
         # Déplacements clavier
-        if any(keys[key] for key in self.settings.get_control("move_up", "keyboard")):
+        if controls.pressed("move_up"):
             dy = -self.speed
             self.moving = True
-        if any(keys[key] for key in self.settings.get_control("move_down", "keyboard")):
+        if controls.pressed("move_down"):
             dy = self.speed
             self.moving = True
-        if any(keys[key] for key in self.settings.get_control("move_left", "keyboard")):
+        if controls.pressed("move_left"):
             dx = -self.speed
             self.direction = "left"
             self.moving = True
-        if any(keys[key] for key in self.settings.get_control("move_right", "keyboard")):
+        if controls.pressed("move_right"):
             dx = self.speed
             self.direction = "right"
             self.moving = True
 
         # Déplacements manette
-        if self.joystick:
-            axis_x = self.joystick.get_axis(0)
-            axis_y = self.joystick.get_axis(1)
+        if controls.axis_x or controls.axis_y:
+            axis_x, axis_y = controls.axes
             deadzone = 0.2
             if abs(axis_x) > deadzone:
                 dx = axis_x * self.speed
@@ -164,16 +157,16 @@ class Player(pygame.sprite.Sprite):
                 dy = axis_y * self.speed
                 self.moving = True
 
-        # Collision + mouvement
+        # Collision + mouvement (seuls les obstacles proches sont testés)
         self.hitbox.x += dx
-        for obs in current_room.obstacles:
+        for obs in current_room.obstacle_grid.sweep(self.hitbox):
             if self.hitbox.colliderect(obs):
                 if dx > 0:
                     self.hitbox.right = obs.left
                 elif dx < 0:
                     self.hitbox.left = obs.right
         self.hitbox.y += dy
-        for obs in current_room.obstacles:
+        for obs in current_room.obstacle_grid.sweep(self.hitbox):
             if self.hitbox.colliderect(obs):
                 if dy > 0:
                     self.hitbox.bottom = obs.top
@@ -196,7 +189,7 @@ class Player(pygame.sprite.Sprite):
             frames = self.attack_frames
         elif self.state == "hurt":
             frames = self.hurt_frames
-            if pygame.time.get_ticks() - self.hurt_timer > 300:
+            if sim.ticks() - self.hurt_timer > 300:
                 self.state = "idle"
                 self.current_frame = 0
         elif self.state == "dead":
@@ -211,9 +204,7 @@ class Player(pygame.sprite.Sprite):
 
         if self.state in ["attack", "throw"]:
             if int(self.current_frame) >= len(frames) - 1:
-                self.image = frames[-1].copy()
-                if self.direction == "left":
-                    self.image = pygame.transform.flip(self.image, True, False)
+                self.image = frames.get(-1, self.direction)
                 self.state = "idle"
                 self.current_frame = 0
                 return
@@ -222,15 +213,12 @@ class Player(pygame.sprite.Sprite):
         if self.current_frame >= len(frames):
             self.current_frame = 0
 
-        self.image = frames[int(self.current_frame)].copy()
-        if self.direction == "left":
-            self.image = pygame.transform.flip(self.image, True, False)
-
-    def draw(self, surface):
-        if self.is_invisible:
-            return  # Ne rien dessiner si invisible
+        self.image = frames.get(int(self.current_frame), self.direction)
 
-        surface.blit(self.image, self.rect)
+    def submit(self, queue):
+        """Ajoute le joueur à la file de rendu (trié avec les ennemis selon le bas de la hitbox)."""
+        if not self.is_invisible:
+            queue.blit(LAYER_ACTORS, self.image, self.rect, z=self.hitbox.bottom)
 
     def make_invisible_and_immobile(self):
         """Rend le joueur invisible et empêche tout mouvement ou action."""
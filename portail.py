@@ -1,4 +1,4 @@
-import pygame
+import asset_manager
 
 class Portail:
     def __init__(self, x, y, width=None, height=None):
@@ -11,11 +11,9 @@ class Portail:
         :param height: Hauteur optionnelle pour redimensionner
         """
         # Charger l'image APRÈS pygame.init() et pygame.display.set_mode()
-        self.image = pygame.image.load("portail.png").convert_alpha()
-        
-        # Redimensionner si besoin
-        if width and height:
-            self.image = pygame.transform.scale(self.image, (width, height))
+        # (image partagée, redimensionnée une seule fois si besoin)
+        size = (width, height) if width and height else None
+        self.image = asset_manager.load_image("portail.png", size=size)
         
         self.rect = self.image.get_rect()
         self.rect.topleft = (x, y)
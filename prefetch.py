@@ -0,0 +1,139 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from maploader import load_template
+
+# Décalage vers la salle voisine pour chaque porte
+DOOR_OFFSETS = {'up': (-1, 0), 'down': (1, 0), 'left': (0, -1), 'right': (0, 1)}
+
+
+def _prepare_room(room, player):
+    """Travail du thread : salle matérialisée, ennemis et potions construits, calques pré-rendus."""
+    room.materialize(SCREEN_WIDTH, SCREEN_HEIGHT)
+    contents = room.build_contents(player, SCREEN_WIDTH, SCREEN_HEIGHT)
+    room.map_loader.bake()
+    return contents
+
+
+class RoomPrefetcher:
+    """
+    Prépare en arrière-plan les salles voisines de la salle courante.
+    Le placement ne dépend que de la graine de chaque salle : le thread de
+    travail peut donc tout faire (map, données, sprites, sons, tuiles).
+    Entrer dans une salle préparée revient alors à échanger deux listes.
+    Une salle en préparation ne doit pas être modifiée : appeler
+    invalidate() avant toute modification groupée des salles.
+    """
+    def __init__(self):
+        self.executor = None  # Créé au premier préchargement
+        self.pending = {}  # Room -> Future de (ennemis, potions)
+        self.stats = {"prefetched": 0, "hits": 0, "late": 0, "misses": 0,
+                      "swaps": 0, "swap_ms_total": 0.0, "swap_ms_max": 0.0}
+
+    def submit(self, fn, *args):
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        return self.executor.submit(fn, *args)
+
+    def prefetch(self, room, player):
+        """Lance la préparation de `room` si elle n'est pas déjà en cours."""
+        if room in self.pending:
+            return
+        self.pending[room] = self.submit(_prepare_room, room, player)
+        self.stats["prefetched"] += 1
+
+    def warm_templates(self, tmx_files):
+        """
+        Parse les fichiers TMX en arrière-plan, après les salles déjà demandées,
+        pour qu'une salle non préparée ne coûte pas aussi la lecture de sa map.
+        """
+        for tmx_file in sorted({f for f in tmx_files if f and os.path.exists(f)}):
+            self.submit(load_template, tmx_file)
+
+    def prefetch_neighbours(self, grid, room, player):
+        """Prépare les salles derrière chaque porte, la plus proche du joueur d'abord. Renvoie ces salles."""
+        r, c = room.position
+        doors = sorted(room.doors, key=lambda door: _distance2(door[1].center, player.hitbox.center))
+        neighbours = []
+        for direction, _ in doors:
+            dr, dc = DOOR_OFFSETS[direction]
+            neighbour = grid.get((r + dr, c + dc))
+            if neighbour is not None:
+                self.prefetch(neighbour, player)
+                neighbours.append(neighbour)
+        return neighbours
+
+    def activate(self, room, player):
+        """
+        Installe le contenu de `room` : celui préparé s'il existe (en attendant
+        la fin du travail s'il a commencé), sinon construit sur place.
+        """
+        start = time.perf_counter()
+        future = self.pending.pop(room, None)
+        contents = None
+        # Travail pas encore commencé (file d'attente) : plus rapide de le faire ici
+        if future is not None and not future.cancel():
+            key = "hits" if future.done() else "late"
+            try:
+                contents = future.result()
+                self.stats[key] += 1
+            except Exception:
+                contents = None
+        if contents is None:
+            self.stats["misses"] += 1
+            room.generate_contents(player, SCREEN_WIDTH, SCREEN_HEIGHT)
+        else:
+            room.set_contents(contents)
+        self.record_swap((time.perf_counter() - start) * 1000)
+
+    def record_swap(self, ms):
+        stats = self.stats
+        stats["swaps"] += 1
+        stats["swap_ms_total"] += ms
+        stats["swap_ms_max"] = max(stats["swap_ms_max"], ms)
+
+    def discard(self, room, wait=False):
+        """
+        Abandonne la préparation de `room`. Renvoie False si le thread y
+        travaille encore (la salle ne doit alors pas être libérée), sauf avec
+        `wait` : on attend alors la fin de ce travail.
+        """
+        future = self.pending.get(room)
+        if future is None:
+            return True
+        if not future.cancel() and not future.done():
+            if not wait:
+                return False
+            future.exception()
+        del self.pending[room]
+        return True
+
+    def invalidate(self):
+        """
+        Oublie toutes les préparations (données des salles modifiées, nouvelle partie...).
+        Attend la fin du travail en cours pour que plus aucune salle ne soit touchée ensuite.
+        """
+        for future in self.pending.values():
+            if not future.cancel():
+                future.exception()
+        self.pending.clear()
+
+    def shutdown(self):
+        self.invalidate()
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    def get_stats(self):
+        """Compteurs plus le taux de succès et la latence moyenne d'un changement de salle."""
+        stats = dict(self.stats)
+        used = stats["hits"] + stats["late"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / used if used else 0.0
+        stats["swap_ms_avg"] = stats["swap_ms_total"] / stats["swaps"] if stats["swaps"] else 0.0
+        return stats
+
+
+def _distance2(a, b):
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2
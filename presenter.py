@@ -0,0 +1,133 @@
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : sans lui, toute la zone de jeu est mise à jour à chaque frame
+    np = None
+
+# Au-delà de cette part de la zone de jeu modifiée, on met à jour la zone entière
+FULL_UPDATE_RATIO = 0.5
+# Taille des blocs comparés pour trouver les zones modifiées (pixels)
+DIRTY_BLOCK = 64
+# Après autant de mises à jour entières d'affilée (jeu en mouvement), la comparaison
+# coûte plus qu'elle ne fait gagner : on met à jour la zone entière sans comparer
+# pendant DIFF_RETRY_FRAMES frames, puis on réessaie
+FULL_STREAK_LIMIT = 8
+DIFF_RETRY_FRAMES = 120
+
+
+class Presenter:
+    """
+    Affiche la surface logique du jeu centrée sur l'écran natif.
+    Les bandes noires autour (letterbox) ne sont peintes qu'une fois ; ensuite
+    seules les zones de la surface qui ont changé depuis la frame précédente
+    sont recopiées et envoyées avec pygame.display.update(rects). Quand presque
+    toute l'image change à chaque frame, la comparaison est suspendue un moment.
+    """
+    def __init__(self, screen, size):
+        self.screen = screen
+        self.offset = ((screen.get_width() - size[0]) // 2, (screen.get_height() - size[1]) // 2)
+        self.game_rect = pygame.Rect(self.offset, size)
+        self.letterbox_dirty = True
+        self.previous = None  # Copie des pixels de la dernière frame présentée
+        self.full_streak = 0  # Mises à jour entières d'affilée
+        self.unchecked = 0  # Frames restantes sans comparaison
+        self.stats = {"full": 0, "partial": 0, "skipped": 0, "unchecked": 0}
+
+    def invalidate(self):
+        """Force un rafraîchissement complet de l'écran à la prochaine frame."""
+        self.letterbox_dirty = True
+        self.previous = None
+
+    def handle_event(self, event):
+        # La fenêtre a pu être recouverte ou recréée : son contenu n'est plus garanti
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED):
+            self.invalidate()
+
+    def dirty_rects(self, surface):
+        """
+        Zones de `surface` (coordonnées logiques) modifiées depuis la frame précédente,
+        par blocs de DIRTY_BLOCK pixels. None si inconnu (pas de NumPy, première frame).
+        """
+        if np is None:
+            return None
+        try:
+            pixels = pygame.surfarray.pixels2d(surface).T  # (hauteur, largeur), contigu en mémoire
+        except ValueError:  # profondeur de couleur non gérée (24 bits)
+            return None
+        try:
+            if self.previous is None or self.previous.shape != pixels.shape:
+                self.previous = pixels.copy()
+                return None
+            changed = pixels != self.previous
+            if not changed.any():
+                return []
+            np.copyto(self.previous, pixels)
+        finally:
+            del pixels  # Libère le verrou de la surface
+
+        height, width = changed.shape
+        columns = -(-width // DIRTY_BLOCK)
+        padded = np.zeros(columns * DIRTY_BLOCK, dtype=bool)
+        blocks = []
+        for y in range(0, height, DIRTY_BLOCK):
+            padded[:width] = changed[y:y + DIRTY_BLOCK].any(axis=0)
+            blocks.append(padded.reshape(columns, DIRTY_BLOCK).any(axis=1).tolist())
+
+        # Fusion des blocs voisins d'une même rangée en un seul rect
+        rects = []
+        for by, row in enumerate(blocks):
+            bx = 0
+            while bx < len(row):
+                if not row[bx]:
+                    bx += 1
+                    continue
+                start = bx
+                while bx < len(row) and row[bx]:
+                    bx += 1
+                rect = pygame.Rect(start * DIRTY_BLOCK, by * DIRTY_BLOCK, (bx - start) * DIRTY_BLOCK, DIRTY_BLOCK)
+                rects.append(rect.clip(0, 0, width, height))
+        return rects
+
+    def present(self, surface):
+        """Affiche `surface` à l'écran en ne recopiant que ce qui a changé."""
+        if self.letterbox_dirty:
+            self.screen.fill((0, 0, 0))
+            self.screen.blit(surface, self.offset)
+            pygame.display.flip()
+            self.letterbox_dirty = False
+            self.dirty_rects(surface)  # mémorise la frame de référence
+            self.stats["full"] += 1
+            return
+
+        if self.unchecked:
+            self.unchecked -= 1
+            self.screen.blit(surface, self.offset)
+            pygame.display.update(self.game_rect)
+            self.stats["unchecked"] += 1
+            return
+
+        rects = self.dirty_rects(surface)
+        if rects == []:
+            self.full_streak = 0
+            self.stats["skipped"] += 1
+            return
+        game_area = self.game_rect.width * self.game_rect.height
+        if rects is None or sum(r.width * r.height for r in rects) > game_area * FULL_UPDATE_RATIO:
+            self.screen.blit(surface, self.offset)
+            pygame.display.update(self.game_rect)
+            self.stats["full"] += 1
+            self.full_streak += 1
+            if self.full_streak >= FULL_STREAK_LIMIT:
+                self.full_streak = 0
+                self.unchecked = DIFF_RETRY_FRAMES
+                self.previous = None  # Périmée : la prochaine comparaison repartira d'une nouvelle référence
+            return
+        self.full_streak = 0
+
+        screen_rects = []
+        for rect in rects:
+            self.screen.blit(surface, (rect.x + self.offset[0], rect.y + self.offset[1]), rect)
+            screen_rects.append(rect.move(self.offset))
+        pygame.display.update(screen_rects)
+        self.stats["partial"] += 1
@@ -0,0 +1,126 @@
+import csv
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import pygame
+
+# Phases de la boucle STATE_PLAY, dans l'ordre d'affichage
+PLAY_PHASES = [
+    "input", "update_player", "check_player_attack", "update_enemies",
+    "update_medicaments", "try_change_room", "player_on_portal_interact",
+    "draw", "display_flip",
+]
+
+
+class FrameProfiler:
+    """
+    Mesure le temps passé dans chaque phase d'une frame et l'affiche en surimpression.
+    Les phases appelées plusieurs fois dans une frame (pas de simulation fixes)
+    sont cumulées. Garde une fenêtre glissante pour l'affichage et un
+    historique plus long pour l'export CSV.
+    """
+    def __init__(self, phases=PLAY_PHASES, window=120, history=36000):
+        self.phases = list(phases)
+        self.enabled = False
+        self.window = deque(maxlen=window)
+        self.history = deque(maxlen=history)
+        self.current = {}
+        self.frame_start = None
+        self.frame_index = 0
+        self.font = None
+        self.panel = None
+
+    def toggle(self):
+        self.enabled = not self.enabled
+
+    def begin_frame(self):
+        self.current = dict.fromkeys(self.phases, 0.0)
+        self.frame_start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name):
+        """Chronomètre le bloc : `with profiler.phase("draw"): ...`"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self.frame_start is not None:
+                self.current[name] = self.current.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+    def end_frame(self):
+        if self.frame_start is None:
+            return
+        sample = dict(self.current)
+        sample["frame"] = (time.perf_counter() - self.frame_start) * 1000
+        self.window.append(sample)
+        self.history.append((self.frame_index, sample))
+        self.frame_index += 1
+        self.frame_start = None
+
+    def stats(self):
+        """{phase: (moyenne, pire)} en ms sur la fenêtre glissante."""
+        result = {}
+        if not self.window:
+            return result
+        for name in self.phases + ["frame"]:
+            values = [sample.get(name, 0.0) for sample in self.window]
+            result[name] = (sum(values) / len(values), max(values))
+        return result
+
+    def dump_csv(self, path=None):
+        """Écrit l'historique des mesures dans un fichier CSV et renvoie son chemin."""
+        if path is None:
+            path = time.strftime("profiler_%Y%m%d_%H%M%S.csv")
+        columns = self.phases + ["frame"]
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame_index"] + columns)
+            for index, sample in self.history:
+                writer.writerow([index] + [f"{sample.get(name, 0.0):.4f}" for name in columns])
+        return path
+
+    def draw(self, surface, x=10, y=120):
+        """Panneau : moyenne et pire temps par phase, puis courbe des temps de frame."""
+        if not self.enabled:
+            return
+        if self.font is None:
+            self.font = pygame.font.Font(None, 18)
+        line_height = 16
+        graph_height = 50
+        width = 270
+        height = (len(self.phases) + 2) * line_height + graph_height + 16
+        if self.panel is None or self.panel.get_height() != height:
+            self.panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.panel.fill((0, 0, 0, 170))
+
+        stats = self.stats()
+        header = self.font.render("phase (ms)", True, (255, 255, 0))
+        columns = self.font.render("  moy     pire", True, (255, 255, 0))
+        self.panel.blit(header, (6, 4))
+        self.panel.blit(columns, (width - columns.get_width() - 6, 4))
+        for i, name in enumerate(self.phases + ["frame"]):
+            avg, worst = stats.get(name, (0.0, 0.0))
+            color = (255, 120, 120) if name == "frame" else (255, 255, 255)
+            label = self.font.render(name, True, color)
+            values = self.font.render(f"{avg:6.2f}  {worst:6.2f}", True, color)
+            row_y = 4 + (i + 1) * line_height
+            self.panel.blit(label, (6, row_y))
+            self.panel.blit(values, (width - values.get_width() - 6, row_y))
+
+        # Courbe des temps de frame (ligne verte = budget 60 Hz)
+        graph_top = height - graph_height - 6
+        graph_width = width - 12
+        budget = 1000 / 60
+        scale = graph_height / (budget * 2)
+        budget_y = graph_top + graph_height - budget * scale
+        pygame.draw.line(self.panel, (0, 200, 0), (6, budget_y), (6 + graph_width, budget_y))
+        frames = [sample["frame"] for sample in self.window]
+        if len(frames) > 1:
+            step = graph_width / (self.window.maxlen - 1)
+            points = [
+                (6 + i * step, graph_top + graph_height - min(graph_height, value * scale))
+                for i, value in enumerate(frames)
+            ]
+            pygame.draw.lines(self.panel, (255, 120, 120), False, points)
+        surface.blit(self.panel, (x, y))
@@ -0,0 +1,43 @@
+# Calques de rendu, du fond vers le premier plan
+LAYER_TILES, LAYER_PORTAL, LAYER_ACTORS, LAYER_PICKUPS, LAYER_FOG, LAYER_HUD = range(6)
+
+
+class RenderQueue:
+    """
+    File de rendu d'une frame : chaque élément est soumis une seule fois avec
+    un calque et une clé z (ex. bas de la hitbox pour trier les personnages),
+    puis flush() dessine tout dans l'ordre. Les blits simples qui se suivent
+    sont envoyés d'un coup avec Surface.blits.
+    """
+    def __init__(self):
+        self.items = []
+
+    def blit(self, layer, image, dest, z=0, alpha=None):
+        """Blit différé. `alpha` est appliqué à l'image juste avant son blit (images partagées)."""
+        self.items.append((layer, z, len(self.items), image, dest, alpha, None))
+
+    def call(self, layer, draw, z=0):
+        """Dessin procédural différé : draw(surface) est appelé à son tour."""
+        self.items.append((layer, z, len(self.items), None, None, None, draw))
+
+    def clear(self):
+        self.items = []
+
+    def flush(self, surface):
+        """Dessine les éléments triés par (calque, z, ordre de soumission) puis vide la file."""
+        batch = []
+        for _, _, _, image, dest, alpha, draw in sorted(self.items, key=lambda item: item[:3]):
+            if draw is None and alpha is None:
+                batch.append((image, dest))
+                continue
+            if batch:
+                surface.blits(batch, doreturn=False)
+                batch = []
+            if draw is not None:
+                draw(surface)
+            else:
+                image.set_alpha(alpha)
+                surface.blit(image, dest)
+        if batch:
+            surface.blits(batch, doreturn=False)
+        self.items = []
@@ -0,0 +1,209 @@
+"""
+Enregistrement des entrées d'une partie et rejeu sans fenêtre.
+
+    python main.py --record partie.ctgr
+    python replay.py partie.ctgr [--draw] [--slowest 10]
+
+Le fichier contient la graine maîtresse (voir sim.py), les entrées de chaque
+pas de simulation (3 octets, par plages de pas identiques) et un hash de
+l'état du jeu à chaque pas. Le rejeu joue les pas aussi vite que possible,
+signale le premier pas dont l'état diverge et les pas les plus lents.
+"""
+import argparse
+import os
+import struct
+import sys
+import time
+import zlib
+from array import array
+
+if __name__ == "__main__":
+    # Pilotes SDL "dummy" (ni écran ni carte son) : avant tout import qui initialise pygame
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import sim
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, SIMULATION_HZ, COLLECT_MEDECINE
+
+# Actions de jeu lues à chaque pas, un bit chacune
+ACTIONS = ["move_up", "move_down", "move_left", "move_right", "attack", "interact"]
+ACTION_BITS = {action: 1 << i for i, action in enumerate(ACTIONS)}
+
+MAGIC = b"CTGR"
+VERSION = 1
+HEADER = struct.Struct("<4sHIHII")  # magic, version, graine, rayon de vision, plages d'entrées, pas
+INPUT_RUN = struct.Struct("<HBbb")  # répétitions, boutons, axe x, axe y
+
+
+class InputState:
+    """
+    Entrées d'un pas de simulation : actions enfoncées et axes du stick
+    (quantifiés sur un octet). Remplace la lecture directe du clavier et de
+    la manette dans la simulation, pour pouvoir être enregistré et rejoué.
+    """
+    __slots__ = ("buttons", "axis_x", "axis_y")
+
+    def __init__(self, buttons=0, axis_x=0, axis_y=0):
+        self.buttons = buttons
+        self.axis_x = axis_x
+        self.axis_y = axis_y
+
+    @classmethod
+    def capture(cls, settings, joystick=None, attack=False):
+        """Lit le clavier et la manette ; `attack` vient des événements de la frame."""
+        keys = pygame.key.get_pressed()
+        buttons = ACTION_BITS["attack"] if attack else 0
+        for action in ACTIONS:
+            if action != "attack" and any(keys[key] for key in settings.get_control(action, "keyboard")):
+                buttons |= ACTION_BITS[action]
+        axis_x = axis_y = 0
+        if joystick:
+            if any(joystick.get_button(btn) for btn in settings.get_control("interact", "gamepad")):
+                buttons |= ACTION_BITS["interact"]
+            axis_x = round(joystick.get_axis(0) * 127)
+            axis_y = round(joystick.get_axis(1) * 127)
+        return cls(buttons, axis_x, axis_y)
+
+    def pressed(self, action):
+        return bool(self.buttons & ACTION_BITS[action])
+
+    @property
+    def axes(self):
+        """Axes du stick entre -1 et 1."""
+        return self.axis_x / 127, self.axis_y / 127
+
+    def key(self):
+        return self.buttons, self.axis_x, self.axis_y
+
+
+def state_hash(game_manager):
+    """Empreinte (CRC32) de l'état qui compte pour la simulation."""
+    player = game_manager.player
+    room = game_manager.current_room
+    values = [
+        sim.ticks(), *game_manager.current_pos, *player.hitbox.topleft, player.health,
+        game_manager.hud.meds_collected,
+        game_manager.resurrected_count, len(room.enemies), len(room.medicaments),
+    ]
+    for enemy in room.enemies:
+        values.extend((*enemy.hitbox.topleft, enemy.health))
+    for med in room.medicaments:
+        values.append(med.collected)
+    return zlib.crc32(repr(values).encode())
+
+
+class Recording:
+    """Graine, entrées (par plages) et hash d'état de chaque pas d'une partie."""
+    def __init__(self, seed, vision_radius=300):
+        self.seed = seed
+        self.vision_radius = vision_radius
+        self.runs = []  # [[répétitions, boutons, axe x, axe y]]
+        self.hashes = array("I")
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def record(self, controls, state):
+        """Ajoute un pas : entrées utilisées et hash de l'état obtenu."""
+        key = controls.key()
+        if self.runs and self.runs[-1][0] < 0xFFFF and tuple(self.runs[-1][1:]) == key:
+            self.runs[-1][0] += 1
+        else:
+            self.runs.append([1, *key])
+        self.hashes.append(state)
+
+    def inputs(self):
+        for count, buttons, axis_x, axis_y in self.runs:
+            controls = InputState(buttons, axis_x, axis_y)
+            for _ in range(count):
+                yield controls
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.seed, self.vision_radius, len(self.runs), len(self.hashes)))
+            f.write(b"".join(INPUT_RUN.pack(*run) for run in self.runs))
+            hashes = array("I", self.hashes)
+            if sys.byteorder != "little":
+                hashes.byteswap()
+            f.write(hashes.tobytes())
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, seed, vision_radius, run_count, tick_count = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} : enregistrement illisible (format {magic!r} v{version})")
+        recording = cls(seed, vision_radius)
+        offset = HEADER.size
+        for _ in range(run_count):
+            recording.runs.append(list(INPUT_RUN.unpack_from(data, offset)))
+            offset += INPUT_RUN.size
+        recording.hashes.frombytes(data[offset:offset + 4 * tick_count])
+        if sys.byteorder != "little":
+            recording.hashes.byteswap()
+        return recording
+
+
+def replay(recording, draw=False):
+    """
+    Rejoue l'enregistrement sans attendre le temps réel.
+    Renvoie (premier pas divergent ou None, [durée de chaque pas en ms]).
+    """
+    from gameSettings import GameSettings
+    from game import GameManager
+
+    settings = GameSettings()
+    settings.set_vision_radius(recording.vision_radius)
+    game_manager = GameManager(settings)
+    game_manager.init_game(seed=recording.seed)
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)) if draw else None
+    quest = COLLECT_MEDECINE
+    divergence = None
+    durations = []
+    clock = time.perf_counter
+    for tick, controls in enumerate(recording.inputs()):
+        start = clock()
+        quest = game_manager.step(controls, quest)
+        if draw:
+            surface.fill((0, 0, 0))
+            game_manager.draw(surface, quest)
+        durations.append((clock() - start) * 1000)
+        if divergence is None and state_hash(game_manager) != recording.hashes[tick]:
+            divergence = tick
+    game_manager.prefetcher.shutdown()
+    return divergence, durations
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rejeu sans fenêtre d'une partie enregistrée")
+    parser.add_argument("path", help="fichier enregistré avec main.py --record")
+    parser.add_argument("--draw", action="store_true", help="inclure le rendu dans le rejeu")
+    parser.add_argument("--slowest", type=int, default=5, help="nombre de pas les plus lents à afficher")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    recording = Recording.load(args.path)
+    start = time.perf_counter()
+    divergence, durations = replay(recording, draw=args.draw)
+    elapsed = time.perf_counter() - start
+    pygame.quit()
+
+    game_time = len(recording) / SIMULATION_HZ
+    print(f"{len(recording)} pas ({game_time:.1f} s de jeu) rejoués en {elapsed:.2f} s "
+          f"(x{game_time / elapsed if elapsed else 0:.0f})")
+    if divergence is None:
+        print("état identique à l'enregistrement à chaque pas")
+    else:
+        print(f"divergence au pas {divergence} ({divergence / SIMULATION_HZ:.2f} s)")
+    for tick in sorted(range(len(durations)), key=durations.__getitem__, reverse=True)[:args.slowest]:
+        print(f"  pas {tick:>7} : {durations[tick]:.3f} ms")
+    return 1 if divergence is not None else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
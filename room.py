@@ -2,85 +2,120 @@ import os
 import pygame
 import random
 import pytmx
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, DOOR_SIZE, FONT
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, DOOR_SIZE, FONT_SIZE
 from enemy import Enemy
 from gameSettings import GameSettings
 from maploader import MapLoader
 from medicament import Medicament
+from render_queue import LAYER_TILES
+from navigation import FlowField
+from spatial_index import SpatialGrid
+import ui
+
+
+_DOOR_LENGTH = SCREEN_WIDTH // 10
+_DOOR_HEIGHT = SCREEN_HEIGHT // 7
+# Rect des portes, communs à toutes les salles (lecture seule)
+DOOR_RECTS = {
+    'up': pygame.Rect((SCREEN_WIDTH - _DOOR_LENGTH) // 2, 0, _DOOR_LENGTH, DOOR_SIZE),
+    'down': pygame.Rect((SCREEN_WIDTH - _DOOR_LENGTH) // 2, SCREEN_HEIGHT - DOOR_SIZE, _DOOR_LENGTH, DOOR_SIZE),
+    'left': pygame.Rect(0, (SCREEN_HEIGHT - _DOOR_HEIGHT) // 2, DOOR_SIZE, _DOOR_HEIGHT),
+    'right': pygame.Rect(SCREEN_WIDTH - DOOR_SIZE, (SCREEN_HEIGHT - _DOOR_HEIGHT) // 2, DOOR_SIZE, _DOOR_HEIGHT),
+}
+DOOR_ORDER = ['up', 'down', 'left', 'right']
+ENEMY_BASE_HEALTH = 2
 
 
 class Room:
-    def __init__(self, position, nb_medicaments=10, nb_ennemis=None):
+    """
+    Une salle est d'abord une fiche compacte : position, portes, fichier TMX,
+    graine et changements faits par le joueur (ennemis touchés, potions
+    ramassées). La map, les données de placement et les objets ne sont
+    construits (materialize) qu'à l'entrée ou au préchargement, puis oubliés
+    (release) ; la graine permet de les reconstruire à l'identique.
+    """
+    def __init__(self, position, nb_medicaments=10, nb_ennemis=None, seed=None):
         self.position = position
         self.doors = []
         self.total_zombies = 0
+        self.nb_medicaments = nb_medicaments
+        self.tmx_file = None
+        self.nb_enemies_in_room = nb_ennemis
+        self.potions_disabled = False #Sert à désactiver les potions quand on les supprime au passage du niveau "sauver les infectés"
+        self.seed = random.getrandbits(32) if seed is None else seed
+        # Changements à réappliquer après reconstruction
+        self.enemy_health = {}  # indice de l'ennemi -> vie, pour les ennemis touchés
+        self.collected = set()  # indices des potions ramassées
+        self.release()
+
+    def release(self):
+        """Oublie la map, les données et les objets de la salle (seule la fiche reste)."""
+        self.materialized = False
         self.enemies = []
         self.enemies_data = []  # Stocke les infos de chaque ennemi, incluant désormais "health"
-        self.nb_medicaments = nb_medicaments
         self.medicaments = []
         self.medicaments_positions = []
         self.medicaments_state = {}
         self.obstacles = []
+        self.obstacle_grid = SpatialGrid([])  # Index des obstacles, construit au chargement de la map
+        self.flow_field = None  # Directions vers le joueur pour les ennemis (None : tout droit)
         self.map_loader = MapLoader()
-        self.tmx_file = None
-        self.nb_enemies_in_room = nb_ennemis
-        self.potions_disabled = False #Sert à désactiver les potions quand on les supprime au passage du niveau "sauver les infectés"
+
+    def materialize(self, screen_width=SCREEN_WIDTH, screen_height=SCREEN_HEIGHT):
+        """Charge la map et reconstruit les données de la salle si ce n'est pas déjà fait."""
+        if self.materialized:
+            return
+        self.load_map()
+        self.generate_data(screen_width, screen_height)
+        self.materialized = True
 
     def load_map(self):
         if self.tmx_file and os.path.exists(self.tmx_file):
+            # Le template TMX est partagé : les obstacles (calque "Walls" inclus)
+            # sont extraits une seule fois par fichier
             self.map_loader.load(self.tmx_file)
             self.obstacles = self.map_loader.obstacles
-            if self.map_loader.tmx_data:
-                try:
-                    walls_layer = self.map_loader.tmx_data.get_layer_by_name("Walls")
-                    if walls_layer:
-                        for obj in walls_layer:
-                            rect = pygame.Rect(obj.x, obj.y, obj.width, obj.height)
-                            self.obstacles.append(rect)
-                except ValueError:
-                    pass
+            self.obstacle_grid = self.map_loader.obstacle_grid
+            nav_grid = self.map_loader.nav_grid
+            self.flow_field = FlowField(nav_grid) if nav_grid else None
         else:
             self.obstacles = []
+            self.obstacle_grid = SpatialGrid([])
+            self.flow_field = None
 
     def generate_walls_and_doors(self, grid, forced_doors=None):
-        self.doors.clear()
+        """Calcule les portes et le fichier TMX de la salle (la map n'est chargée qu'à materialize)."""
         r, c = self.position
-        SW, SH = SCREEN_WIDTH, SCREEN_HEIGHT
         directions = []
-        door_length = SW // 10
-        door_height = SH // 7
 
         # UP
         up_pos = (r - 1, c)
         if (up_pos in grid or (forced_doors and 'up' in forced_doors)):
             # Prevent doors from any room into (0,0)
             if up_pos != (0, 0):
-                up_rect = pygame.Rect((SW - door_length) // 2, 0, door_length, DOOR_SIZE)
-                self.doors.append(('up', up_rect))
                 directions.append('up')
         # DOWN
         down_pos = (r + 1, c)
         if (down_pos in grid or (forced_doors and 'down' in forced_doors)):
             if down_pos != (0, 0):
-                down_rect = pygame.Rect((SW - door_length) // 2, SH - DOOR_SIZE, door_length, DOOR_SIZE)
-                self.doors.append(('down', down_rect))
                 directions.append('down')
         # LEFT
         left_pos = (r, c - 1)
         if (left_pos in grid or (forced_doors and 'left' in forced_doors)):
             # allow door to (0,0) if we are in (0,1)
             if left_pos != (0, 0) or (self.position == (0, 1)):
-                left_rect = pygame.Rect(0, (SH - door_height) // 2, DOOR_SIZE, door_height)
-                self.doors.append(('left', left_rect))
                 directions.append('left')
         # RIGHT
         right_pos = (r, c + 1)
         if (right_pos in grid or (forced_doors and 'right' in forced_doors)):
             if right_pos != (0, 0):
-                right_rect = pygame.Rect(SW - DOOR_SIZE, (SH - door_height) // 2, DOOR_SIZE, door_height)
-                self.doors.append(('right', right_rect))
                 directions.append('right')
 
+        self.set_doors(directions)
+
+    def set_doors(self, directions):
+        """Installe les portes `directions` et choisit le fichier TMX correspondant."""
+        self.doors = [(d, DOOR_RECTS[d]) for d in DOOR_ORDER if d in directions]
         if directions:
             priority = ['left', 'right', 'up', 'down']
             directions_sorted = sorted(directions, key=lambda d: priority.index(d))
@@ -90,43 +125,82 @@ class Room:
                 self.tmx_file = f"maps/{'_'.join(directions_sorted)}.tmx"
         else:
             self.tmx_file = None
-        self.load_map()
+        if self.materialized:
+            self.load_map()
 
     def generate_contents(self, player, screen_width=SCREEN_WIDTH, screen_height=SCREEN_HEIGHT):
-        self.enemies.clear()
-        self.medicaments.clear()
+        self.materialize(screen_width, screen_height)
+        self.set_contents(self.build_contents(player, screen_width, screen_height))
+
+    def set_contents(self, contents):
+        """Installe des ennemis et potions déjà construits (simple échange de listes)."""
+        self.enemies, self.medicaments = contents
+
+    def generate_data(self, screen_width=SCREEN_WIDTH, screen_height=SCREEN_HEIGHT):
+        """
+        Place les ennemis et les potions à partir de la graine de la salle (même
+        résultat à chaque appel), puis réapplique les changements mémorisés.
+        """
+        rng = random.Random(self.seed)
         door_areas = [door for _, door in self.doors]
 
         # --- Génération des ennemis ---
-        if not self.enemies_data:
-            if self.nb_enemies_in_room is None:
-                self.nb_enemies_in_room = random.randint(1, 4)
-            spawn_margin = 250
-            wall_margin = 20
-            for _ in range(self.nb_enemies_in_room):
+        self.enemies_data = []
+        # Tirage toujours consommé : sinon, une fois le nombre fixé, tous les tirages
+        # suivants seraient décalés et la salle reconstruite après release() différerait
+        count = rng.randint(1, 4)
+        if self.nb_enemies_in_room is None:
+            self.nb_enemies_in_room = count
+        spawn_margin = 250
+        wall_margin = 20
+        for i in range(self.nb_enemies_in_room):
+            while True:
+                x = rng.randint(spawn_margin, screen_width - spawn_margin)
+                y = rng.randint(spawn_margin, screen_height - spawn_margin)
+                new_rect = pygame.Rect(x - 15, y - 15, 30, 30)
+                margin_rect = new_rect.inflate(wall_margin * 2, wall_margin * 2)
+                near_rect, near_margin = self.obstacle_grid.query_batch([new_rect, margin_rect])
+                collision = (any(new_rect.colliderect(obs) for obs in near_rect)
+                             or new_rect.collidelist(door_areas) != -1)
+                too_close_to_wall = any(margin_rect.colliderect(obs) for obs in near_margin)
+                if not collision and not too_close_to_wall:
+                    break
+            zombie_number = rng.randint(1, 4)
+            human_number = rng.randint(1, 3)
+            # On stocke désormais uniquement "health" au lieu de alive/resurrected
+            self.enemies_data.append({
+                "x": x,
+                "y": y,
+                "folder": f"zombies/Zombie_{zombie_number}",
+                "resurrected_sprites_folder": f"Humans/Homeless_{human_number}",
+                "health": self.enemy_health.get(i, ENEMY_BASE_HEALTH)  # 2 = vie initiale normale pour un zombie
+            })
+
+        # --- Génération des médicaments ---
+        self.medicaments_positions = []
+        self.medicaments_state = {}
+        if not self.potions_disabled:
+            for i in range(self.nb_medicaments):
                 while True:
-                    x = random.randint(spawn_margin, screen_width - spawn_margin)
-                    y = random.randint(spawn_margin, screen_height - spawn_margin)
+                    x = rng.randint(20, screen_width - 20)
+                    y = rng.randint(20, screen_height - 20)
                     new_rect = pygame.Rect(x - 15, y - 15, 30, 30)
-                    collision = any(new_rect.colliderect(obs) for obs in self.obstacles + door_areas)
-                    too_close_to_wall = any(
-                        new_rect.inflate(wall_margin * 2, wall_margin * 2).colliderect(obs)
-                        for obs in self.obstacles
-                    )
-                    if not collision and not too_close_to_wall:
+                    collision = (self.obstacle_grid.collides(new_rect)
+                                 or new_rect.collidelist(door_areas) != -1)
+                    if not collision:
                         break
-                zombie_number = random.randint(1, 4)
-                human_number = random.randint(1, 3)
-                # On stocke désormais uniquement "health" au lieu de alive/resurrected
-                self.enemies_data.append({
-                    "x": x,
-                    "y": y,
-                    "folder": f"zombies/Zombie_{zombie_number}",
-                    "resurrected_sprites_folder": f"Humans/Homeless_{human_number}",
-                    "health": 2  # vie initiale normale pour un zombie
-                })
-
-        for data in self.enemies_data:
+                self.medicaments_positions.append((x, y))
+                self.medicaments_state[(x, y)] = i in self.collected
+
+    def build_contents(self, player, screen_width=SCREEN_WIDTH, screen_height=SCREEN_HEIGHT):
+        """
+        Construit les ennemis et potions à partir des données de la salle.
+        Aucun tirage aléatoire : peut tourner dans le thread de préchargement.
+        Renvoie (ennemis, potions).
+        """
+        enemies = []
+        medicaments = []
+        for i, data in enumerate(self.enemies_data):
             enemy = Enemy(
                 data["x"], data["y"], player, screen_width, screen_height,
                 sprites_folder=data["folder"],
@@ -142,20 +216,8 @@ class Room:
                 obstacles=self.obstacles
             )
             enemy.health = data.get("health", 2)  # Réaffecter la vie depuis les données
-            self.enemies.append(enemy)
-
-        # --- Génération des médicaments ---
-        if not self.medicaments_positions and not self.potions_disabled:
-            for _ in range(self.nb_medicaments):
-                while True:
-                    x = random.randint(20, screen_width - 20)
-                    y = random.randint(20, screen_height - 20)
-                    new_rect = pygame.Rect(x - 15, y - 15, 30, 30)
-                    collision = any(new_rect.colliderect(obs) for obs in self.obstacles + door_areas)
-                    if not collision:
-                        break
-                self.medicaments_positions.append((x, y))
-                self.medicaments_state[(x, y)] = False
+            enemy.room_index = i
+            enemies.append(enemy)
 
         for pos in self.medicaments_positions:
             x, y = pos
@@ -166,18 +228,26 @@ class Room:
                 activation_distance=player.settings.vision_radius 
             )
             med.collected = self.medicaments_state[pos]
-            self.medicaments.append(med)
+            medicaments.append(med)
+        return enemies, medicaments
 
 
 
     def update_medicaments_state(self):
-        for med, pos in zip(self.medicaments, self.medicaments_positions):
+        for i, (med, pos) in enumerate(zip(self.medicaments, self.medicaments_positions)):
             self.medicaments_state[pos] = med.collected
+            if med.collected:
+                self.collected.add(i)
 
     def update_enemies_state(self):
-        """Met à jour la vie des ennemis dans enemies_data."""
-        for enemy, data in zip(self.enemies, self.enemies_data):
-            data["health"] = enemy.health  # Mettre à jour la vie uniquement
+        """Met à jour la vie des ennemis dans enemies_data et dans les changements de la salle."""
+        # Par indice d'origine : la liste des ennemis perd ses morts, enemies_data non
+        for enemy in self.enemies:
+            if enemy.room_index is None:
+                continue  # ajouté hors des données de la salle (ressuscités de la fin)
+            self.enemies_data[enemy.room_index]["health"] = enemy.health  # Mettre à jour la vie uniquement
+            if enemy.health != ENEMY_BASE_HEALTH:
+                self.enemy_health[enemy.room_index] = enemy.health
 
 
 
@@ -188,139 +258,57 @@ class Room:
         self.medicaments_state.clear()
         self.potions_disabled = True
 
-    def draw(self, surface):
-        if self.map_loader.tmx_data:
-            tmx_data = self.map_loader.tmx_data
-            for layer in tmx_data.visible_layers:
-                if hasattr(layer, 'tiles'):
-                    for x, y, gid in layer.tiles():
-                        tile = gid if isinstance(gid, pygame.Surface) else tmx_data.get_tile_image_by_gid(gid)
-                        if tile:
-                            surface.blit(tile, (x * tmx_data.tilewidth, y * tmx_data.tileheight))
-        for _, door in self.doors:
-            s = pygame.Surface((door.width, door.height), pygame.SRCALPHA)
-            s.fill((0, 0, 0, 0))  # complètement transparent
-            surface.blit(s, (door.x, door.y))
-
-        for enemy in self.enemies:
-            enemy.draw(surface)
-        for med in self.medicaments:
-            med.draw(surface)
-
-    def draw_contents(self, surface):
+    def submit(self, queue):
+        """Ajoute les tuiles, les ennemis et les potions à la file de rendu (une fois chacun)."""
+        # Les calques de tuiles sont pré-rendus une fois par map (voir MapLoader.draw)
+        queue.call(LAYER_TILES, self.map_loader.draw)
         for enemy in self.enemies:
-            enemy.draw(surface)
+            enemy.submit(queue)
         for med in self.medicaments:
-            med.draw(surface)
-
-def generate_random_grid(num_rooms=2, total_zombies=10):
-    grid = {}
-    start = (0, 0)
-
-    # Salle de départ
-    grid[start] = Room(position=start, nb_medicaments=1, nb_ennemis=0)
-    grid[start].generate_walls_and_doors(grid, forced_doors=['right'])
-
-    # Salle à droite du départ
-    enemy_room_pos = (0, 1)
-    grid[enemy_room_pos] = Room(position=enemy_room_pos, nb_medicaments=0, nb_ennemis=2)
-    grid[enemy_room_pos].generate_walls_and_doors(grid, forced_doors=['left'])
-
-    current_positions = [enemy_room_pos]
-
-    # Autres salles aléatoires
-    directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-    forbidden_positions = {(0, 0), enemy_room_pos}
-
-    for _ in range(2, num_rooms):
-        base = random.choice(current_positions)
-        r, c = base
-        possible = [(r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)]
-        random.shuffle(possible)
-        for pos in possible:
-            if pos not in grid and pos not in forbidden_positions:
-                grid[pos] = Room(
-                    position=pos,
-                    nb_medicaments=0,
-                    nb_ennemis=0
-                )
-                current_positions.append(pos)
-                break
-
-    # Salle finale
-    farthest_pos = max(grid.keys(), key=lambda pos: abs(pos[0]) + abs(pos[1]))
-    final_room = grid[farthest_pos]
-    final_room.nb_enemies_in_room = 8
-    final_room.is_final = True
-    # Génère les portes et la map pour la salle finale (portail)
-    final_room.generate_walls_and_doors(grid, forced_doors=['left'])
-
-    # --- Répartition des zombies dans les 9 salles ---
-    normal_rooms = [room for pos, room in grid.items() if pos != start and not getattr(room, "is_final", False)]
-    # Réserve 8 zombies pour la salle finale
-    zombies_left = total_zombies - 8
-
-    for room in normal_rooms:
-        room.nb_enemies_in_room = 0
-
-    while zombies_left > 0:
-        possible_rooms = [room for room in normal_rooms if room.nb_enemies_in_room < 5]
-        if not possible_rooms:
-            break  
-        room = random.choice(possible_rooms)
-        room.nb_enemies_in_room += 1
-        zombies_left -= 1
-
-    # Répartition des médicaments 
-    total_meds = total_zombies
-    all_rooms_except_start = [room for pos, room in grid.items() if pos != start]
-    for _ in range(total_meds):
-        room = random.choice(all_rooms_except_start)
-        room.nb_medicaments += 1
-
-    # Génération portes des autres salles
-    for pos, room in grid.items():
-        if not getattr(room, "is_final", False):
-            room.generate_walls_and_doors(grid)
-
-    return grid
-
-
+            med.submit(queue)
+
+
+# Noms affichés des touches dans le message du portail
+PORTAL_KEY_NAMES = {
+    pygame.K_e: "E", pygame.K_f: "F", pygame.K_r: "R", pygame.K_g: "G",
+    pygame.K_SPACE: "ESPACE", pygame.K_RETURN: "ENTRÉE",
+    pygame.K_UP: "↑", pygame.K_DOWN: "↓",
+    pygame.K_LEFT: "←", pygame.K_RIGHT: "→"
+}
+
+def get_portal(room):
+    """Portail de la salle finale (créé au premier appel)."""
+    if not hasattr(room, "portail") or room.portail is None:
+        from portail import Portail
+        room.portail = Portail(
+            SCREEN_WIDTH // 2 - 100 // 2,
+            SCREEN_HEIGHT // 2 - 100 // 2,
+            100, 100
+        )
+    return room.portail
+
+def player_on_portal(room, player, is_active=True):
+    """Même test que draw_portal_if_boss_room, sans rien dessiner."""
+    if not is_active or not getattr(room, "is_final", False):
+        return False
+    return player.hitbox.colliderect(get_portal(room).rect)
 
 def draw_portal_if_boss_room(surface, room, player, settings, is_active = True):
     if hasattr(room, "is_final") and room.is_final:
-        if not hasattr(room, "portail") or room.portail is None:
-            from portail import Portail
-            room.portail = Portail(
-                SCREEN_WIDTH // 2 - 100 // 2,
-                SCREEN_HEIGHT // 2 - 100 // 2,
-                100, 100
-            )
-        room.portail.draw(surface)
-
-        if is_active:
+        get_portal(room).draw(surface)
 
+        if is_active and player.hitbox.colliderect(room.portail.rect):
             interact_keys = settings.get_control("interact", "keyboard")
-            def key_name(key_code):
-                key_names = {
-                    pygame.K_e: "E", pygame.K_f: "F", pygame.K_r: "R", pygame.K_g: "G",
-                    pygame.K_SPACE: "ESPACE", pygame.K_RETURN: "ENTRÉE",
-                    pygame.K_UP: "↑", pygame.K_DOWN: "↓", 
-                    pygame.K_LEFT: "←", pygame.K_RIGHT: "→"
-                }
-                return key_names.get(key_code, f"KEY_{key_code}")
-            
             if interact_keys:
-                keys_text = " ou ".join([key_name(key) for key in interact_keys])
-                message = FONT.render(f"Appuyez sur {keys_text} pour rentrer", True, (255, 255, 0))
+                keys_text = " ou ".join([PORTAL_KEY_NAMES.get(key, f"KEY_{key}") for key in interact_keys])
+                message = ui.render_text(ui.default_font(FONT_SIZE), f"Appuyez sur {keys_text} pour rentrer", (255, 255, 0))
             else:
-                message = FONT.render("Appuyez sur E pour rentrer", True, (255, 255, 0))
+                message = ui.render_text(ui.default_font(FONT_SIZE), "Appuyez sur E pour rentrer", (255, 255, 0))
 
-            if player.hitbox.colliderect(room.portail.rect):
-                msg_x = SCREEN_WIDTH // 2 - message.get_width() // 2
-                msg_y = room.portail.rect.top - 30
-                surface.blit(message, (msg_x, msg_y))
-                return True
+            msg_x = SCREEN_WIDTH // 2 - message.get_width() // 2
+            msg_y = room.portail.rect.top - 30
+            surface.blit(message, (msg_x, msg_y))
+            return True
     return False
 
 def clear_all_medicaments_in_rooms(rooms):
@@ -0,0 +1,227 @@
+"""
+Sauvegarde compacte d'une partie en cours et reprise sans regénérer le donjon.
+
+Une salle se reconstruit depuis sa graine (voir Room) : la sauvegarde ne
+contient donc que la fiche de chaque salle (position, portes, graine, nombres
+d'ennemis et de potions) et les changements faits par le joueur, plus l'état
+du GameManager et du joueur. Le format est binaire et versionné :
+
+    en-tête (HEADER)
+    pour chaque salle : ROOM, puis indices (octets) et vies (octets signés)
+    des ennemis touchés, puis indices (uint16) des potions ramassées
+
+La reprise relit les salles en O(salles) ; l'écriture se fait dans un thread
+pour que l'autosauvegarde ne bloque pas une frame.
+"""
+import os
+import struct
+import sys
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+import sim
+from config import COLLECT_MEDECINE, HEAL_INFECTED
+from room import Room, DOOR_ORDER
+
+MAGIC = b"CTGS"
+VERSION = 2
+# magic, version, graine maîtresse, graine du donjon, agrandissements du donjon, temps de
+# simulation (ms), zombies, ressuscités, drapeaux, vies, potions, position du joueur (x, y),
+# salle courante (r, c), nombre de salles, indice de la salle finale
+HEADER = struct.Struct("<4sHIIHIHHBbHhhhhHH")
+# position (r, c), graine, portes, drapeaux, ennemis, potions, ennemis touchés, potions ramassées
+ROOM = struct.Struct("<hhIBBBHBH")
+NO_ROOM = 0xFFFF
+NO_COUNT = 0xFF  # nombre d'ennemis encore à tirer (None)
+
+# Drapeaux de la partie
+PORTAL_ACTIVE = 1
+FIRST_MED_TAKEN = 2
+QUEST_HEAL = 4
+# Drapeaux d'une salle
+ROOM_VISITED = 1
+ROOM_FINAL = 2
+ROOM_POTIONS_DISABLED = 4
+
+
+def _pack_array(typecode, values):
+    values = array(typecode, values)
+    if sys.byteorder != "little" and values.itemsize > 1:
+        values.byteswap()
+    return values.tobytes()
+
+
+def _unpack_array(typecode, data, offset, count):
+    values = array(typecode)
+    values.frombytes(data[offset:offset + count * values.itemsize])
+    if sys.byteorder != "little" and values.itemsize > 1:
+        values.byteswap()
+    return values, offset + count * values.itemsize
+
+
+def encode(game_manager, quest):
+    """État de la partie en octets (à appeler depuis la boucle de jeu, entre deux pas)."""
+    gm = game_manager
+    player = gm.player
+    final_room = gm.dungeon.final_room
+    flags = ((PORTAL_ACTIVE if gm.is_portal_active else 0)
+             | (FIRST_MED_TAKEN if gm.has_taken_first_med else 0)
+             | (QUEST_HEAL if quest == HEAL_INFECTED else 0))
+    chunks = [None]
+    final_index = NO_ROOM
+    for i, room in enumerate(gm.grid.values()):
+        if room is final_room:
+            final_index = i
+        room_flags = ((ROOM_VISITED if room.position in gm.visited_rooms else 0)
+                      | (ROOM_FINAL if getattr(room, "is_final", False) else 0)
+                      | (ROOM_POTIONS_DISABLED if room.potions_disabled else 0))
+        doors = 0
+        for direction, _ in room.doors:
+            doors |= 1 << DOOR_ORDER.index(direction)
+        hits = sorted(room.enemy_health.items())
+        collected = sorted(room.collected)
+        nb_enemies = NO_COUNT if room.nb_enemies_in_room is None else room.nb_enemies_in_room
+        chunks.append(ROOM.pack(*room.position, room.seed, doors, room_flags, nb_enemies,
+                                room.nb_medicaments, len(hits), len(collected)))
+        chunks.append(bytes(index for index, _ in hits))
+        chunks.append(_pack_array("b", (health for _, health in hits)))
+        chunks.append(_pack_array("H", collected))
+    chunks[0] = HEADER.pack(
+        MAGIC, VERSION, gm.seed, gm.dungeon.seed, gm.dungeon.extensions, sim.ticks(), gm.total_zombies,
+        gm.resurrected_count, flags, player.health, gm.hud.meds_collected,
+        *player.rect.center, *gm.current_pos, len(gm.grid), final_index)
+    return b"".join(chunks)
+
+
+class Snapshot:
+    """Partie relue depuis une sauvegarde : salles prêtes à l'emploi et état du GameManager."""
+    def __init__(self):
+        self.seed = 0
+        self.dungeon_seed = 0
+        self.dungeon_extensions = 0
+        self.ticks = 0
+        self.total_zombies = 0
+        self.resurrected_count = 0
+        self.is_portal_active = True
+        self.has_taken_first_med = False
+        self.quest = COLLECT_MEDECINE
+        self.player_health = 3
+        self.meds_collected = 0
+        self.player_center = (0, 0)
+        self.current_pos = (0, 0)
+        self.rooms = []
+        self.visited_rooms = set()
+        self.final_room = None
+        self.size = 0  # octets
+        self.load_ms = 0.0  # lecture et décodage
+
+    @classmethod
+    def decode(cls, data):
+        (magic, version, seed, dungeon_seed, extensions, ticks, total_zombies, resurrected, flags, health, meds,
+         px, py, r, c, room_count, final_index) = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"sauvegarde illisible (format {magic!r} v{version})")
+        snapshot = cls()
+        snapshot.seed = seed
+        snapshot.dungeon_seed = dungeon_seed
+        snapshot.dungeon_extensions = extensions
+        snapshot.ticks = ticks
+        snapshot.total_zombies = total_zombies
+        snapshot.resurrected_count = resurrected
+        snapshot.is_portal_active = bool(flags & PORTAL_ACTIVE)
+        snapshot.has_taken_first_med = bool(flags & FIRST_MED_TAKEN)
+        snapshot.quest = HEAL_INFECTED if flags & QUEST_HEAL else COLLECT_MEDECINE
+        snapshot.player_health = health
+        snapshot.meds_collected = meds
+        snapshot.player_center = (px, py)
+        snapshot.current_pos = (r, c)
+        snapshot.size = len(data)
+
+        offset = HEADER.size
+        for i in range(room_count):
+            r, c, room_seed, doors, room_flags, nb_enemies, nb_meds, hit_count, collected_count = \
+                ROOM.unpack_from(data, offset)
+            offset += ROOM.size
+            indices = data[offset:offset + hit_count]
+            healths, offset = _unpack_array("b", data, offset + hit_count, hit_count)
+            collected, offset = _unpack_array("H", data, offset, collected_count)
+
+            room = Room(position=(r, c), nb_medicaments=nb_meds,
+                        nb_ennemis=None if nb_enemies == NO_COUNT else nb_enemies, seed=room_seed)
+            room.set_doors([d for bit, d in enumerate(DOOR_ORDER) if doors & (1 << bit)])
+            room.potions_disabled = bool(room_flags & ROOM_POTIONS_DISABLED)
+            if room_flags & ROOM_FINAL:
+                room.is_final = True
+            room.enemy_health = dict(zip(indices, healths))
+            room.collected = set(collected)
+            if room_flags & ROOM_VISITED:
+                snapshot.visited_rooms.add(room.position)
+            if i == final_index:
+                snapshot.final_room = room
+            snapshot.rooms.append(room)
+        return snapshot
+
+    @classmethod
+    def load(cls, path):
+        start = time.perf_counter()
+        with open(path, "rb") as f:
+            snapshot = cls.decode(f.read())
+        snapshot.load_ms = (time.perf_counter() - start) * 1000
+        return snapshot
+
+
+class SnapshotWriter:
+    """
+    Autosauvegarde : l'encodage (O(salles), quelques centaines d'octets) se fait
+    dans la boucle de jeu, l'écriture du fichier dans un thread. Le fichier est
+    remplacé d'un coup : une sauvegarde interrompue ne corrompt pas la précédente.
+    """
+    def __init__(self):
+        self.executor = None  # Créé à la première sauvegarde
+        self.pending = None
+        self.stats = {"saves": 0, "bytes": 0, "encode_ms": 0.0, "write_ms": 0.0}
+
+    def save(self, path, game_manager, quest):
+        """Encode la partie et lance son écriture dans `path`. Renvoie la taille en octets."""
+        start = time.perf_counter()
+        data = encode(game_manager, quest)
+        self.stats["encode_ms"] = (time.perf_counter() - start) * 1000
+        self.stats["bytes"] = len(data)
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autosave")
+        self.pending = self.executor.submit(self._write, path, data)
+        return len(data)
+
+    def _write(self, path, data):
+        start = time.perf_counter()
+        tmp_path = path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print("Sauvegarde impossible :", e)
+            return
+        self.stats["saves"] += 1
+        self.stats["write_ms"] = (time.perf_counter() - start) * 1000
+
+    def wait(self):
+        """Attend la fin de l'écriture en cours."""
+        if self.pending is not None:
+            self.pending.result()
+            self.pending = None
+
+    def discard(self, path):
+        """Supprime la sauvegarde (partie terminée), après l'écriture en cours."""
+        self.wait()
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def shutdown(self):
+        self.wait()
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
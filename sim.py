@@ -0,0 +1,49 @@
+"""
+Graine maîtresse, flux aléatoires par sous-système et horloge de simulation.
+
+Tout ce qui influence la partie tire ses nombres d'un flux nommé (« dungeon »,
+« enemies », « game ») et lit le temps avec ticks() plutôt qu'avec l'horloge
+réelle : une même graine et les mêmes entrées redonnent la même partie, quel
+que soit le rythme auquel les pas sont joués (voir replay.py).
+Les effets purement visuels ont leur propre flux (« effects ») pour ne pas
+décaler les autres.
+"""
+import random
+
+_master_seed = None
+_streams = {}
+_time_ms = 0.0
+
+
+def seed_all(master_seed=None):
+    """Repart d'une graine maîtresse (tirée au hasard si None) et remet l'horloge à zéro. Renvoie la graine."""
+    global _master_seed, _time_ms
+    _master_seed = random.getrandbits(32) if master_seed is None else master_seed
+    _streams.clear()
+    _time_ms = 0.0
+    return _master_seed
+
+
+def master_seed():
+    return _master_seed
+
+
+def rng(name):
+    """Flux aléatoire du sous-système `name`, dérivé de la graine maîtresse."""
+    stream = _streams.get(name)
+    if stream is None:
+        if _master_seed is None:
+            seed_all()
+        stream = _streams[name] = random.Random(f"{_master_seed}:{name}")
+    return stream
+
+
+def ticks():
+    """Temps de simulation écoulé (ms) depuis seed_all, à utiliser à la place de pygame.time.get_ticks()."""
+    return int(_time_ms)
+
+
+def advance(ms):
+    """Fait avancer l'horloge de simulation (une fois par pas)."""
+    global _time_ms
+    _time_ms += ms
@@ -0,0 +1,65 @@
+import pygame
+
+
+class SpatialGrid:
+    """
+    Index spatial statique (grille uniforme) pour les obstacles d'une salle.
+    Construit une fois au chargement de la map : query() ne renvoie que les
+    obstacles dont les cases recouvrent le rect demandé, dans l'ordre de la
+    liste d'origine (l'ordre de résolution des collisions reste identique).
+    """
+    def __init__(self, rects, cell_size=64):
+        self.rects = list(rects)
+        self.cell_size = cell_size
+        self.cells = {}
+        for i, rect in enumerate(self.rects):
+            for cell in self._cells(rect):
+                self.cells.setdefault(cell, []).append(i)
+
+    def _cells(self, rect):
+        cs = self.cell_size
+        for cx in range(rect.left // cs, (rect.right - 1) // cs + 1):
+            for cy in range(rect.top // cs, (rect.bottom - 1) // cs + 1):
+                yield cx, cy
+
+    def query_indices(self, rect):
+        """Indices (triés) des obstacles pouvant toucher `rect`."""
+        found = set()
+        cells = self.cells
+        for cell in self._cells(pygame.Rect(rect)):
+            indices = cells.get(cell)
+            if indices:
+                found.update(indices)
+        return sorted(found)
+
+    def query(self, rect):
+        """Obstacles pouvant toucher `rect` (candidats, à confirmer par colliderect)."""
+        return [self.rects[i] for i in self.query_indices(rect)]
+
+    def query_batch(self, rects):
+        """Version groupée de query() : une liste de candidats par rect."""
+        return [self.query(rect) for rect in rects]
+
+    def sweep(self, hitbox):
+        """
+        Parcourt, dans l'ordre d'origine, les obstacles pouvant toucher `hitbox`.
+        Si `hitbox` est déplacé pendant le parcours (repoussé par un obstacle),
+        la requête est refaite pour les obstacles restants : le résultat est
+        identique à un parcours complet de la liste.
+        """
+        area = hitbox.copy()
+        indices = self.query_indices(area)
+        k = 0
+        while k < len(indices):
+            i = indices[k]
+            yield self.rects[i]
+            if area != hitbox:
+                area = hitbox.copy()
+                indices = [j for j in self.query_indices(area) if j > i]
+                k = 0
+            else:
+                k += 1
+
+    def collides(self, rect):
+        """True si `rect` touche au moins un obstacle."""
+        return any(rect.colliderect(obs) for obs in self.query(rect))
@@ -0,0 +1,107 @@
+import pygame
+import ui
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+class FadeTransition:
+    """
+    Fondu au noir sur une image figée de la scène. La scène est capturée une
+    seule fois au début ; chaque frame ne fait ensuite que deux blits sur des
+    surfaces allouées une fois pour toutes.
+    """
+    def __init__(self, duration, size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+        self.duration = duration
+        self.snapshot = pygame.Surface(size)
+        self.overlay = pygame.Surface(size)
+        self.overlay.fill((0, 0, 0))
+        self.start_time = None
+
+    @property
+    def active(self):
+        return self.start_time is not None
+
+    def start(self, now, draw_scene):
+        """Capture la scène (draw_scene(surface)) et lance le fondu."""
+        self.snapshot.fill((0, 0, 0))
+        draw_scene(self.snapshot)
+        self.start_time = now
+
+    def reset(self):
+        self.start_time = None
+
+    def draw(self, surface, now):
+        """Dessine le fondu ; renvoie True une fois la durée écoulée."""
+        elapsed = now - self.start_time
+        self.overlay.set_alpha(min(255, int(255 * (elapsed / self.duration))))
+        surface.blit(self.snapshot, (0, 0))
+        surface.blit(self.overlay, (0, 0))
+        return elapsed >= self.duration
+
+
+class EndSequence:
+    """
+    Séquence de fin (après le portail en mode soin) : rien pendant 5 s, puis
+    fondu et message de bilan pendant 5 s, puis résultat. update() est appelé
+    une fois par pas de simulation ; draw() ne fait que poser les calques.
+    """
+    MESSAGE_DELAY = 5000
+    FINISH_DELAY = 10000
+
+    def __init__(self):
+        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.overlay.fill((0, 0, 0))
+        self.overlay.set_alpha(220)
+        self.reset()
+
+    def reset(self):
+        self.start_time = None
+        self.lines = []  # [(surface, rect)] du message, rendus une fois
+        self.result = None  # None tant que la séquence n'est pas finie, sinon True (victoire) / False
+
+    @property
+    def active(self):
+        return self.start_time is not None
+
+    def start(self, now):
+        self.reset()
+        self.start_time = now
+
+    def update(self, now, saved, total):
+        """Fait avancer la séquence ; renvoie le résultat une fois terminée (sinon None)."""
+        if not self.active or self.result is not None:
+            return self.result
+        elapsed = now - self.start_time
+        if elapsed > self.MESSAGE_DELAY and not self.lines:
+            self.lines = self.build_lines(saved, total)
+        if elapsed > self.FINISH_DELAY:
+            self.result = saved == total
+        return self.result
+
+    def build_lines(self, saved, total):
+        if saved == total:
+            texts = [
+                "Félicitations !",
+                "Vous avez sauvés toutes les personnes infectées.",
+                "Vous êtes un grand médecin !"
+            ]
+        elif saved < total:
+            texts = [
+                f"{total - saved} personnes ont péri par votre faute.",
+                "Réessayez pour sauver plus de personnes."
+            ]
+        else:
+            texts = ["Réessayez pour sauver plus de personnes."]
+
+        font = ui.default_font(32)
+        lines = []
+        y = SCREEN_HEIGHT // 2 - len(texts) * 20
+        for text in texts:
+            text_surf = ui.render_text(font, text, (255, 255, 255))
+            lines.append((text_surf, text_surf.get_rect(center=(SCREEN_WIDTH // 2, y))))
+            y += 50
+        return lines
+
+    def draw(self, surface):
+        if self.lines:
+            surface.blit(self.overlay, (0, 0))
+            surface.blits(self.lines, doreturn=False)
@@ -0,0 +1,111 @@
+import os
+from collections import OrderedDict
+
+import pygame
+import asset_manager
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# Éléments d'interface construits une seule fois puis réutilisés à chaque frame
+OBRA_FONT_PATH = "assets/ObraLetra.ttf"
+# Police livrée avec pygame, chargée par son chemin : Font(None, size) la réduirait
+# (facteur 0.6875), alors qu'ainsi une taille garde le même sens qu'avec SysFont
+DEFAULT_FONT_PATH = os.path.join(os.path.dirname(pygame.__file__), pygame.font.get_default_font())
+BUTTON_BG_COLOR = (220, 220, 220, 200)
+TEXT_CACHE_SIZE = 256  # Textes rendus gardés en mémoire (les moins récemment utilisés sont évincés)
+
+_fonts = {}
+_texts = OrderedDict()
+_text_stats = {"hits": 0, "misses": 0, "evictions": 0}
+_button_backgrounds = {}
+
+
+def obra_font(size, fallback_size=None):
+    """Police du jeu (ObraLetra), ou la police par défaut si le fichier est introuvable."""
+    key = ("obra", size, fallback_size)
+    font = _fonts.get(key)
+    if font is None:
+        try:
+            font = pygame.font.Font(OBRA_FONT_PATH, size)
+        except (pygame.error, FileNotFoundError, OSError):
+            font = default_font(fallback_size or size)
+        _fonts[key] = font
+    return font
+
+
+def default_font(size):
+    """
+    Police livrée avec pygame (freesansbold, déjà grasse), créée une seule fois :
+    contrairement à SysFont, aucune recherche des polices installées sur le système.
+    """
+    key = (None, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = pygame.font.Font(DEFAULT_FONT_PATH, size)
+    return font
+
+
+def render_text(font, text, color, antialias=True):
+    """
+    Texte rendu une fois par (police, texte, couleur, anticrénelage) : il n'est
+    re-rastérisé que lorsque son contenu change. Surface partagée, ne pas la modifier.
+    """
+    key = (font, text, color, antialias)
+    surface = _texts.get(key)
+    if surface is not None:
+        _texts.move_to_end(key)
+        _text_stats["hits"] += 1
+        return surface
+    _text_stats["misses"] += 1
+    surface = _texts[key] = font.render(text, antialias, color)
+    if len(_texts) > TEXT_CACHE_SIZE:
+        _texts.popitem(last=False)
+        _text_stats["evictions"] += 1
+    return surface
+
+
+def get_text_cache_stats():
+    return dict(_text_stats, size=len(_texts), fonts=len(_fonts))
+
+
+def clear_text_cache():
+    _texts.clear()
+    for key in _text_stats:
+        _text_stats[key] = 0
+
+
+def button_background(width, height, color=BUTTON_BG_COLOR, radius=18):
+    key = (width, height, color, radius)
+    background = _button_backgrounds.get(key)
+    if background is None:
+        background = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.rect(background, color, background.get_rect(), border_radius=radius)
+        _button_backgrounds[key] = background
+    return background
+
+
+def draw_button(surface, font, text, color, center, bg_color=BUTTON_BG_COLOR, radius=18):
+    """Bouton texte sur fond arrondi, centré sur `center`. Renvoie le rect du texte."""
+    text_surface = render_text(font, text, color)
+    text_rect = text_surface.get_rect(center=center)
+    background = button_background(text_surface.get_width() + 24, text_surface.get_height() + 14, bg_color, radius)
+    surface.blit(background, (text_rect.x - 12, text_rect.y - 7))
+    surface.blit(text_surface, text_rect)
+    return text_rect
+
+
+def menu_background():
+    """Fond commun des menus (right.png à la taille de l'écran), None s'il est absent."""
+    try:
+        return asset_manager.load_image("right.png", size=(SCREEN_WIDTH, SCREEN_HEIGHT), alpha=False)
+    except (pygame.error, FileNotFoundError):
+        return None
+
+
+def title_image(path, scale=0.4):
+    """Image de titre redimensionnée une fois, None si le fichier est absent."""
+    try:
+        original = asset_manager.load_image(path)
+    except (pygame.error, FileNotFoundError):
+        return None
+    size = (int(original.get_width() * scale), int(original.get_height() * scale))
+    return asset_manager.load_image(path, size=size)
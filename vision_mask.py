@@ -0,0 +1,42 @@
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+class VisionMaskCache:
+    """
+    Masques d'obscurité pré-calculés pour le champ de vision du joueur.
+    Un masque par couple (rayon, teinte) : il fait deux fois la taille de
+    l'écran avec le dégradé au centre, ce qui permet de le composer à la
+    position du joueur en un seul blit, sans remplir ni redessiner de cercles.
+    """
+    def __init__(self):
+        self.masks = {}
+
+    def invalidate(self):
+        """Oublie les masques calculés (à appeler quand le rayon change)."""
+        self.masks.clear()
+
+    def get(self, radius, tint):
+        key = (radius, tint)
+        mask = self.masks.get(key)
+        if mask is None:
+            mask = self._build(radius, tint)
+            self.masks[key] = mask
+        return mask
+
+    def _build(self, radius, tint):
+        mask = pygame.Surface((SCREEN_WIDTH * 2, SCREEN_HEIGHT * 2), pygame.SRCALPHA)
+        mask.fill((*tint, 255))
+        center = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        for r in range(radius, 0, -2):
+            t = r / radius
+            alpha = int(255 * (1 - (1 - t) ** 3))
+            pygame.draw.circle(mask, (*tint, alpha), center, r)
+        return mask
+
+    def draw(self, surface, center, radius, tint):
+        """Assombrit `surface` partout sauf autour de `center`."""
+        mask = self.get(radius, tint)
+        center = (max(0, min(SCREEN_WIDTH, center[0])), max(0, min(SCREEN_HEIGHT, center[1])))
+        area = pygame.Rect(SCREEN_WIDTH - center[0], SCREEN_HEIGHT - center[1], SCREEN_WIDTH, SCREEN_HEIGHT)
+        surface.blit(mask, (0, 0), area)